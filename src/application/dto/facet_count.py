@@ -0,0 +1,10 @@
+from typing import Optional, Union
+
+from pydantic import BaseModel
+
+
+class FacetCount(BaseModel):
+    """Quantidade de operadoras encontradas para um valor de um campo."""
+
+    value: Optional[Union[int, str]]
+    count: int
@@ -1,7 +1,8 @@
 from datetime import date
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, create_model, field_serializer
 from pydantic.alias_generators import to_camel
 
 
@@ -36,3 +37,37 @@ class OperatorModel(BaseModel):
         "alias_generator": to_camel,
         "populate_by_name": True,
     }
+
+
+# Nome do atributo de cada campo pelo nome camelCase da resposta (ex.: corporateName -> corporate_name)
+OPERATOR_FIELD_NAMES: Dict[str, str] = {
+    field.alias or name: name for name, field in OperatorModel.model_fields.items()
+}
+
+
+class OperatorFieldset(BaseModel):
+    """Base dos modelos reduzidos: mesma configuração e serialização de OperatorModel."""
+
+    @field_serializer("registration_date", check_fields=False)
+    def serialize_date(self, dt: date) -> str:
+        return dt.isoformat() if dt else None
+
+    model_config = OperatorModel.model_config
+
+
+@lru_cache(maxsize=128)
+def operator_fieldset_model(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Modelo com apenas os campos informados (nomes camelCase, na ordem de
+    OperatorModel), para linhas projetadas com fields=.
+    """
+    names = {OPERATOR_FIELD_NAMES[field] for field in fields}
+    return create_model(
+        "OperatorFieldsetModel",
+        __base__=OperatorFieldset,
+        **{
+            name: (field.annotation, field)
+            for name, field in OperatorModel.model_fields.items()
+            if name in names
+        },
+    )
@@ -0,0 +1,20 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, SerializeAsAny
+
+from src.application.dto.facet_count import FacetCount
+
+
+class OperatorPage(BaseModel):
+    """Resultado de uma busca paginada no repositório de operadoras."""
+
+    # OperatorModel ou, com fields=, o modelo reduzido aos campos pedidos
+    operators: List[SerializeAsAny[BaseModel]]
+    # Registros da resposta (camelCase) já montados a partir das linhas, no
+    # modo de leitura core; quando presentes, substituem operators
+    records: Optional[List[Dict[str, Any]]] = None
+    total_items: Optional[int]
+    next_cursor: Optional[str] = None
+    has_next: bool = False
+    total_items_exact: bool = True
+    facets: Optional[Dict[str, List[FacetCount]]] = None
@@ -0,0 +1,72 @@
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from src.application.exception.invalid_cursor_exception import \
+    InvalidCursorException
+
+# Valor do parâmetro 'cursor' que inicia uma navegação por cursor
+FIRST_PAGE_CURSOR = "*"
+
+
+def _json_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+class PageCursor(BaseModel):
+    """
+    Posição da última linha entregue em uma navegação por cursor (keyset).
+
+    Guarda o campo e a direção de ordenação usados, o valor da chave de
+    ordenação e o id da última linha. É serializado como um token opaco
+    (JSON em base64 url-safe) devolvido ao cliente em 'nextCursor'. Na
+    ordenação por vários campos (parâmetro 'sort'), guarda a especificação
+    em 'sort' e, em 'value', a lista com o valor de cada campo.
+    """
+
+    sort_field: Optional[str] = None
+    sort_direction: str = "asc"
+    value: Any = None
+    id: int
+    sort: Optional[str] = None
+
+    def encode(self) -> str:
+        if isinstance(self.value, list):
+            value = [_json_value(item) for item in self.value]
+        else:
+            value = _json_value(self.value)
+        payload = [self.sort_field, self.sort_direction, value, self.id]
+        if self.sort:
+            payload.append(self.sort)
+        payload = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            sort_field, sort_direction, value, last_id, *sort = payload
+            if len(sort) > 1:
+                raise ValueError()
+            return cls(
+                sort_field=sort_field,
+                sort_direction=sort_direction,
+                value=value,
+                id=last_id,
+                sort=sort[0] if sort else None,
+            )
+        except (binascii.Error, UnicodeError, ValueError, TypeError, ValidationError):
+            raise InvalidCursorException()
+
+    def matches(self, sort_field: Optional[str], sort_direction: str,
+                sort: Optional[str] = None) -> bool:
+        if self.sort != sort:
+            return False
+        if self.sort_field != sort_field:
+            return False
+        return sort_field is None or self.sort_direction == sort_direction
@@ -0,0 +1,9 @@
+from src.application.exception.business_exception import BusinessException
+
+
+class DatabaseBusyException(BusinessException):
+    def __init__(self, queue_timeout: float):
+        self.queue_timeout = queue_timeout
+        super().__init__(
+            f"O banco de dados está sobrecarregado: a consulta aguardou mais de {queue_timeout * 1000:.0f} ms na fila de execução."
+        )
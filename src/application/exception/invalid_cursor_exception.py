@@ -0,0 +1,6 @@
+from src.application.exception.violation_exception import ViolationException
+
+
+class InvalidCursorException(ViolationException):
+    def __init__(self, message: str = "O parâmetro 'cursor' é inválido ou expirou."):
+        super().__init__("cursor", message)
@@ -0,0 +1,7 @@
+from src.application.exception.business_exception import BusinessException
+
+
+class OperatorNotFoundException(BusinessException):
+    def __init__(self, registry: str):
+        self.registry = registry
+        super().__init__(f"Não existe operadora com o registro ANS '{registry}'.")
@@ -0,0 +1,9 @@
+from src.application.exception.business_exception import BusinessException
+
+
+class QueryTimeoutException(BusinessException):
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(
+            f"A consulta excedeu o prazo de {timeout * 1000:.0f} ms da requisição e foi cancelada."
+        )
@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+from typing import Callable, Iterable, Iterator, List, Sequence
+
+from src.application.dto.operator_model import (OPERATOR_FIELD_NAMES,
+                                                OperatorModel)
+from src.application.service.operator_service import OperatorService
+from src.infra.database import database_executor, read_session
+from src.presentation.model.operator_export_params import OperatorExportParams
+
+# Cabeçalho do CSV: nomes camelCase dos campos, na ordem do modelo
+CSV_COLUMNS = list(OPERATOR_FIELD_NAMES)
+
+# Tipo de conteúdo e extensão do arquivo de cada formato
+EXPORT_MEDIA_TYPES = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+
+def encode_ndjson(batches: Iterable[List[OperatorModel]],
+                  fields: Sequence[str] = ()) -> Iterator[str]:
+    include = {OPERATOR_FIELD_NAMES[field] for field in fields} or None
+    for batch in batches:
+        yield "".join(
+            json.dumps(operator.model_dump(by_alias=True, include=include), ensure_ascii=False) + "\n"
+            for operator in batch
+        )
+
+
+def encode_csv(batches: Iterable[List[OperatorModel]],
+               fields: Sequence[str] = ()) -> Iterator[str]:
+    """CSV com os campos pedidos em fields= ou, sem ele, todos os campos."""
+    include = {OPERATOR_FIELD_NAMES[field] for field in fields} or None
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(fields) or CSV_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(operator.model_dump(by_alias=True, include=include) for operator in batch)
+        yield buffer.getvalue()
+
+
+EXPORT_ENCODERS = {"ndjson": encode_ndjson, "csv": encode_csv}
+
+
+class OperatorExportService:
+    """
+    Exportação completa das operadoras encontradas, gerada em lotes enquanto a
+    resposta é enviada. A sessão é aberta pelo próprio gerador e fechada ao fim
+    do envio (ou quando o cliente desiste), pois a resposta continua sendo
+    produzida depois que as dependências da rota já foram encerradas.
+    Enquanto a sessão existe, a conexão fica reservada no executor do banco.
+    """
+
+    def __init__(self, session_factory: Callable = read_session,
+                 reserve_connection: Callable = database_executor.reserve):
+        self.session_factory = session_factory
+        self.reserve_connection = reserve_connection
+
+    def stream(self, params: OperatorExportParams) -> Iterator[str]:
+        with self.reserve_connection():
+            session = self.session_factory()
+            try:
+                batches = OperatorService(session).find_all_batches(params)
+                yield from EXPORT_ENCODERS[params.format](batches, params.selected_fields)
+            finally:
+                session.close()
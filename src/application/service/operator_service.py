@@ -1,11 +1,29 @@
-import asyncio
+import re
 from functools import lru_cache
-from typing import FrozenSet, Any, Coroutine
+from typing import (FrozenSet, Any, Coroutine, Dict, List, Optional, Sequence,
+                    Set, Tuple)
 from aiocache import cached
 from sqlalchemy import Date, String
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.dto.operator_model import OPERATOR_FIELD_NAMES
+from src.application.exception.operator_not_found_exception import \
+    OperatorNotFoundException
 from src.domain.model.operator import Operator
+from src.domain.repository.async_operator_repository import \
+    AsyncOperatorRepository
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
 from src.domain.repository.operator_repository import OperatorRepository
-from src.infra.database.cache_key_manager import operator_key_builder
+from src.infra.database import (DATABASE_FETCH_MODE, SEARCH_ENGINE,
+                                SEARCH_SNAPSHOT_REFRESH_INTERVAL,
+                                database_executor)
+from src.infra.database.cache_key_manager import (operator_detail_cache_key,
+                                                  operator_detail_key_builder,
+                                                  operator_key_builder)
+from src.infra.search import operator_snapshot_store
+from src.presentation.model.operator_batch_request import OperatorBatchRequest
+from src.presentation.model.operator_batch_response import \
+    OperatorBatchResponse
 from src.presentation.model.operator_request_params import \
     OperatorRequestParams
 from src.presentation.model.pageable_response import PageableResponse
@@ -19,23 +37,87 @@ def get_allowed_order_columns(model) -> frozenset[str]:
     )
 
 
+def selected_attributes(criteria: OperatorRequestParams) -> Optional[Set[str]]:
+    """Atributos pedidos em fields= (o motor em memória guarda a operadora completa)."""
+    if not criteria.selected_fields:
+        return None
+    return {OPERATOR_FIELD_NAMES[field] for field in criteria.selected_fields}
+
+
 class OperatorService:
     _ALLOWED_ORDER_COLUMNS: FrozenSet[str] = get_allowed_order_columns(Operator)
 
     def __init__(self, session):
-        self.repository = OperatorRepository(session)
+        self.session = session
+        # Com DATABASE_DRIVER=async a rota entrega uma AsyncSession
+        if isinstance(session, AsyncSession):
+            self.repository = AsyncOperatorRepository(session, fetch_mode=DATABASE_FETCH_MODE)
+        else:
+            self.repository = OperatorRepository(session, fetch_mode=DATABASE_FETCH_MODE)
+
+    def _repository_for(self, criteria: OperatorRequestParams):
+        # Enquanto o snapshot não estiver carregado, a busca segue pelo banco
+        # (a requisição nunca o carrega: isso fica com a inicialização e a
+        # atualização em segundo plano)
+        snapshot = operator_snapshot_store.snapshot
+        if criteria.search_mode == "fuzzy" and criteria.search:
+            # Sem snapshot, não há índice de nomes e a busca recorre à substring
+            if SEARCH_ENGINE != "memory":
+                fuzzy_matcher = snapshot.fuzzy_match_ids if snapshot is not None else None
+                return type(self.repository)(
+                    self.session, fuzzy_matcher=fuzzy_matcher, fetch_mode=self.repository.fetch_mode
+                )
+
+        if (
+            SEARCH_ENGINE == "memory"
+            and snapshot is not None
+            and InMemoryOperatorRepository.supports(criteria)
+        ):
+            return InMemoryOperatorRepository(snapshot)
+        return self.repository
+
+    def _detail_repository(self):
+        snapshot = operator_snapshot_store.snapshot
+        if SEARCH_ENGINE == "memory" and snapshot is not None:
+            return InMemoryOperatorRepository(snapshot)
+        return self.repository
 
     @classmethod
     @lru_cache(maxsize=32)
     def get_allowed_columns(cls) -> frozenset[str]:
         return cls._ALLOWED_ORDER_COLUMNS
 
+    @staticmethod
+    def _uses_async_repository(repository) -> bool:
+        return isinstance(repository, AsyncOperatorRepository)
+
     def find_all(self, criteria: OperatorRequestParams) -> "PageableResponse":
-        operators, last_page = self.repository.search_operators(criteria)
-        operators_dict = [operator.model_dump(by_alias=True) for operator in operators]
-        response = PageableResponse.create(operators_dict, criteria, last_page)
+        return self.page_response(self._repository_for(criteria).search_operators(criteria), criteria)
+
+    @staticmethod
+    def page_response(page, criteria: OperatorRequestParams) -> "PageableResponse":
+        if page.records is not None:
+            operators_dict = page.records
+        else:
+            include = selected_attributes(criteria)
+            operators_dict = [
+                operator.model_dump(by_alias=True, include=include) for operator in page.operators
+            ]
+        response = PageableResponse.create(
+            operators_dict,
+            criteria,
+            page.total_items,
+            page.next_cursor,
+            has_next=page.has_next,
+            total_items_exact=page.total_items_exact,
+            facets=page.facets,
+        )
         return response
 
+    def find_all_batches(self, criteria: OperatorRequestParams):
+        """Todas as operadoras encontradas, em lotes, para a exportação."""
+        return self._repository_for(criteria).stream_operators(criteria)
+
     """
     * @Info: Método para recuperar operadoras com cache.
     *        Tempo de TTL mais longo devido ao fato de os dados não se alterarem recorrentemente.
@@ -43,11 +125,115 @@ class OperatorService:
 
     @cached(ttl=3600, key_builder=operator_key_builder)
     async def find_all_cached(self, criteria: OperatorRequestParams) -> PageableResponse | Any:
-        loop = asyncio.get_running_loop()
-        response = await loop.run_in_executor(None, self.find_all, criteria)
+        repository = self._repository_for(criteria)
+        if isinstance(repository, InMemoryOperatorRepository):
+            # Servida do snapshot: sem conexão, não ocupa vaga do executor
+            response = self.page_response(repository.search_operators(criteria), criteria)
+        elif self._uses_async_repository(repository):
+            # Driver assíncrono: a consulta é aguardada no event loop, sem thread do executor
+            page = await repository.search_operators(criteria)
+            response = self.page_response(page, criteria)
+        else:
+            response = await database_executor.run(self.find_all, criteria)
 
         # Converter para dicionário antes de armazenar no cache
         if isinstance(response, PageableResponse):
             return response.model_dump()
 
         return response
+
+    def find_by_registry(self, registry: str) -> Dict[str, Any]:
+        return self.detail_response(self._detail_repository().find_by_registry(registry), registry)
+
+    @staticmethod
+    def detail_response(operator, registry: str) -> Dict[str, Any]:
+        if operator is None:
+            raise OperatorNotFoundException(registry)
+        return operator.model_dump(by_alias=True)
+
+    """
+    * @Info: Detalhe de uma operadora, com uma entrada de cache por registro ANS.
+    *        Com o snapshot carregado, a chave muda junto com a versão dos dados;
+    *        sem ele, o TTL acompanha o intervalo de atualização do snapshot.
+    """
+
+    @cached(ttl=SEARCH_SNAPSHOT_REFRESH_INTERVAL, key_builder=operator_detail_key_builder)
+    async def find_by_registry_cached(self, registry: str) -> Dict[str, Any]:
+        if self._detail_repository() is not self.repository:
+            # Leitura direta do dicionário do snapshot, sem passar pelo executor
+            return self.find_by_registry(registry)
+        if self._uses_async_repository(self.repository):
+            return self.detail_response(await self.repository.find_by_registry(registry), registry)
+
+        return await database_executor.run(self.find_by_registry, registry)
+
+    def find_by_identifiers(self, lookup_keys: Sequence[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Resolve um lote de (tipo, valor sem máscara) em uma única consulta.
+        Retorna apenas as chaves encontradas, com o registro serializado.
+        """
+        operators = self._detail_repository().find_by_identifiers(*self.identifier_values(lookup_keys))
+        return self.records_by_identifier(lookup_keys, operators)
+
+    @staticmethod
+    def identifier_values(lookup_keys: Sequence[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        """CNPJs e registros ANS do lote, na ordem em que foram pedidos."""
+        cnpjs = [value for kind, value in lookup_keys if kind == "cnpj"]
+        registries = [value for kind, value in lookup_keys if kind == "registry"]
+        return cnpjs, registries
+
+    @staticmethod
+    def records_by_identifier(lookup_keys: Sequence[Tuple[str, str]],
+                              operators) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        found: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for operator in operators:
+            record = operator.model_dump(by_alias=True)
+            found[("registry", operator.operator_registry)] = record
+            # O CNPJ não tem restrição de unicidade: em duplicidade, vale o menor id
+            found.setdefault(("cnpj", re.sub(r"[^0-9]", "", operator.cnpj or "")), record)
+        return {key: found[key] for key in lookup_keys if key in found}
+
+    async def _fetch_identifiers(self, lookup_keys: Sequence[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        if self._uses_async_repository(self.repository):
+            operators = await self.repository.find_by_identifiers(*self.identifier_values(lookup_keys))
+            return self.records_by_identifier(lookup_keys, operators)
+
+        return await database_executor.run(self.find_by_identifiers, lookup_keys)
+
+    async def find_by_identifiers_cached(self, request: OperatorBatchRequest) -> Dict[str, Any]:
+        """
+        Consulta em lote. Os registros já em cache (mesmas entradas do
+        detalhe da operadora) são lidos com um único multi_get; apenas os
+        ausentes vão ao banco, em uma consulta, e são gravados de volta.
+        """
+        lookup_keys = request.lookup_keys
+        unique_keys = list(dict.fromkeys(lookup_keys.values()))
+
+        if self._detail_repository() is not self.repository:
+            records = self.find_by_identifiers(unique_keys)
+        else:
+            cache = OperatorService.find_by_registry_cached.cache
+            cached_records = await cache.multi_get(
+                [operator_detail_cache_key(value) for _, value in unique_keys]
+            )
+            records = {
+                key: record
+                for key, record in zip(unique_keys, cached_records)
+                if record is not None
+            }
+
+            missing = [key for key in unique_keys if key not in records]
+            if missing:
+                fetched = await self._fetch_identifiers(missing)
+                if fetched:
+                    await cache.multi_set(
+                        [(operator_detail_cache_key(value), record) for (_, value), record in fetched.items()],
+                        ttl=SEARCH_SNAPSHOT_REFRESH_INTERVAL,
+                    )
+                records.update(fetched)
+
+        data = {identifier: records.get(key) for identifier, key in lookup_keys.items()}
+        return OperatorBatchResponse(
+            data=data,
+            not_found=[identifier for identifier, record in data.items() if record is None],
+        ).model_dump(by_alias=True)
@@ -0,0 +1,30 @@
+from typing import Optional, Tuple
+
+from src.infra.search import operator_snapshot_store
+from src.presentation.model.suggestion_request_params import \
+    SuggestionRequestParams
+from src.presentation.model.suggestion_response import (Suggestion,
+                                                        SuggestionResponse)
+
+
+class SuggestionService:
+    """
+    Autocompletar de operadoras servido exclusivamente pelo snapshot em
+    memória; o banco só é lido no carregamento (na inicialização) e nas
+    atualizações em segundo plano, nunca durante a requisição.
+    """
+
+    def __init__(self, snapshot_store=operator_snapshot_store):
+        self.snapshot_store = snapshot_store
+
+    def suggest(self, params: SuggestionRequestParams) -> Tuple[SuggestionResponse, Optional[str]]:
+        """Retorna as sugestões e a versão do snapshot que as originou."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is None:
+            return SuggestionResponse(suggestions=[]), None
+
+        suggestions = [
+            Suggestion(name=name, operator_registry=registry)
+            for name, registry in snapshot.suggestion_index.suggest(params.search, params.limit)
+        ]
+        return SuggestionResponse(suggestions=suggestions), snapshot.version
@@ -3,7 +3,9 @@ from typing import Any, Dict
 from pydantic import ConfigDict
 from pydantic.alias_generators import to_camel
 from pydantic.dataclasses import dataclass
-from sqlalchemy import SMALLINT, Column, Date, Integer, String
+from sqlalchemy import (SMALLINT, Column, Date, Integer, String, Text,
+                        literal_column)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -46,3 +48,9 @@ class Operator(Base):
         return {c.key: getattr(self, c.key) for c in self.__table__.columns}
 
     model_config = {"from_attributes": True, "populate_by_name": True}
+
+
+# Colunas derivadas mantidas pelo banco (ver src/infra/database/migrations).
+# Ficam fora do mapeamento para não entrarem na serialização nem nas colunas ordenáveis.
+SEARCH_VECTOR = literal_column("cadop.cadastro_operadoras.search_vector", TSVECTOR)
+SEARCH_DOCUMENT = literal_column("cadop.cadastro_operadoras.search_document", Text)
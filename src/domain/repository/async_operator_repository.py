@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional, Sequence
+
+from src.application.dto.facet_count import FacetCount
+from src.application.dto.operator_model import OperatorModel
+from src.application.dto.operator_page import OperatorPage
+from src.domain.repository.operator_repository import OperatorRepository
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+class AsyncOperatorRepository(OperatorRepository):
+    """
+    As mesmas consultas do OperatorRepository, executadas por uma
+    AsyncSession (driver asyncpg, DATABASE_DRIVER=async). A construção das
+    instruções e a montagem da página são herdadas; apenas a execução passa
+    a ser aguardada no event loop, sem ocupar uma thread do executor durante
+    a ida ao banco. A exportação continua no caminho síncrono, com a sessão
+    própria do OperatorExportService.
+    """
+
+    async def find_by_registry(self, registry: str) -> Optional[OperatorModel]:
+        statement, values = self.registry_query(registry)
+        result = await self.session.execute(statement, values)
+        return self.to_model(result.scalars().first())
+
+    async def find_by_identifiers(self, cnpjs: Sequence[str], registries: Sequence[str]) -> List[OperatorModel]:
+        if not cnpjs and not registries:
+            return []
+        statement, values = self.identifiers_query(cnpjs, registries)
+        result = await self.session.execute(statement, values)
+        return [self.to_model(operator) for operator in result.scalars()]
+
+    async def search_facets(self, params: OperatorRequestParams) -> Dict[str, List[FacetCount]]:
+        result = await self.session.execute(self.facet_statement(params, self.fuzzy_matcher))
+        return self.facet_counts(result.all(), params.facet_fields)
+
+    async def search_operators(self, params: OperatorRequestParams) -> OperatorPage:
+        statements, values = self.page_query(params)
+        rows = (await self.session.execute(statements.page, values)).all()
+
+        counted_total = None
+        if self.requires_count(rows, params):
+            counted_total = (await self.session.execute(statements.count, values)).scalar_one()
+
+        facets = None
+        if statements.facets is not None:
+            result = await self.session.execute(statements.facets, values)
+            facets = self.facet_counts(result.all(), params.facet_fields)
+        return self.build_page(rows, params, counted_total, facets, self.fetch_mode)
@@ -0,0 +1,209 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from src.application.dto.facet_count import FacetCount
+from src.application.dto.operator_model import OperatorModel
+from src.application.dto.operator_page import OperatorPage
+from src.application.dto.page_cursor import PageCursor
+from src.domain.repository.operator_repository import (EXPORT_BATCH_SIZE,
+                                                       OperatorRepository,
+                                                       classify_search_term,
+                                                       reported_total,
+                                                       sorted_facet_counts)
+from src.infra.search.operator_snapshot import (DOCUMENT_SEPARATOR,
+                                                OperatorSnapshot)
+from src.infra.search.text_normalizer import normalize_text
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+class InMemoryOperatorRepository:
+    """
+    Implementação de busca sobre o snapshot em memória, com o mesmo contrato
+    de OperatorRepository.search_operators (busca, ordenação e paginação).
+    """
+
+    def __init__(self, snapshot: OperatorSnapshot):
+        self.snapshot = snapshot
+
+    @staticmethod
+    def supports(params: OperatorRequestParams) -> bool:
+        # A busca textual completa depende do tsvector e do ranking do Postgres
+        return params.search_mode in ("contains", "fuzzy")
+
+    def _seek(self, ordering: Sequence[int], params: OperatorRequestParams,
+              cursor: Optional[PageCursor]) -> Sequence[int]:
+        """Posiciona a ordenação logo após o cursor, como o predicado keyset do banco."""
+        if params.sort:
+            return self._seek_compound(ordering, params, cursor)
+
+        descending = bool(params.sort_field) and params.sort_direction == "desc"
+        if cursor is None:
+            return ordering[::-1] if descending else ordering
+
+        column = self.snapshot.sortable_column(params.sort_field)
+        if column is None:
+            position = bisect_right(ordering, cursor.id, key=lambda index: self.snapshot.ids[index])
+            return ordering[position:]
+
+        value = OperatorRepository.cursor_value(column, cursor.value)
+        cursor_key = self.snapshot.sort_key(column, value, cursor.id)
+        row_key = lambda index: self.snapshot.row_sort_key(column, index)
+        if descending:
+            return ordering[: bisect_left(ordering, cursor_key, key=row_key)][::-1]
+        return ordering[bisect_right(ordering, cursor_key, key=row_key) :]
+
+    def _seek_compound(self, ordering: Sequence[int], params: OperatorRequestParams,
+                       cursor: Optional[PageCursor]) -> Sequence[int]:
+        """_seek da ordenação por vários campos, cuja ordenação já está na direção pedida."""
+        if cursor is None:
+            return ordering
+
+        values = [
+            OperatorRepository.cursor_value(self.snapshot.sortable_column(field), value)
+            for (field, _), value in zip(params.sort_keys, cursor.value)
+        ]
+        cursor_key = self.snapshot.compound_sort_key(params.sort_keys, values, cursor.id)
+        row_key = lambda index: self.snapshot.row_compound_sort_key(params.sort_keys, index)
+        return ordering[bisect_right(ordering, cursor_key, key=row_key) :]
+
+    def _build_next_cursor(self, index: int, params: OperatorRequestParams) -> str:
+        values = [
+            self.snapshot.row_sort_value(self.snapshot.sortable_column(field), index)
+            for field, _ in params.sort_keys
+        ]
+        if params.sort:
+            value = values
+        else:
+            value = values[0] if values else None
+
+        return PageCursor(
+            sort_field=params.sort_field,
+            sort_direction=params.sort_direction,
+            value=value,
+            id=self.snapshot.ids[index],
+            sort=params.sort,
+        ).encode()
+
+    @staticmethod
+    def _matches_columns(operator, params: OperatorRequestParams) -> bool:
+        """Mesma semântica de OperatorRepository.apply_column_filters (nulos não casam)."""
+        if params.state and (operator.state or "").upper() != params.state:
+            return False
+        if params.city and normalize_text(operator.city) != normalize_text(params.city):
+            return False
+        if params.modality and normalize_text(operator.modality) != normalize_text(params.modality):
+            return False
+        if params.sales_region is not None and operator.sales_region != params.sales_region:
+            return False
+
+        registration_date = operator.registration_date
+        if params.registration_date_from and (
+            registration_date is None or registration_date < params.registration_date_from
+        ):
+            return False
+        if params.registration_date_to and (
+            registration_date is None or registration_date > params.registration_date_to
+        ):
+            return False
+        return True
+
+    def _facets(self, params: OperatorRequestParams, matches: Sequence[int],
+                filtered: bool) -> Dict[str, List[FacetCount]]:
+        """Contagens por valor: bitmaps pré-calculados intersectados com as linhas encontradas."""
+        match_bitmap = self.snapshot.bitmap(matches) if filtered else None
+
+        facets = {}
+        for field in params.facet_fields:
+            counts = {}
+            for value, bitmap in self.snapshot.facet_bitmaps(field).items():
+                count = (bitmap if match_bitmap is None else bitmap & match_bitmap).bit_count()
+                if count:
+                    counts[value] = count
+            facets[field] = sorted_facet_counts(counts)
+        return facets
+
+    def find_by_registry(self, registry: str) -> Optional[OperatorModel]:
+        return self.snapshot.find_by_registry(registry)
+
+    def find_by_identifiers(self, cnpjs: Sequence[str], registries: Sequence[str]) -> List[OperatorModel]:
+        return self.snapshot.find_by_identifiers(cnpjs, registries)
+
+    def _matches(self, params: OperatorRequestParams) -> Sequence[int]:
+        """
+        Posições das linhas encontradas, na ordem ascendente da ordenação
+        pedida ou, com 'sort', já na ordem pedida.
+        """
+        if params.sort:
+            ordering = self.snapshot.compound_ordering(params.sort_keys)
+        else:
+            ordering = self.snapshot.ordering(params.sort_field)
+
+        term = normalize_text(params.search)
+        typed = classify_search_term(params.search) if term else None
+        if term and params.search_mode == "fuzzy":
+            matched = set(self.snapshot.name_index.search(term))
+            matches = [index for index in ordering if index in matched]
+        elif typed is not None:
+            # CNPJ, CEP, registro ANS e UF: o campo correspondente, como no banco
+            matched = self.snapshot.typed_positions(*typed)
+            matches = [index for index in ordering if index in matched]
+        elif term:
+            documents = self.snapshot.documents
+            matches = [] if DOCUMENT_SEPARATOR in term else [
+                index for index in ordering if term in documents[index]
+            ]
+        else:
+            matches = ordering
+
+        if params.has_column_filters:
+            operators = self.snapshot.operators
+            matches = [
+                index for index in matches if self._matches_columns(operators[index], params)
+            ]
+        return matches
+
+    def stream_operators(self, params: OperatorRequestParams,
+                         batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[OperatorModel]]:
+        """Todas as operadoras encontradas, ordenadas, em lotes (exportação)."""
+        matches = self._matches(params)
+        if params.sort_field and params.sort_direction == "desc":
+            matches = matches[::-1]
+
+        operators = self.snapshot.operators
+        for start in range(0, len(matches), batch_size):
+            yield [operators[index] for index in matches[start : start + batch_size]]
+
+    def search_operators(self, params: OperatorRequestParams) -> OperatorPage:
+        term = normalize_text(params.search)
+        matches = self._matches(params)
+
+        next_cursor = None
+        if params.uses_cursor:
+            remaining = self._seek(matches, params, params.decoded_cursor())
+            page_rows = remaining[: params.page_size]
+            has_next = len(remaining) > params.page_size
+            if has_next:
+                next_cursor = self._build_next_cursor(page_rows[-1], params)
+        else:
+            if params.sort_field and params.sort_direction == "desc":
+                matches = matches[::-1]
+            start = (params.page - 1) * params.page_size
+            page_rows = matches[start : start + params.page_size]
+            has_next = len(matches) > start + params.page_size
+
+        # A contagem já está disponível, mas o total informado segue as mesmas
+        # regras do banco para que a resposta não dependa do mecanismo de busca
+        total_items, total_items_exact = reported_total(len(matches), params)
+        return OperatorPage(
+            operators=[self.snapshot.operators[index] for index in page_rows],
+            total_items=total_items,
+            next_cursor=next_cursor,
+            has_next=has_next,
+            total_items_exact=total_items_exact,
+            facets=(
+                self._facets(params, matches, bool(term) or params.has_column_filters)
+                if params.facet_fields
+                else None
+            ),
+        )
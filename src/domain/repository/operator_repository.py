@@ -1,71 +1,904 @@
-from typing import List, Optional, Tuple
+import re
+from datetime import date
+from functools import lru_cache
+from typing import (Any, Callable, Dict, Iterator, List, NamedTuple, Optional,
+                    Sequence, Tuple)
 
-from sqlalchemy import Date, String, asc, desc, or_, collate, literal, func
+from sqlalchemy import (Date, String, and_, any_, asc, bindparam, collate,
+                        desc, false, func, literal_column, or_, select,
+                        tuple_)
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from src.application.dto.operator_model import OperatorModel
-from src.domain.model.operator import Operator
+from src.application.dto.facet_count import FacetCount
+from src.application.dto.operator_model import (OperatorModel,
+                                                operator_fieldset_model)
+from src.application.dto.operator_page import OperatorPage
+from src.application.dto.page_cursor import PageCursor
+from src.application.exception.invalid_cursor_exception import \
+    InvalidCursorException
+from src.domain.model.operator import SEARCH_DOCUMENT, SEARCH_VECTOR, Operator
+from src.infra.database import statement_cache
 from src.presentation.model.operator_request_params import \
     OperatorRequestParams
 
+# Colunas de texto consideradas na busca textual livre. A coluna search_document
+# (migração 0003) guarda a concatenação normalizada destas colunas.
+SEARCHABLE_COLUMNS = tuple(
+    column
+    for column in Operator.__table__.columns
+    if column.name != "id" and isinstance(column.type, String)
+)
+
+
+# Separador entre as colunas no documento de busca
+SEARCH_DOCUMENT_SEPARATOR = "\x1f"
+
+
+def normalized(expression):
+    """lower(unaccent(expressão)) com a versão IMMUTABLE usada nos índices."""
+    return func.lower(func.cadop.immutable_unaccent(expression))
+
+
+def escape_like(term: str) -> str:
+    # Curingas digitados pelo usuário são literais; sem o escape, um '%' poderia
+    # casar atravessando as colunas do documento de busca
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Unidades federativas aceitas como atalho de busca por estado
+BRAZILIAN_STATES = frozenset({
+    "AC", "AL", "AM", "AP", "BA", "CE", "DF", "ES", "GO", "MA", "MG", "MS", "MT", "PA",
+    "PB", "PE", "PI", "PR", "RJ", "RN", "RO", "RR", "RS", "SC", "SE", "SP", "TO",
+})
+
+# Formatos de identificadores digitados com ou sem máscara
+CNPJ_PATTERN = re.compile(r"[0-9]{2}\.?[0-9]{3}\.?[0-9]{3}/?[0-9]{4}-?[0-9]{2}")
+CNPJ_ROOT_PATTERN = re.compile(r"[0-9]{2}\.[0-9]{3}\.[0-9]{3}(?:/[0-9]{4})?")
+ZIP_PATTERN = re.compile(r"[0-9]{5}-?[0-9]{3}")
+REGISTRY_PATTERN = re.compile(r"[0-9]{6}")
+
+
+def classify_search_term(search_term: str) -> Optional[Tuple[str, str]]:
+    """
+    Identifica termos com formato de CNPJ, CNPJ parcial (raiz com máscara),
+    CEP, registro ANS ou UF. Retorna (tipo, valor normalizado) ou None quando
+    o termo deve seguir para a busca textual geral.
+    """
+    term = search_term.strip()
+    digits = re.sub(r"[^0-9]", "", term)
+
+    if CNPJ_PATTERN.fullmatch(term):
+        return "cnpj", digits
+    if CNPJ_ROOT_PATTERN.fullmatch(term):
+        return "cnpj_prefix", digits
+    if ZIP_PATTERN.fullmatch(term):
+        return "zip", digits
+    if REGISTRY_PATTERN.fullmatch(term):
+        return "registry", digits
+    if term.upper() in BRAZILIAN_STATES:
+        return "state", term.upper()
+    return None
+
+
+def digits_only(expression):
+    """Remove a máscara do valor, na mesma forma dos índices da migração 0004."""
+    return func.regexp_replace(expression, r"\D", "", "g")
+
+
+def typed_search_parameters(search_term: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """(tipo, parâmetros) da busca por termo classificado, ou None"""
+    classification = classify_search_term(search_term)
+    if classification is None:
+        return None
+
+    kind, value = classification
+    # O CNPJ parcial é comparado por prefixo (LIKE 'raiz%')
+    return kind, {"search_value": f"{value}%" if kind == "cnpj_prefix" else value}
+
+
+def typed_search_predicate(search_term: str):
+    """Predicado atendido por índice B-tree para termos classificados, ou None"""
+    typed = typed_search_parameters(search_term)
+    return search_predicate(*typed) if typed is not None else None
+
+
+# Configuração textual usada na coluna search_vector
+FULLTEXT_CONFIG = literal_column("'portuguese'::regconfig")
+
+
+def fulltext_query_text(search_term: str) -> Optional[str]:
+    """
+    Texto da tsquery com busca por prefixo em cada palavra (ex.: "unimed
+    camp" -> 'unimed:* & camp:*'), ou None se o texto não contiver palavras.
+    """
+    tokens = re.findall(r"[^\W_]+", search_term.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def fulltext_tsquery(query_text: Optional[str]):
+    return func.to_tsquery(
+        FULLTEXT_CONFIG,
+        func.cadop.immutable_unaccent(bindparam("search_query", query_text, String)),
+    )
+
+
+def fulltext_query(search_term: str):
+    """Converte o texto de busca em tsquery (ver fulltext_query_text), ou None."""
+    query_text = fulltext_query_text(search_term)
+    return fulltext_tsquery(query_text) if query_text is not None else None
+
+
+def search_parameters(search_term: Optional[str], search_mode: str = "contains",
+                      fuzzy_matcher=None) -> Tuple[str, Dict[str, Any]]:
+    """
+    Forma e valores do filtro de busca, calculados sem construir o SQL:
+    "none" sem termo, "no_match" quando nada pode casar, "fulltext",
+    "fuzzy", "contains" ou o tipo do termo classificado (cnpj, zip...). Os
+    valores são os dos parâmetros nomeados usados por search_predicate, de
+    modo que requisições da mesma forma compartilham a instrução. O índice
+    de nomes da busca aproximada é consultado aqui, uma vez por requisição.
+    """
+    if not search_term:
+        return "none", {}
+
+    if search_mode == "fulltext":
+        query_text = fulltext_query_text(search_term)
+        if query_text is None:
+            return "no_match", {}
+        return "fulltext", {"search_query": query_text}
+
+    # Sem o índice de nomes, a busca aproximada recorre à busca por substring
+    if search_mode == "fuzzy" and fuzzy_matcher is not None:
+        matched_ids = list(fuzzy_matcher(search_term))
+        if not matched_ids:
+            return "no_match", {}
+        return "fuzzy", {"fuzzy_ids": matched_ids}
+
+    typed = typed_search_parameters(search_term)
+    if typed is not None:
+        return typed
+    if SEARCH_DOCUMENT_SEPARATOR in search_term:
+        return "no_match", {}
+    return "contains", {"search_pattern": f"%{escape_like(search_term)}%"}
+
+
+def search_predicate(kind: str, values: Dict[str, Any]):
+    """Predicado da forma de busca calculada por search_parameters, ou None sem busca."""
+    if kind == "none":
+        return None
+    if kind == "no_match":
+        return false()
+    if kind == "fulltext":
+        return SEARCH_VECTOR.bool_op("@@")(fulltext_tsquery(values["search_query"]))
+    if kind == "fuzzy":
+        return Operator.id.in_(bindparam("fuzzy_ids", values["fuzzy_ids"], expanding=True))
+    if kind == "contains":
+        pattern = bindparam("search_pattern", values["search_pattern"], String)
+        return SEARCH_DOCUMENT.like(normalized(pattern), escape="\\")
+
+    columns = Operator.__table__.columns
+    value = bindparam("search_value", values["search_value"], String)
+    if kind == "cnpj":
+        return digits_only(columns.cnpj) == value
+    if kind == "cnpj_prefix":
+        return digits_only(columns.cnpj).like(value)
+    if kind == "zip":
+        return digits_only(columns.zip) == value
+    if kind == "registry":
+        return columns.operatorRegistry == value
+    return func.upper(columns.state) == value
+
+
+# Filtros por campo: nome do parâmetro da consulta -> condição. As expressões
+# são as mesmas dos índices compostos da migração 0005.
+COLUMN_FILTERS = {
+    "filter_state": lambda value: func.upper(Operator.__table__.columns.state) == value,
+    "filter_city": lambda value: normalized(Operator.__table__.columns.city) == normalized(value),
+    "filter_modality": lambda value: (
+        normalized(Operator.__table__.columns.modality) == normalized(value)
+    ),
+    "filter_sales_region": lambda value: Operator.__table__.columns.salesRegion == value,
+    "filter_date_from": lambda value: Operator.__table__.columns.registrationDate >= value,
+    "filter_date_to": lambda value: Operator.__table__.columns.registrationDate <= value,
+}
+
+
+def column_filter_parameters(params: OperatorRequestParams) -> Dict[str, Any]:
+    """Valores dos filtros por campo informados, pelo nome do parâmetro."""
+    values = {
+        "filter_state": params.state or None,
+        "filter_city": params.city or None,
+        "filter_modality": params.modality or None,
+        "filter_sales_region": params.sales_region,
+        "filter_date_from": params.registration_date_from or None,
+        "filter_date_to": params.registration_date_to or None,
+    }
+    return {name: value for name, value in values.items() if value is not None}
+
+
+# Limite da contagem no modo countMode=estimate; acima dele o total é "1000+"
+COUNT_ESTIMATE_CAP = 1000
+
+
+# Linhas lidas por vez do cursor do servidor na exportação
+EXPORT_BATCH_SIZE = 1000
+
+
+def reported_total(count: Optional[int], params: OperatorRequestParams) -> Tuple[Optional[int], bool]:
+    """Aplica includeTotal e countMode à contagem, retornando (total, exato)."""
+    if not params.include_total or count is None:
+        return None, True
+    if params.count_mode == "estimate" and count > COUNT_ESTIMATE_CAP:
+        return COUNT_ESTIMATE_CAP, False
+    return count, True
+
+
+def sorted_facet_counts(counts: Dict[Any, int]) -> List[FacetCount]:
+    """Valores por quantidade decrescente e, no empate, pelo próprio valor (nulos ao final)."""
+    ordered = sorted(
+        counts.items(),
+        key=lambda item: (-item[1], item[0] is None, item[0] if item[0] is not None else ""),
+    )
+    return [FacetCount(value=value, count=count) for value, count in ordered]
+
+
+# Collation insensível a caixa e acentos da ordenação (criada na migração 0007)
+SORT_COLLATION = "pt_br_ci_ai"
+
+
+def sort_expression(column):
+    """
+    Chave de ordenação da coluna. A expressão é a mesma dos índices de
+    ordenação (migração 0009), o que permite ao ORDER BY ... LIMIT percorrer
+    o índice em vez de ordenar as linhas filtradas.
+    """
+    # Apenas colunas de texto aceitam a collation insensível a caixa e acentos
+    if isinstance(column.type, String):
+        return collate(column, SORT_COLLATION)
+    return column
+
+
+def sort_components(column) -> Tuple[Any, Any]:
+    """
+    Componentes da ordenação por uma coluna: (coluna IS NULL, chave). O
+    indicador de nulo explícito mantém os nulos ao final na ordem ascendente
+    e no início na descendente, como no ORDER BY do Postgres, e permite que
+    o predicado do cursor seja uma única comparação de tuplas, atendida pelo
+    índice ((coluna IS NULL), chave, id).
+    """
+    return column.is_(None), sort_expression(column)
+
+
+def cursor_id_parameter(cursor: PageCursor):
+    return bindparam("cursor_id", cursor.id)
+
+
+# Modos de leitura das linhas da listagem: "orm" materializa a entidade e o
+# OperatorModel; "core" lê as colunas como tuplas e monta o registro da resposta
+FETCH_ORM = "orm"
+FETCH_CORE = "core"
+
+# Campos da resposta na ordem de OperatorModel; o nome camelCase é a chave da
+# coluna correspondente em Operator (ex.: corporateName -> razao_social)
+RECORD_FIELDS: Tuple[str, ...] = tuple(
+    field.alias or name for name, field in OperatorModel.model_fields.items()
+)
+# Campos de data, serializados em ISO 8601 como em OperatorModel
+RECORD_DATE_FIELDS = frozenset(
+    key for key in RECORD_FIELDS if isinstance(Operator.__table__.columns[key].type, Date)
+)
+
+
+@lru_cache(maxsize=128)
+def record_builder(fields: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Função que monta o registro camelCase da resposta a partir da linha lida
+    no modo core (id na posição 0 e, em seguida, os campos na ordem de
+    OperatorModel, ver select_operators), com o mesmo resultado de
+    OperatorModel.model_dump(by_alias=True) sobre a entidade.
+    """
+    keys = fields or RECORD_FIELDS
+    end = len(keys) + 1
+    date_keys = tuple(key for key in keys if key in RECORD_DATE_FIELDS)
+
+    def build(row) -> Dict[str, Any]:
+        record = dict(zip(keys, row[1:end]))
+        for key in date_keys:
+            value = record[key]
+            record[key] = value.isoformat() if value else None
+        return record
+
+    return build
+
+
+class PageStatements(NamedTuple):
+    """Instruções de uma forma de listagem, executadas com os valores da requisição."""
+
+    page: Any
+    # Contagem separada, para a página além do fim (ver requires_count)
+    count: Any
+    # Contagens por valor (facets), ou None quando não pedidas
+    facets: Any
+
 
 class OperatorRepository:
-    def __init__(self, session):
+    def __init__(self, session, fuzzy_matcher: Optional[Callable[[str], Sequence[int]]] = None,
+                 fetch_mode: str = FETCH_ORM):
         self.session = session
+        # Retorna os ids que casam com a busca aproximada (índice de nomes em memória)
+        self.fuzzy_matcher = fuzzy_matcher
+        # Leitura das linhas da listagem (FETCH_ORM ou FETCH_CORE)
+        self.fetch_mode = fetch_mode
 
     @staticmethod
     def apply_search_filter(base_query, search_term: str):
-        if not search_term:
-            return base_query
-
-        search_pattern = f"%{search_term}%"
-        string_columns = [
-            column
-            for column in Operator.__table__.columns
-            if column.name != "id" and isinstance(column.type, String)
+        """
+        Procura o termo em qualquer coluna de texto através do documento de
+        busca pré-normalizado, atendido pelo índice de trigramas. Termos com
+        formato de CNPJ, CEP, registro ANS ou UF vão direto à coluna
+        correspondente, sem a varredura geral.
+        """
+        return OperatorRepository.apply_search(base_query, *search_parameters(search_term))
+
+    @staticmethod
+    def apply_fulltext_filter(statement, search_term: str):
+        return OperatorRepository.apply_search(
+            statement, *search_parameters(search_term, "fulltext")
+        )
+
+    @staticmethod
+    def apply_fuzzy_filter(statement, search_term: str, fuzzy_matcher):
+        """
+        Restringe a consulta aos ids encontrados pelo índice de nomes, para que
+        ordenação e paginação sigam o caminho normal. Sem o índice disponível,
+        recorre à busca por substring.
+        """
+        return OperatorRepository.apply_search(
+            statement, *search_parameters(search_term, "fuzzy", fuzzy_matcher)
+        )
+
+    @staticmethod
+    def apply_search(statement, kind: str, values: Dict[str, Any]):
+        predicate = search_predicate(kind, values)
+        return statement.filter(predicate) if predicate is not None else statement
+
+    @staticmethod
+    def apply_column_filters(statement, params: OperatorRequestParams):
+        """Filtros por campo (COLUMN_FILTERS), combinados (AND) com a busca textual."""
+        conditions = [
+            COLUMN_FILTERS[name](bindparam(name, value))
+            for name, value in column_filter_parameters(params).items()
         ]
+        return statement.filter(*conditions) if conditions else statement
 
-        conditions = [func.lower(func.unaccent(column)).like(
-                func.lower(func.unaccent(literal(search_pattern))))
-            for column in string_columns
-        ]   
-        return base_query.filter(or_(*conditions)) if conditions else base_query
+    @staticmethod
+    def apply_filters(statement, params: OperatorRequestParams, fuzzy_matcher=None,
+                      search: Optional[Tuple[str, Dict[str, Any]]] = None):
+        """Filtros por campo e busca; search é a forma já calculada por search_parameters."""
+        if search is None:
+            search = search_parameters(params.search, params.search_mode, fuzzy_matcher)
+        statement = OperatorRepository.apply_column_filters(statement, params)
+        return OperatorRepository.apply_search(statement, *search)
 
     @staticmethod
-    def apply_ordering(query, field: Optional[str], direction: str = "asc"):
+    def apply_relevance_ordering(statement, search_term: str):
+        query = fulltext_query(search_term)
+        if query is None:
+            return statement.order_by(asc(Operator.id))
+        return statement.order_by(
+            desc(func.ts_rank(SEARCH_VECTOR, query)), asc(Operator.id)
+        )
+
+    @staticmethod
+    def resolve_sort_column(field: Optional[str]):
         if not field:
+            return None
+
+        column = Operator.__table__.columns.get(field)
+        if column is None:
+            column = Operator.__mapper__.columns.get(field)
+        return column
+
+    @staticmethod
+    def sort_columns(sort_keys: Sequence[Tuple[str, str]]) -> List[Tuple[Any, bool]]:
+        """Pares (coluna, descendente) dos campos de ordenação."""
+        columns = []
+        for field, direction in sort_keys:
+            column = OperatorRepository.resolve_sort_column(field)
+            if column is not None:
+                columns.append((column, direction == "desc"))
+        return columns
+
+    @staticmethod
+    def cursor_value(column, value):
+        """
+        Valor da chave guardado no cursor (JSON), convertido para o tipo da
+        coluna. Um valor de outro tipo (cursor adulterado) é recusado com
+        InvalidCursorException, antes de chegar ao driver ou à ordenação em
+        memória.
+        """
+        if value is None:
+            return None
+        if isinstance(column.type, Date):
+            try:
+                return date.fromisoformat(value)
+            except (TypeError, ValueError):
+                raise InvalidCursorException()
+        if isinstance(column.type, String) and not isinstance(value, str):
+            raise InvalidCursorException()
+        if isinstance(value, (dict, list)):
+            raise InvalidCursorException()
+        return value
+
+    @staticmethod
+    def apply_sort_keys(query, sort_keys: Sequence[Tuple[str, str]]):
+        """
+        Ordena pelos campos informados e, por último, pelo id, na direção do
+        último campo, de modo que linhas com os mesmos valores fiquem sempre
+        na mesma ordem entre as páginas. Com todos os campos na mesma direção,
+        é a ordem dos índices (chave, ..., id) das migrações 0007 e 0008.
+        """
+        columns = OperatorRepository.sort_columns(sort_keys)
+        for column, descending in columns:
+            order_func = desc if descending else asc
+            query = query.order_by(*(order_func(part) for part in sort_components(column)))
+
+        descending = bool(columns) and columns[-1][1]
+        return query.order_by(desc(Operator.id) if descending else asc(Operator.id))
+
+    @staticmethod
+    def apply_ordering(query, field: Optional[str], direction: str = "asc"):
+        return OperatorRepository.apply_sort_keys(
+            query, ((field, direction),) if field else ()
+        )
+
+    @staticmethod
+    def apply_sort(statement, params: OperatorRequestParams):
+        """ORDER BY da listagem paginada por offset e da exportação."""
+        if params.orders_by_relevance:
+            return OperatorRepository.apply_relevance_ordering(statement, params.search)
+        return OperatorRepository.apply_sort_keys(statement, params.sort_keys)
+
+    @staticmethod
+    def apply_keyset(query, field: Optional[str], direction: str, cursor: Optional[PageCursor]):
+        """
+        Ordena por (nulo, chave de ordenação, id) e, havendo cursor, busca
+        apenas as linhas posteriores a ele com um predicado
+        (nulo, chave, id) > (false, valor, id), que o índice de ordenação
+        atende como limite da varredura. Nulos ficam ao final na ordem
+        ascendente e no início na descendente, como no ORDER BY do Postgres.
+        """
+        column = OperatorRepository.resolve_sort_column(field)
+        if column is None:
+            query = query.order_by(asc(Operator.id))
+            return query.filter(Operator.id > cursor_id_parameter(cursor)) if cursor else query
+
+        is_null, key = sort_components(column)
+        descending = direction == "desc"
+        query = OperatorRepository.apply_sort_keys(query, ((field, direction),))
+        if cursor is None:
             return query
 
-        if hasattr(Operator, field):
-            column = getattr(Operator, field)
-        else:
-            column = Operator.__table__.columns.get(field)
-            if column is None:
-                return query
+        cursor_id = cursor_id_parameter(cursor)
+        if cursor.value is None:
+            if descending:
+                seek = or_(
+                    and_(column.is_(None), Operator.id < cursor_id), column.isnot(None)
+                )
+            else:
+                seek = and_(column.is_(None), Operator.id > cursor_id)
+            return query.filter(seek)
 
-        order_func = desc if direction == "desc" else asc
-        return query.order_by(order_func(collate(column, "pt_br_ci_ai")))
+        value = OperatorRepository.cursor_value(column, cursor.value)
+        row = tuple_(is_null, key, Operator.id)
+        position = tuple_(false(), bindparam("cursor_value", value, type_=column.type), cursor_id)
+        # Na ordem ascendente, (true, ...) > (false, ...) inclui as linhas nulas do final
+        return query.filter(row < position if descending else row > position)
 
     @staticmethod
-    def paginate(query, page: int, page_size: int):
-        return query.offset((page - 1) * page_size).limit(page_size)
+    def apply_compound_keyset(query, sort_keys: Sequence[Tuple[str, str]],
+                              cursor: Optional[PageCursor]):
+        """
+        Keyset da ordenação por vários campos (parâmetro 'sort'). Como as
+        direções podem ser mistas, a comparação de tuplas dá lugar à expansão
+        lexicográfica: a linha vem depois do cursor se vem depois no primeiro
+        campo, ou empata nele e vem depois no segundo, e assim por diante até
+        o id. Nulos seguem a mesma regra de apply_keyset.
+        """
+        query = OperatorRepository.apply_sort_keys(query, sort_keys)
+        if cursor is None:
+            return query
 
-    def search_operators(
-        self, params: OperatorRequestParams
-    ) -> Tuple[List[OperatorModel], int]:
-        query = self.session.query(Operator)
-        filtered_query = self.apply_search_filter(query, params.search)
+        columns = OperatorRepository.sort_columns(sort_keys)
+        branches, ties = [], []
+        for index, ((column, descending), value) in enumerate(zip(columns, cursor.value)):
+            key = sort_expression(column)
+            value = OperatorRepository.cursor_value(column, value)
+            if value is None:
+                # Nulos ficam ao final na ordem ascendente: nada vem depois deles
+                after = column.isnot(None) if descending else None
+                tie = column.is_(None)
+            else:
+                position = bindparam(f"cursor_value_{index}", value, type_=column.type)
+                after = key < position if descending else or_(key > position, column.is_(None))
+                tie = key == position
+            if after is not None:
+                branches.append(and_(*ties, after))
+            ties.append(tie)
 
-        total_items = filtered_query.count()
-        total_pages = max(1, (total_items + params.page_size - 1) // params.page_size)
+        cursor_id = cursor_id_parameter(cursor)
+        id_seek = Operator.id < cursor_id if columns[-1][1] else Operator.id > cursor_id
+        branches.append(and_(*ties, id_seek))
+        return query.filter(or_(*branches))
 
-        ordered_query = self.apply_ordering(
-            filtered_query, params.sort_field, params.sort_direction
+    @staticmethod
+    def select_operators(params: OperatorRequestParams, fetch_mode: str = FETCH_ORM):
+        """
+        SELECT da listagem: a entidade completa ou, com fields= (ou no modo
+        core), as colunas dos campos da resposta, além do id e das colunas
+        de ordenação usados pelo cursor. As colunas projetadas recebem o
+        nome do atributo (snake_case), de modo que a linha é lida como a
+        entidade.
+        """
+        if not params.selected_fields and fetch_mode != FETCH_CORE:
+            return select(Operator)
+
+        columns = Operator.__table__.columns
+        keys = ["id", *(params.selected_fields or RECORD_FIELDS)]
+        for sort_column, _ in OperatorRepository.sort_columns(params.sort_keys):
+            if sort_column.key not in keys:
+                keys.append(sort_column.key)
+        return select(
+            *(
+                columns[key].label(Operator.__mapper__.get_property_by_column(columns[key]).key)
+                for key in keys
+            )
         )
-        paginated_query = self.paginate(ordered_query, params.page, params.page_size)
 
-        operators = [
-            OperatorModel.model_validate(operator, from_attributes=True)
-            for operator in paginated_query.all()
+    @staticmethod
+    def to_models(rows, params: OperatorRequestParams) -> List[OperatorModel]:
+        """Linhas da listagem (entidades ou colunas projetadas) no modelo de resposta."""
+        if not params.selected_fields:
+            return [OperatorModel.model_validate(row, from_attributes=True) for row in rows]
+
+        model = operator_fieldset_model(params.selected_fields)
+        return [model.model_validate(row, from_attributes=True) for row in rows]
+
+    @staticmethod
+    def paginate(query, page: int, page_size: int):
+        return query.offset(bindparam("page_offset", (page - 1) * page_size)).limit(
+            bindparam("page_limit", page_size)
+        )
+
+    @staticmethod
+    def build_next_cursor(operator, params: OperatorRequestParams) -> str:
+        values = [
+            getattr(operator, Operator.__mapper__.get_property_by_column(column).key)
+            for column, _ in OperatorRepository.sort_columns(params.sort_keys)
         ]
+        if params.sort:
+            value = values
+        else:
+            value = values[0] if values else None
+
+        return PageCursor(
+            sort_field=params.sort_field,
+            sort_direction=params.sort_direction,
+            value=value,
+            id=operator.id,
+            sort=params.sort,
+        ).encode()
+
+    @staticmethod
+    def count_statement(filtered_statement, count_mode: str = "exact"):
+        if count_mode == "estimate":
+            # Conta no máximo uma linha além do limite: basta para informar "1000+"
+            filtered_statement = filtered_statement.limit(COUNT_ESTIMATE_CAP + 1)
+        return select(func.count()).select_from(filtered_statement.subquery())
+
+    @staticmethod
+    def facet_statement(params: OperatorRequestParams, fuzzy_matcher=None, search=None):
+        """
+        Conta as linhas filtradas por valor de cada campo pedido em uma única
+        consulta com GROUPING SETS. GROUPING() identifica a qual campo cada
+        linha do resultado se refere, distinguindo-a de um valor nulo.
+        """
+        columns = [Operator.__table__.columns[field] for field in params.facet_fields]
+        statement = select(
+            *columns,
+            func.grouping(*columns).label("facet_grouping"),
+            func.count().label("facet_count"),
+        )
+        statement = OperatorRepository.apply_filters(statement, params, fuzzy_matcher, search)
+        return statement.group_by(func.grouping_sets(*(tuple_(column) for column in columns)))
+
+    @staticmethod
+    def registry_statement(registry: str):
+        """Sondagem no índice único de registro ANS (migração 0006)"""
+        return select(Operator).where(
+            Operator.__table__.columns.operatorRegistry == bindparam("registry", registry, String)
+        )
+
+    @staticmethod
+    def to_model(operator) -> Optional[OperatorModel]:
+        if operator is None:
+            return None
+        return OperatorModel.model_validate(operator, from_attributes=True)
+
+    def registry_query(self, registry: str) -> Tuple[Any, Dict[str, Any]]:
+        statement = statement_cache.get(("registry",), lambda: self.registry_statement(registry))
+        return statement, {"registry": registry}
+
+    def find_by_registry(self, registry: str) -> Optional[OperatorModel]:
+        statement, values = self.registry_query(registry)
+        return self.to_model(self.session.execute(statement, values).scalars().first())
+
+    @staticmethod
+    def identifiers_statement(cnpjs: Sequence[str], registries: Sequence[str]):
+        """
+        Busca um lote de CNPJs (sem máscara) e registros ANS em uma única
+        consulta, com um parâmetro de array por coluna (= ANY). Cada predicado
+        é atendido pelo índice B-tree correspondente (migrações 0004 e 0006).
+        """
+        columns = Operator.__table__.columns
+        conditions = []
+        if registries:
+            conditions.append(
+                columns.operatorRegistry
+                == any_(bindparam("registries", list(registries), ARRAY(String)))
+            )
+        if cnpjs:
+            conditions.append(
+                digits_only(columns.cnpj) == any_(bindparam("cnpjs", list(cnpjs), ARRAY(String)))
+            )
+        return select(Operator).where(or_(false(), *conditions)).order_by(asc(Operator.id))
+
+    def identifiers_query(self, cnpjs: Sequence[str],
+                          registries: Sequence[str]) -> Tuple[Any, Dict[str, Any]]:
+        statement = statement_cache.get(
+            ("identifiers", bool(cnpjs), bool(registries)),
+            lambda: self.identifiers_statement(cnpjs, registries),
+        )
+        values = {"cnpjs": list(cnpjs), "registries": list(registries)}
+        return statement, {name: value for name, value in values.items() if value}
+
+    def find_by_identifiers(self, cnpjs: Sequence[str], registries: Sequence[str]) -> List[OperatorModel]:
+        if not cnpjs and not registries:
+            return []
+        statement, values = self.identifiers_query(cnpjs, registries)
+        operators = self.session.execute(statement, values).scalars()
+        return [self.to_model(operator) for operator in operators]
+
+    def search_facets(self, params: OperatorRequestParams) -> Dict[str, List[FacetCount]]:
+        rows = self.session.execute(self.facet_statement(params, self.fuzzy_matcher)).all()
+        return self.facet_counts(rows, params.facet_fields)
+
+    @staticmethod
+    def facet_counts(rows, fields: Sequence[str]) -> Dict[str, List[FacetCount]]:
+        """Contagens por campo a partir das linhas da consulta com GROUPING SETS."""
+        counts: Dict[str, Dict[Any, int]] = {field: {} for field in fields}
+        for row in rows:
+            for position, field in enumerate(fields):
+                # O bit da coluna fica em 1 quando ela está fora do agrupamento da linha
+                if not row.facet_grouping & (1 << (len(fields) - 1 - position)):
+                    counts[field][row[position]] = row.facet_count
+        return {field: sorted_facet_counts(values) for field, values in counts.items()}
+
+    def stream_operators(self, params: OperatorRequestParams,
+                         batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[OperatorModel]]:
+        """
+        Todas as operadoras encontradas, com a mesma busca e ordenação da
+        listagem (desempate pelo id), em lotes. yield_per lê as linhas por um
+        cursor do servidor, de modo que a memória usada não depende do tamanho
+        do resultado.
+        """
+        statement = self.apply_filters(
+            self.select_operators(params), params, self.fuzzy_matcher
+        )
+        statement = self.apply_sort(statement, params)
+
+        result = self.session.execute(statement.execution_options(yield_per=batch_size))
+        if not params.selected_fields:
+            result = result.scalars()
+        for partition in result.partitions():
+            yield self.to_models(partition, params)
+            # As linhas já serializadas não precisam ficar no mapa de identidade
+            self.session.expunge_all()
+
+    def page_statements(self, params: OperatorRequestParams,
+                        search: Optional[Tuple[str, Dict[str, Any]]] = None) -> PageStatements:
+        """
+        Consulta da página, contagem separada (quando a página não traz
+        linhas) e facets. Com fields=, apenas as colunas pedidas são lidas
+        (ver select_operators). No modo offset com contagem exata, o total
+        vem de count(*) OVER (), calculado sobre as linhas filtradas antes do
+        LIMIT. No modo cursor (o predicado keyset também restringiria a
+        janela) e na contagem estimada, o total vem de uma subconsulta escalar
+        sobre o mesmo filtro. Com includeTotal=false nada é contado; em todos
+        os modos uma linha além da página indica se existe próxima página.
+        """
+        if search is None:
+            search = search_parameters(params.search, params.search_mode, self.fuzzy_matcher)
+        filtered_statement = self.apply_filters(
+            self.select_operators(params, self.fetch_mode), params, search=search
+        )
+
+        total_items_column = None
+        if params.include_total:
+            if params.uses_cursor or params.count_mode == "estimate":
+                total_items_column = self.count_statement(
+                    filtered_statement, params.count_mode
+                ).scalar_subquery()
+            else:
+                total_items_column = func.count().over()
+
+        if params.uses_cursor and params.sort:
+            statement = self.apply_compound_keyset(
+                filtered_statement, params.sort_keys, params.decoded_cursor()
+            )
+        elif params.uses_cursor:
+            statement = self.apply_keyset(
+                filtered_statement,
+                params.sort_field,
+                params.sort_direction,
+                params.decoded_cursor(),
+            )
+        else:
+            statement = self.paginate(
+                self.apply_sort(filtered_statement, params), params.page, params.page_size
+            )
+        # Uma linha a mais indica se existe próxima página
+        statement = statement.limit(bindparam("page_limit", params.page_size + 1))
+
+        if total_items_column is not None:
+            statement = statement.add_columns(total_items_column.label("total_items"))
+
+        facets = None
+        if params.facet_fields:
+            facets = self.facet_statement(params, search=search)
+        return PageStatements(
+            page=statement,
+            count=self.count_statement(filtered_statement, params.count_mode),
+            facets=facets,
+        )
+
+    @staticmethod
+    def keyset_parameters(params: OperatorRequestParams) -> Dict[str, Any]:
+        """Valores do cursor usados por apply_keyset e apply_compound_keyset."""
+        cursor = params.decoded_cursor() if params.uses_cursor else None
+        if cursor is None:
+            return {}
+
+        values: Dict[str, Any] = {"cursor_id": cursor.id}
+        if params.sort:
+            columns = OperatorRepository.sort_columns(params.sort_keys)
+            for index, ((column, _), value) in enumerate(zip(columns, cursor.value)):
+                if value is not None:
+                    values[f"cursor_value_{index}"] = OperatorRepository.cursor_value(column, value)
+            return values
+
+        column = OperatorRepository.resolve_sort_column(params.sort_field)
+        if column is not None and cursor.value is not None:
+            values["cursor_value"] = OperatorRepository.cursor_value(column, cursor.value)
+        return values
+
+    @staticmethod
+    def page_parameters(params: OperatorRequestParams,
+                        search: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Valores dos parâmetros nomeados das instruções de page_statements."""
+        values = {
+            **search[1],
+            **column_filter_parameters(params),
+            **OperatorRepository.keyset_parameters(params),
+            "page_limit": params.page_size + 1,
+        }
+        if not params.uses_cursor:
+            values["page_offset"] = (params.page - 1) * params.page_size
+        return values
+
+    @staticmethod
+    def page_shape(params: OperatorRequestParams, search_kind: str,
+                   values: Dict[str, Any], fetch_mode: str = FETCH_ORM) -> Tuple:
+        """
+        Chave da forma da listagem no cache de instruções: tudo o que muda o
+        SQL gerado. Os nomes dos parâmetros presentes identificam os filtros
+        informados e, no cursor, quais chaves são nulas.
+        """
+        return (
+            "page",
+            fetch_mode,
+            search_kind,
+            params.selected_fields,
+            params.sort_keys,
+            bool(params.sort),
+            params.orders_by_relevance,
+            params.uses_cursor,
+            params.include_total,
+            params.count_mode,
+            params.facet_fields,
+            frozenset(values),
+        )
+
+    def page_query(self, params: OperatorRequestParams) -> Tuple[PageStatements, Dict[str, Any]]:
+        """Instruções da forma da listagem (do cache) e os valores da requisição."""
+        search = search_parameters(params.search, params.search_mode, self.fuzzy_matcher)
+        values = self.page_parameters(params, search)
+        statements = statement_cache.get(
+            self.page_shape(params, search[0], values, self.fetch_mode),
+            lambda: self.page_statements(params, search),
+        )
+        return statements, values
+
+    @staticmethod
+    def requires_count(rows, params: OperatorRequestParams) -> bool:
+        """Página além do fim: nenhuma linha para carregar o total."""
+        return (
+            params.include_total and not rows and (params.page != 1 or params.uses_cursor)
+        )
+
+    @staticmethod
+    def build_page(rows, params: OperatorRequestParams, counted_total: Optional[int] = None,
+                   facets: Optional[Dict[str, List[FacetCount]]] = None,
+                   fetch_mode: str = FETCH_ORM) -> OperatorPage:
+        """
+        Página a partir das linhas lidas e, se houve, da contagem separada.
+        No modo core, os registros da resposta saem direto das tuplas
+        (record_builder), sem entidade nem OperatorModel.
+        """
+        if not params.include_total:
+            total_items = None
+        elif rows:
+            total_items = rows[0].total_items
+        else:
+            total_items = counted_total or 0
+        total_items, total_items_exact = reported_total(total_items, params)
+
+        page_rows = rows[: params.page_size]
+        if params.selected_fields or fetch_mode == FETCH_CORE:
+            operators = page_rows
+        else:
+            operators = [row[0] for row in page_rows]
+        has_next = len(rows) > params.page_size
+
+        next_cursor = None
+        if params.uses_cursor and has_next:
+            next_cursor = OperatorRepository.build_next_cursor(operators[-1], params)
+
+        models, records = [], None
+        if fetch_mode == FETCH_CORE:
+            build_record = record_builder(params.selected_fields)
+            records = [build_record(row) for row in page_rows]
+        else:
+            models = OperatorRepository.to_models(operators, params)
+
+        return OperatorPage(
+            operators=models,
+            records=records,
+            total_items=total_items,
+            next_cursor=next_cursor,
+            has_next=has_next,
+            total_items_exact=total_items_exact,
+            facets=facets,
+        )
+
+    def search_operators(self, params: OperatorRequestParams) -> OperatorPage:
+        """
+        Busca a página e o total de itens em uma única consulta (ver
+        page_statements). As contagens por valor (facets), quando pedidas,
+        vêm de uma segunda consulta agrupada.
+        """
+        statements, values = self.page_query(params)
+        rows = self.session.execute(statements.page, values).all()
+
+        counted_total = None
+        if self.requires_count(rows, params):
+            counted_total = self.session.execute(statements.count, values).scalar_one()
 
-        return operators, total_pages
+        facets = None
+        if statements.facets is not None:
+            facets = self.facet_counts(
+                self.session.execute(statements.facets, values).all(), params.facet_fields
+            )
+        return self.build_page(rows, params, counted_total, facets, self.fetch_mode)
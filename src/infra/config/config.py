@@ -4,9 +4,14 @@ from fastapi import FastAPI
 from limits.storage import MemoryStorage, RedisStorage
 
 from src.infra.config.swagger_config import configure_swagger
-from src.infra.database import get_redis_connection
+from src.infra.database import (REQUEST_DEADLINE_MS, SEARCH_ENGINE,
+                                async_engine, dispose_async_engine,
+                                get_redis_connection, replica_router)
 from src.infra.middleware.cors_middleware import setup_cors
 from src.infra.middleware.rate_limit_middleware import RateLimitMiddleware
+from src.infra.middleware.request_deadline_middleware import \
+    RequestDeadlineMiddleware
+from src.infra.search import operator_snapshot_store
 from src.presentation.exception.exception_handlers import \
     register_exception_handlers
 
@@ -54,6 +59,23 @@ def setup_application(app: FastAPI) -> FastAPI:
         RateLimitMiddleware, limit=rate_limit, window=rate_window, storage=storage
     )
 
+    # Prazo das consultas e cancelamento quando o cliente desconecta
+    app.add_middleware(RequestDeadlineMiddleware, timeout_ms=REQUEST_DEADLINE_MS)
+
+    # Carregar o snapshot em memória e mantê-lo atualizado em segundo plano:
+    # o autocompletar (e o motor em memória, quando habilitado) só o lê
+    app.add_event_handler("startup", operator_snapshot_store.start)
+    app.add_event_handler("shutdown", operator_snapshot_store.stop)
+
+    # Verificar as réplicas de leitura em segundo plano, quando configuradas
+    if replica_router.replicas:
+        app.add_event_handler("startup", replica_router.start)
+        app.add_event_handler("shutdown", replica_router.stop)
+
+    # Fechar as conexões dos motores assíncronos, quando habilitados
+    if async_engine is not None:
+        app.add_event_handler("shutdown", dispose_async_engine)
+
     # Configurar Swagger
     configure_swagger(app)
 
@@ -6,9 +6,18 @@ from fastapi import FastAPI
 from src.application.dto.operator_model import OperatorModel
 from src.presentation.exception.api_error import ApiError, Violation
 from src.presentation.exception.api_error_type import ApiErrorType
+from src.presentation.model.operator_batch_request import \
+    BATCH_MAX_IDENTIFIERS
+from src.presentation.model.operator_batch_response import \
+    OperatorBatchResponse
+from src.presentation.model.operator_export_params import \
+    OperatorExportParams
 from src.presentation.model.operator_request_params import \
     OperatorRequestParams
 from src.presentation.model.pageable_response import PageableResponse
+from src.presentation.model.suggestion_request_params import \
+    SuggestionRequestParams
+from src.presentation.model.suggestion_response import SuggestionResponse
 
 
 def get_swagger_title() -> str:
@@ -234,7 +243,7 @@ def get_operator_request_params_schema() -> Dict[str, Any]:
         "properties": {
             "search": {
                 "type": "string",
-                "description": "Texto livre para busca entre os campos da operadora. Mínimo de 2 caracteres quando fornecido, permitindo busca por siglas de estados (UF).",
+                "description": "Texto livre para busca entre os campos da operadora. Mínimo de 2 caracteres quando fornecido. CNPJ, raiz do CNPJ com máscara, CEP, registro ANS (6 dígitos) e siglas de estados (UF) são buscados diretamente no campo correspondente.",
                 "maxLength": 100,
             },
             "page": {
@@ -261,6 +270,7 @@ def get_operator_request_params_schema() -> Dict[str, Any]:
                     "city",
                     "state",
                     "registrationDate",
+                    "relevance",
                 ],
             },
             "sortDirection": {
@@ -269,6 +279,73 @@ def get_operator_request_params_schema() -> Dict[str, Any]:
                 "description": "Direção da ordenação: 'asc' (ascendente, A-Z, 0-9) ou 'desc' (descendente, Z-A, 9-0).",
                 "default": "asc",
             },
+            "sort": {
+                "type": "string",
+                "description": "Ordenação por até 3 campos, separados por vírgula; o prefixo '-' indica ordem descendente. Alternativa a sortField/sortDirection. O id é sempre o último critério de desempate.",
+                "maxLength": 200,
+                "example": "state,-corporateName",
+            },
+            "searchMode": {
+                "type": "string",
+                "enum": ["contains", "fulltext", "fuzzy"],
+                "description": "Modo de busca: 'contains' procura o texto em qualquer posição; 'fulltext' busca palavras em português com ranking de relevância (sortField=relevance); 'fuzzy' busca nos nomes tolerando erros de digitação (ex.: 'unimde', 'amill').",
+                "default": "contains",
+            },
+            "cursor": {
+                "type": "string",
+                "description": "Paginação por cursor (keyset). Use '*' para a primeira página e, em seguida, o valor de 'nextCursor' da resposta anterior. Quando informado, 'page' é ignorado.",
+                "maxLength": 512,
+            },
+            "includeTotal": {
+                "type": "boolean",
+                "description": "Quando 'false', o total de itens não é calculado e a resposta informa apenas 'hasNext'.",
+                "default": True,
+            },
+            "facets": {
+                "type": "string",
+                "description": "Campos, separados por vírgula, com contagem de operadoras por valor na resposta: state, modality, salesRegion.",
+                "example": "state,modality",
+            },
+            "fields": {
+                "type": "string",
+                "description": "Campos da resposta, separados por vírgula (ex.: corporateName,state). Apenas as colunas correspondentes são lidas do banco; sem o parâmetro, todos os campos são retornados.",
+                "maxLength": 400,
+                "example": "corporateName,state",
+            },
+            "state": {
+                "type": "string",
+                "description": "Filtra pela sigla do estado (UF).",
+                "example": "SP",
+            },
+            "city": {
+                "type": "string",
+                "description": "Filtra pela cidade, sem diferenciar maiúsculas, minúsculas e acentos.",
+            },
+            "modality": {
+                "type": "string",
+                "description": "Filtra pela modalidade, sem diferenciar maiúsculas, minúsculas e acentos.",
+                "example": "Medicina de Grupo",
+            },
+            "salesRegion": {
+                "type": "integer",
+                "description": "Filtra pela região de comercialização.",
+            },
+            "registrationDateFrom": {
+                "type": "string",
+                "format": "date",
+                "description": "Filtra operadoras registradas na ANS a partir desta data (inclusive).",
+            },
+            "registrationDateTo": {
+                "type": "string",
+                "format": "date",
+                "description": "Filtra operadoras registradas na ANS até esta data (inclusive).",
+            },
+            "countMode": {
+                "type": "string",
+                "enum": ["exact", "estimate"],
+                "description": "Modo de contagem: 'exact' conta todos os itens; 'estimate' limita a contagem a 1000 e informa '1000+' (totalItemsExact=false, totalPages nulo) acima disso.",
+                "default": "exact",
+            },
         },
     }
 
@@ -312,6 +389,8 @@ def get_pageable_response_schema() -> Dict[str, Any]:
                     "pageSize": 10,
                     "totalPages": 1,
                     "totalItems": 1,
+                    "totalItemsExact": True,
+                    "hasNext": False,
                     "search": "exemplo",
                     "sortField": "corporateName",
                     "sortDirection": "asc",
@@ -451,6 +530,37 @@ def get_error_response_schema_for_rate_limit() -> Dict[str, Any]:
     return schema
 
 
+def get_error_response_schema_for_database_busy() -> Dict[str, Any]:
+    """
+    Retorna o esquema de resposta para consultas recusadas por excederem o
+    tempo de espera na fila do executor do banco (503 Service Unavailable)
+    """
+    schema = get_error_response_schema(
+        503,
+        ApiErrorType.SERVICE_UNAVAILABLE,
+        "O banco de dados está sobrecarregado: a consulta aguardou mais de 2000 ms na fila de execução.",
+    )
+    schema["headers"] = {
+        "Retry-After": {
+            "description": "Segundos sugeridos antes de uma nova tentativa",
+            "schema": {"type": "integer"},
+        },
+    }
+    return schema
+
+
+def get_error_response_schema_for_request_timeout() -> Dict[str, Any]:
+    """
+    Retorna o esquema de resposta para consultas canceladas por excederem o
+    prazo da requisição (504 Gateway Timeout)
+    """
+    return get_error_response_schema(
+        504,
+        ApiErrorType.REQUEST_TIMEOUT,
+        "A consulta excedeu o prazo de 10000 ms da requisição e foi cancelada.",
+    )
+
+
 def get_common_error_responses() -> Dict[int, Dict[str, Any]]:
     """
     Retorna um conjunto de respostas de erro comuns para uso em todos os endpoints.
@@ -476,6 +586,8 @@ def get_common_error_responses() -> Dict[int, Dict[str, Any]]:
         500: get_error_response_schema(
             500, ApiErrorType.SYSTEM_ERROR, "Erro interno do servidor"
         ),
+        503: get_error_response_schema_for_database_busy(),
+        504: get_error_response_schema_for_request_timeout(),
     }
     return responses
 
@@ -527,6 +639,7 @@ def get_operators_endpoint_description() -> str:
     
     Os resultados podem ser ordenados pelos campos acima e também por:
     - Data de registro (registrationDate)
+    - Relevância (relevance), na busca textual completa (searchMode=fulltext)
     
     Os resultados são retornados em formato paginado.
     
@@ -534,6 +647,158 @@ def get_operators_endpoint_description() -> str:
     """
 
 
+def get_swagger_responses_for_suggest() -> Dict[int, Dict[str, Any]]:
+    responses = get_common_error_responses()
+    responses.pop(429, None)
+    responses.pop(503, None)
+    responses.pop(504, None)
+    responses[200] = {
+        "description": "Sugestões de operadoras",
+        "headers": {
+            "Cache-Control": {
+                "description": "Permite cache público por 5 minutos",
+                "schema": {"type": "string"},
+            },
+            "ETag": {
+                "description": "Versão do snapshot que originou as sugestões",
+                "schema": {"type": "string"},
+            },
+        },
+        "content": {
+            "application/json": {
+                "schema": {"$ref": "#/components/schemas/SuggestionResponse"},
+                "example": {
+                    "suggestions": [
+                        {"name": "UNIMED CAMPINAS", "operatorRegistry": "335690"},
+                    ]
+                },
+            }
+        },
+    }
+    responses[304] = {"description": "Sugestões inalteradas desde o ETag informado"}
+    return responses
+
+
+def get_swagger_responses_for_operator_detail() -> Dict[int, Dict[str, Any]]:
+    responses = get_common_error_responses()
+    responses.pop(400, None)
+    responses[200] = {
+        "description": "Operadora encontrada",
+        "headers": {
+            "ETag": {
+                "description": "Versão do registro; envie em If-None-Match para receber 304",
+                "schema": {"type": "string"},
+            },
+        },
+        "content": {
+            "application/json": {
+                "schema": {"$ref": "#/components/schemas/OperatorModel"},
+            }
+        },
+    }
+    responses[304] = {"description": "Operadora inalterada desde o ETag informado"}
+    responses[404] = get_error_response_schema(
+        404,
+        ApiErrorType.RESOURCE_NOT_FOUND,
+        "Não existe operadora com o registro ANS '123456'.",
+    )
+    return responses
+
+
+def get_operator_detail_endpoint_description() -> str:
+    return """
+    Retorna uma única operadora pelo registro ANS (6 dígitos), com uma consulta
+    ao índice único do registro, sem busca textual nem contagem.
+
+    Cada operadora tem sua própria entrada de cache e um ETag derivado do
+    conteúdo do registro; envie o ETag em If-None-Match para receber 304 quando
+    os dados não mudaram.
+    """
+
+
+def get_swagger_responses_for_operator_batch() -> Dict[int, Dict[str, Any]]:
+    responses = get_common_error_responses()
+    responses.pop(400, None)
+    responses.pop(404, None)
+    responses[200] = {
+        "description": "Operadoras indexadas pelo identificador enviado",
+        "content": {
+            "application/json": {
+                "schema": {"$ref": "#/components/schemas/OperatorBatchResponse"},
+                "example": {
+                    "data": {
+                        "335690": {"operatorRegistry": "335690", "corporateName": "UNIMED CAMPINAS"},
+                        "000000": None,
+                    },
+                    "notFound": ["000000"],
+                },
+            }
+        },
+    }
+    return responses
+
+
+def get_operator_batch_endpoint_description() -> str:
+    return f"""
+    Consulta em lote: recebe até {BATCH_MAX_IDENTIFIERS} CNPJs (com ou sem máscara) e/ou
+    registros ANS e retorna as operadoras indexadas pelo identificador exatamente
+    como foi enviado (null quando não existe).
+
+    Os registros já em cache são lidos de uma vez; os demais são resolvidos com
+    uma única consulta ao banco. Destinado a integrações servidor a servidor
+    (a política de CORS do navegador permite apenas GET).
+    """
+
+
+def get_swagger_responses_for_operator_export() -> Dict[int, Dict[str, Any]]:
+    responses = get_common_error_responses()
+    responses.pop(404, None)
+    responses.pop(503, None)
+    responses.pop(504, None)
+    responses[200] = {
+        "description": "Arquivo com todas as operadoras encontradas",
+        "headers": {
+            "Content-Disposition": {
+                "description": "Nome sugerido para o arquivo (operadoras.ndjson ou operadoras.csv)",
+                "schema": {"type": "string"},
+            },
+        },
+        "content": {
+            "application/x-ndjson": {
+                "example": '{"operatorRegistry": "335690", "corporateName": "UNIMED CAMPINAS", ...}\n'
+            },
+            "text/csv": {
+                "example": "operatorRegistry,cnpj,corporateName,...\n335690,...\n"
+            },
+        },
+    }
+    return responses
+
+
+def get_operator_export_endpoint_description() -> str:
+    return """
+    Exporta todas as operadoras encontradas em uma única requisição, em NDJSON
+    (um objeto por linha) ou CSV. Aceita os mesmos parâmetros de busca, filtros
+    e ordenação de `/api/v1/operators`; os parâmetros de paginação são ignorados.
+
+    As linhas são lidas do banco por um cursor do servidor e enviadas à medida
+    que são lidas, com uso de memória constante independentemente do tamanho
+    do resultado.
+    """
+
+
+def get_suggest_endpoint_description() -> str:
+    return """
+    Autocompletar de operadoras: retorna os nomes (razão social ou nome fantasia)
+    e registros ANS que começam com o texto informado, sem acentos e sem
+    diferenciar maiúsculas de minúsculas.
+
+    As sugestões vêm de um índice em memória, sem consulta ao banco, e podem
+    ser armazenadas em cache (Cache-Control e ETag). Este endpoint não está
+    sujeito ao limite de taxa.
+    """
+
+
 def get_cache_test_endpoint_description() -> str:
     return "Endpoint para teste do sistema de cache Redis"
 
@@ -542,11 +807,20 @@ def get_operators_endpoint_docstring() -> str:
     return """
     Busca operadoras de planos de saúde.
     
-    - **search**: Texto para busca em diversos campos (mínimo 2 caracteres)
+    - **search**: Texto para busca em diversos campos (mínimo 2 caracteres); CNPJ, CEP, registro ANS e UF são buscados no campo correspondente
     - **page**: Número da página (começando em 1)
     - **pageSize**: Quantidade de itens por página (entre 1 e 100)
     - **sortField**: Campo para ordenação dos resultados
     - **sortDirection**: Direção da ordenação ("asc" ou "desc")
+    - **sort**: Ordenação por até 3 campos (ex.: "state,-corporateName"), alternativa a sortField/sortDirection
+    - **searchMode**: Modo de busca ("contains", "fulltext" com ranking de relevância, ou "fuzzy" tolerante a erros de digitação nos nomes)
+    - **cursor**: Paginação por cursor ("*" para iniciar, depois o "nextCursor" recebido)
+    - **includeTotal**: Calcula o total de itens (padrão true); com false, use "hasNext"
+    - **countMode**: Contagem exata ("exact") ou limitada a 1000 itens ("estimate")
+    - **facets**: Contagens por valor dos campos informados (ex.: "state,modality,salesRegion")
+    - **fields**: Campos da resposta (ex.: "corporateName,state"); apenas essas colunas são lidas do banco
+    - **state**, **city**, **modality**, **salesRegion**: Filtros por campo, combinados com a busca textual
+    - **registrationDateFrom**, **registrationDateTo**: Intervalo da data de registro na ANS
     """
 
 
@@ -571,6 +845,39 @@ ENDPOINT_CONFIG = {
         "response_model": PageableResponse,
         "request_params_model": OperatorRequestParams,
     },
+    "operator_detail": {
+        "tag": "Operadoras",
+        "summary": "Detalhar operadora",
+        "description": get_operator_detail_endpoint_description(),
+        "response_description": "Operadora encontrada",
+        "responses": get_swagger_responses_for_operator_detail(),
+        "response_model": OperatorModel,
+    },
+    "operator_export": {
+        "tag": "Operadoras",
+        "summary": "Exportar operadoras",
+        "description": get_operator_export_endpoint_description(),
+        "response_description": "Arquivo NDJSON ou CSV",
+        "responses": get_swagger_responses_for_operator_export(),
+        "request_params_model": OperatorExportParams,
+    },
+    "operator_batch": {
+        "tag": "Operadoras",
+        "summary": "Consultar operadoras em lote",
+        "description": get_operator_batch_endpoint_description(),
+        "response_description": "Operadoras indexadas pelo identificador",
+        "responses": get_swagger_responses_for_operator_batch(),
+        "response_model": OperatorBatchResponse,
+    },
+    "suggest": {
+        "tag": "Operadoras",
+        "summary": "Sugerir operadoras",
+        "description": get_suggest_endpoint_description(),
+        "response_description": "Sugestões de operadoras",
+        "responses": get_swagger_responses_for_suggest(),
+        "response_model": SuggestionResponse,
+        "request_params_model": SuggestionRequestParams,
+    },
     "cache_test": {
         "tag": "Desenvolvimento",
         "summary": "Testar cache",
@@ -589,7 +896,37 @@ ENDPOINT_CONFIG = {
                 "description": "API is healthy",
                 "content": {
                     "application/json": {
-                        "example": {"status": "ok"}
+                        "example": {
+                            "status": "ok",
+                            "databaseExecutor": {
+                                "workers": 30,
+                                "limit": 30,
+                                "active": 4,
+                                "reserved": 1,
+                                "queued": 0,
+                                "completed": 1520,
+                                "rejected": 0,
+                                "queueTimeoutMs": 2000,
+                                "lastWaitMs": 0.004,
+                                "averageWaitMs": 0.35,
+                                "maxWaitMs": 41.2,
+                            },
+                            "databaseReplicas": {
+                                "configured": 2,
+                                "healthy": 1,
+                                "replicas": [
+                                    {"healthy": True, "checkedOut": 3},
+                                    {"healthy": False, "checkedOut": 0},
+                                ],
+                            },
+                            "statementCache": {
+                                "size": 14,
+                                "maxSize": 512,
+                                "hits": 1506,
+                                "misses": 14,
+                                "hitRatio": 0.9908,
+                            },
+                        }
                     }
                 }
             }
@@ -641,6 +978,9 @@ def configure_swagger(app: FastAPI) -> None:
         openapi_schema["components"]["schemas"][
             "OperatorRequestParams"
         ] = OperatorRequestParams.model_json_schema()
+        openapi_schema["components"]["schemas"][
+            "OperatorBatchResponse"
+        ] = OperatorBatchResponse.model_json_schema()
         openapi_schema["components"]["schemas"][
             "ApiError"
         ] = ApiError.model_json_schema()
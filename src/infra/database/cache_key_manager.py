@@ -1,3 +1,4 @@
+from src.infra.search import operator_snapshot_store
 from src.presentation.model.operator_request_params import \
     OperatorRequestParams
 
@@ -28,3 +29,23 @@ def operator_key_builder(func, *args, **kwargs):
         criteria_json = criteria.json()
 
     return f"operator_search:{criteria_json}"
+
+
+def operator_detail_cache_key(identifier: str) -> str:
+    """
+    Chave de cache de uma única operadora, pelo registro ANS (6 dígitos) ou
+    pelo CNPJ sem máscara (14 dígitos). A chave inclui a versão do snapshot,
+    quando carregado: dados alterados geram chaves novas e as entradas
+    antigas deixam de ser lidas.
+    """
+    version = operator_snapshot_store.version
+    return f"operator_detail:{version[:20] if version else 'database'}:{identifier}"
+
+
+def operator_detail_key_builder(func, *args, **kwargs):
+    """Chave para o detalhe da operadora: args[1] é o registro ANS."""
+
+    if len(args) < 2:
+        raise ValueError("Erro ao gerar key do cache: argumentos insuficientes.")
+
+    return operator_detail_cache_key(args[1])
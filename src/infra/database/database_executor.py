@@ -0,0 +1,177 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+from src.application.exception.database_busy_exception import \
+    DatabaseBusyException
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseExecutor:
+    """
+    Executor dedicado às consultas síncronas do repositório. O número de
+    threads acompanha o pool do SQLAlchemy (pool_size + max_overflow), de modo
+    que cada tarefa em execução tem uma conexão disponível e a fila fica
+    visível aqui, e não escondida na espera por conexão do pool ou no executor
+    padrão compartilhado com o restante da aplicação.
+
+    Quando todas as threads estão ocupadas, a requisição aguarda a sua vez no
+    event loop, em ordem de chegada, por no máximo queue_timeout segundos;
+    passado esse limite, DatabaseBusyException (503) é lançada sem que a
+    consulta chegue ao banco.
+
+    Com capacity, as tarefas admitidas ao mesmo tempo ficam limitadas também
+    às conexões que os pools em uso podem abrir naquele momento (ex.: com
+    réplicas fora da distribuição, os pools das restantes ou o do primário),
+    de modo que a fila continua aqui e não na espera por conexão.
+
+    O trabalho que usa os mesmos pools fora do executor (o fluxo da
+    exportação, a carga do snapshot em memória) reserva uma conexão com
+    reserve() enquanto a mantém, e o executor admite uma tarefa a menos.
+    """
+
+    def __init__(self, max_workers: int, queue_timeout: float, name: str = "database",
+                 capacity: Optional[Callable[[], int]] = None):
+        self.max_workers = max_workers
+        self.queue_timeout = queue_timeout
+        self._capacity = capacity
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._active = 0
+        self._reserved = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_count = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa func(*args) em uma thread do executor, respeitando a fila."""
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        await self._acquire(loop)
+        self._record_wait(time.perf_counter() - queued_at)
+        # A thread herda o contexto da requisição (o prazo das consultas)
+        context = contextvars.copy_context()
+        try:
+            future = self._pool.submit(context.run, func, *args)
+        except BaseException:
+            self._release(completed=False)
+            raise
+        # A vaga é liberada quando a thread termina, mesmo que a requisição
+        # tenha sido cancelada antes: a consulta ocupa a conexão até que o
+        # cancelamento do prazo da requisição a interrompa no servidor
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future, loop=loop)
+
+    async def _acquire(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            if self._active < self.limit() and not self._waiters:
+                self._active += 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+
+        try:
+            # shield: o limite de espera não cancela a vaga já concedida
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+                    if isinstance(exc, asyncio.TimeoutError):
+                        self._rejected += 1
+            if not queued:
+                # A vaga foi concedida junto com o limite (ou o cancelamento)
+                if isinstance(exc, asyncio.TimeoutError):
+                    return
+                self._release(completed=False)
+                raise
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            logger.warning(
+                f"Fila do executor do banco excedeu {self.queue_timeout * 1000:.0f} ms "
+                f"({self._active} em execução, {len(self._waiters)} aguardando)"
+            )
+            raise DatabaseBusyException(self.queue_timeout) from None
+
+    def limit(self) -> int:
+        """
+        Tarefas admitidas ao mesmo tempo: as threads, limitadas à capacidade
+        atual dos pools, menos as conexões reservadas fora do executor.
+        """
+        capacity = self.max_workers
+        if self._capacity is not None:
+            capacity = min(capacity, self._capacity())
+        return capacity - self._reserved
+
+    @contextmanager
+    def reserve(self) -> Iterator[None]:
+        """
+        Conta uma conexão dos pools usada fora do executor enquanto o bloco
+        executa. Não passa pela fila: quem reserva aguarda a conexão no pool,
+        e as tarefas do executor deixam de disputá-la.
+        """
+        with self._lock:
+            self._reserved += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved -= 1
+                self._admit_waiters()
+
+    def _release(self, completed: bool = True) -> None:
+        with self._lock:
+            self._completed += completed
+            self._active -= 1
+            self._admit_waiters()
+
+    def _admit_waiters(self) -> None:
+        # Chamado com o lock: as vagas livres passam às requisições da fila,
+        # em ordem de chegada, enquanto houver capacidade
+        limit = self.limit()
+        while self._waiters and self._active < limit:
+            waiter = self._waiters.popleft()
+            self._active += 1
+            waiter.get_loop().call_soon_threadsafe(_grant, waiter)
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._wait_count += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._last_wait = wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Ocupação do executor e tempos de espera na fila (ms)."""
+        with self._lock:
+            average = self._total_wait / self._wait_count if self._wait_count else 0.0
+            return {
+                "workers": self.max_workers,
+                "limit": self.limit(),
+                "active": self._active,
+                "reserved": self._reserved,
+                "queued": len(self._waiters),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "queueTimeoutMs": round(self.queue_timeout * 1000),
+                "lastWaitMs": round(self._last_wait * 1000, 3),
+                "averageWaitMs": round(average * 1000, 3),
+                "maxWaitMs": round(self._max_wait * 1000, 3),
+            }
+
+
+def _grant(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,87 @@
+-- Busca textual livre indexável: LIKE '%termo%' sobre lower(unaccent(coluna))
+-- só pode ser atendido por índices GIN de trigramas.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- unaccent() é STABLE e não pode ser usada em índices de expressão.
+-- Fixando o dicionário, o resultado depende apenas da entrada.
+CREATE OR REPLACE FUNCTION cadop.immutable_unaccent(value text)
+    RETURNS text
+    LANGUAGE sql
+    IMMUTABLE PARALLEL SAFE STRICT
+AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, value)
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_registro_operadora_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(registro_operadora)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cnpj_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(cnpj)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_razao_social_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(razao_social)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_nome_fantasia_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(nome_fantasia)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_modalidade_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(modalidade)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_logradouro_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(logradouro)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_numero_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(numero)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_complemento_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(complemento)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_bairro_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(bairro)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cidade_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(cidade)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_uf_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(uf)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cep_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(cep)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_ddd_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(ddd)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_telefone_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(telefone)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_fax_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(fax)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_endereco_eletronico_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(endereco_eletronico)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_representante_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(representante)) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cargo_representante_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (lower(cadop.immutable_unaccent(cargo_representante)) gin_trgm_ops);
@@ -0,0 +1,19 @@
+-- Busca textual completa em português com ranking de relevância.
+-- Os pesos priorizam razão social e nome fantasia (A), depois cidade e UF (B)
+-- e por fim modalidade e bairro (C). Registro ANS e CNPJ entram sem stemming (D).
+
+ALTER TABLE cadop.cadastro_operadoras
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', cadop.immutable_unaccent(coalesce(razao_social, ''))), 'A') ||
+        setweight(to_tsvector('portuguese', cadop.immutable_unaccent(coalesce(nome_fantasia, ''))), 'A') ||
+        setweight(to_tsvector('portuguese', cadop.immutable_unaccent(coalesce(cidade, ''))), 'B') ||
+        setweight(to_tsvector('simple', coalesce(uf, '')), 'B') ||
+        setweight(to_tsvector('portuguese', cadop.immutable_unaccent(coalesce(modalidade, ''))), 'C') ||
+        setweight(to_tsvector('portuguese', cadop.immutable_unaccent(coalesce(bairro, ''))), 'C') ||
+        setweight(to_tsvector('simple', coalesce(registro_operadora, '') || ' ' || coalesce(cnpj, '')), 'D')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_search_vector
+    ON cadop.cadastro_operadoras
+    USING gin (search_vector);
@@ -0,0 +1,54 @@
+-- Documento de busca pré-normalizado: concatenação de lower(unaccent()) das
+-- colunas de texto pesquisáveis, separadas por U+001F. Como o separador não
+-- aparece em termos de busca, LIKE '%termo%' sobre o documento equivale ao OR
+-- de LIKE sobre cada coluna, mas normaliza as colunas uma única vez na escrita
+-- e é atendido por um único índice de trigramas.
+
+ALTER TABLE cadop.cadastro_operadoras
+    ADD COLUMN IF NOT EXISTS search_document text
+    GENERATED ALWAYS AS (
+        lower(cadop.immutable_unaccent(
+            coalesce(registro_operadora, '') || E'\x1f' ||
+            coalesce(cnpj, '') || E'\x1f' ||
+            coalesce(razao_social, '') || E'\x1f' ||
+            coalesce(nome_fantasia, '') || E'\x1f' ||
+            coalesce(modalidade, '') || E'\x1f' ||
+            coalesce(logradouro, '') || E'\x1f' ||
+            coalesce(numero, '') || E'\x1f' ||
+            coalesce(complemento, '') || E'\x1f' ||
+            coalesce(bairro, '') || E'\x1f' ||
+            coalesce(cidade, '') || E'\x1f' ||
+            coalesce(uf, '') || E'\x1f' ||
+            coalesce(cep, '') || E'\x1f' ||
+            coalesce(ddd, '') || E'\x1f' ||
+            coalesce(telefone, '') || E'\x1f' ||
+            coalesce(fax, '') || E'\x1f' ||
+            coalesce(endereco_eletronico, '') || E'\x1f' ||
+            coalesce(representante, '') || E'\x1f' ||
+            coalesce(cargo_representante, '')
+        ))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_search_document_trgm
+    ON cadop.cadastro_operadoras
+    USING gin (search_document gin_trgm_ops);
+
+-- Os índices por coluna da migração 0001 deixam de ser usados pela busca
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_registro_operadora_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_cnpj_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_razao_social_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_nome_fantasia_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_modalidade_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_logradouro_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_numero_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_complemento_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_bairro_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_cidade_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_uf_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_cep_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_ddd_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_telefone_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_fax_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_endereco_eletronico_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_representante_trgm;
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_cargo_representante_trgm;
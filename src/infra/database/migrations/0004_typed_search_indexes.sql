@@ -0,0 +1,20 @@
+-- Índices B-tree para os atalhos de busca por identificador (CNPJ, CEP,
+-- registro ANS e UF). As expressões são as mesmas geradas pelo repositório:
+-- CNPJ e CEP sem máscara, UF em maiúsculas. text_pattern_ops atende tanto a
+-- igualdade quanto o prefixo (LIKE 'raiz%') independentemente da collation.
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cnpj_digits
+    ON cadop.cadastro_operadoras
+    ((regexp_replace(cnpj, '\D', '', 'g')) text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cep_digits
+    ON cadop.cadastro_operadoras
+    ((regexp_replace(cep, '\D', '', 'g')));
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_registro_operadora
+    ON cadop.cadastro_operadoras
+    (registro_operadora);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_uf_upper
+    ON cadop.cadastro_operadoras
+    (upper(uf));
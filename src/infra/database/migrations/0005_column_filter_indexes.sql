@@ -0,0 +1,24 @@
+-- Índices compostos para os filtros por campo (state, city, modality,
+-- salesRegion e intervalo de registrationDate). As expressões são as mesmas
+-- geradas pelo repositório: UF em maiúsculas, cidade e modalidade em
+-- lower(unaccent()). Cada filtro isolado usa a primeira coluna de um dos
+-- índices; o índice de UF da migração 0004 passa a ser coberto pelo índice
+-- (uf, modalidade).
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_uf_modalidade
+    ON cadop.cadastro_operadoras
+    (upper(uf), lower(cadop.immutable_unaccent(modalidade)));
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_cidade_uf
+    ON cadop.cadastro_operadoras
+    (lower(cadop.immutable_unaccent(cidade)), upper(uf));
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_modalidade_regiao
+    ON cadop.cadastro_operadoras
+    (lower(cadop.immutable_unaccent(modalidade)), regiao_de_comercializacao);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_data_registro
+    ON cadop.cadastro_operadoras
+    (data_registro_ans);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_uf_upper;
@@ -0,0 +1,10 @@
+-- O registro ANS identifica a operadora: o endpoint de detalhe
+-- (GET /api/v1/operators/{registry}) busca uma única linha por ele. O índice
+-- da migração 0004 é recriado como UNIQUE, com o mesmo nome, para que o
+-- planejador saiba que a sondagem retorna no máximo uma linha.
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_registro_operadora;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cadastro_operadoras_registro_operadora
+    ON cadop.cadastro_operadoras
+    (registro_operadora);
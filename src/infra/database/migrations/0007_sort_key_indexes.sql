@@ -0,0 +1,93 @@
+-- Índices de ordenação: um índice (chave de ordenação, id) para cada coluna
+-- aceita em sortField. As colunas de texto são indexadas com a mesma
+-- collation insensível a caixa e acentos usada no ORDER BY (ver
+-- sort_expression no repositório), de modo que ORDER BY ... LIMIT percorre o
+-- índice e lê apenas as primeiras linhas, em vez de ordenar todo o conjunto
+-- filtrado. O id na segunda posição atende o desempate e o predicado do
+-- cursor (chave, id) > (valor, id); a varredura reversa atende a ordem
+-- descendente.
+
+CREATE COLLATION IF NOT EXISTS pt_br_ci_ai (
+    provider = icu,
+    locale = 'pt-BR-u-ks-level1',
+    deterministic = false
+);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_registro_operadora
+    ON cadop.cadastro_operadoras
+    (registro_operadora COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_cnpj
+    ON cadop.cadastro_operadoras
+    (cnpj COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_razao_social
+    ON cadop.cadastro_operadoras
+    (razao_social COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_nome_fantasia
+    ON cadop.cadastro_operadoras
+    (nome_fantasia COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_modalidade
+    ON cadop.cadastro_operadoras
+    (modalidade COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_logradouro
+    ON cadop.cadastro_operadoras
+    (logradouro COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_numero
+    ON cadop.cadastro_operadoras
+    (numero COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_complemento
+    ON cadop.cadastro_operadoras
+    (complemento COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_bairro
+    ON cadop.cadastro_operadoras
+    (bairro COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_cidade
+    ON cadop.cadastro_operadoras
+    (cidade COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_uf
+    ON cadop.cadastro_operadoras
+    (uf COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_cep
+    ON cadop.cadastro_operadoras
+    (cep COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_ddd
+    ON cadop.cadastro_operadoras
+    (ddd COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_telefone
+    ON cadop.cadastro_operadoras
+    (telefone COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_fax
+    ON cadop.cadastro_operadoras
+    (fax COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_endereco_eletronico
+    ON cadop.cadastro_operadoras
+    (endereco_eletronico COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_representante
+    ON cadop.cadastro_operadoras
+    (representante COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_cargo_representante
+    ON cadop.cadastro_operadoras
+    (cargo_representante COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_data_registro_ans
+    ON cadop.cadastro_operadoras
+    (data_registro_ans, id);
+
+-- Coberto pelo índice (data_registro_ans, id)
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_data_registro;
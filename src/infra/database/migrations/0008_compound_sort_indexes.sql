@@ -0,0 +1,18 @@
+-- Índices para as ordenações por dois campos mais usadas (parâmetro 'sort'):
+-- estado e razão social, estado e cidade, modalidade e razão social. Com os
+-- dois campos na mesma direção, ORDER BY ... LIMIT percorre o índice (a
+-- varredura reversa atende a ordem descendente), como os índices de um
+-- campo da migração 0007. O id ao final é o desempate sempre acrescentado
+-- pelo repositório.
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_uf_razao_social
+    ON cadop.cadastro_operadoras
+    (uf COLLATE pt_br_ci_ai, razao_social COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_uf_cidade
+    ON cadop.cadastro_operadoras
+    (uf COLLATE pt_br_ci_ai, cidade COLLATE pt_br_ci_ai, id);
+
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_sort_modalidade_razao_social
+    ON cadop.cadastro_operadoras
+    (modalidade COLLATE pt_br_ci_ai, razao_social COLLATE pt_br_ci_ai, id);
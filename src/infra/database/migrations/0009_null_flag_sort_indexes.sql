@@ -0,0 +1,125 @@
+-- Índices de ordenação com o indicador de nulo à frente da chave:
+-- ((coluna IS NULL), coluna COLLATE pt_br_ci_ai, id). O repositório ordena
+-- por (nulo, chave, id), a mesma ordem de antes (nulos ao final na ordem
+-- ascendente), e o cursor passa a ser uma única comparação de tuplas,
+-- (nulo, chave, id) > (false, valor, id). Nos índices (chave, id) das
+-- migrações 0007 e 0008, o cursor ascendente precisava de "OR coluna IS
+-- NULL", que o índice não atende como limite: páginas profundas liam todas
+-- as entradas anteriores ao cursor. Os nomes dos índices são mantidos.
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_registro_operadora;
+CREATE INDEX idx_cadastro_operadoras_sort_registro_operadora
+    ON cadop.cadastro_operadoras
+    ((registro_operadora IS NULL), registro_operadora COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_cnpj;
+CREATE INDEX idx_cadastro_operadoras_sort_cnpj
+    ON cadop.cadastro_operadoras
+    ((cnpj IS NULL), cnpj COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_razao_social;
+CREATE INDEX idx_cadastro_operadoras_sort_razao_social
+    ON cadop.cadastro_operadoras
+    ((razao_social IS NULL), razao_social COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_nome_fantasia;
+CREATE INDEX idx_cadastro_operadoras_sort_nome_fantasia
+    ON cadop.cadastro_operadoras
+    ((nome_fantasia IS NULL), nome_fantasia COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_modalidade;
+CREATE INDEX idx_cadastro_operadoras_sort_modalidade
+    ON cadop.cadastro_operadoras
+    ((modalidade IS NULL), modalidade COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_logradouro;
+CREATE INDEX idx_cadastro_operadoras_sort_logradouro
+    ON cadop.cadastro_operadoras
+    ((logradouro IS NULL), logradouro COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_numero;
+CREATE INDEX idx_cadastro_operadoras_sort_numero
+    ON cadop.cadastro_operadoras
+    ((numero IS NULL), numero COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_complemento;
+CREATE INDEX idx_cadastro_operadoras_sort_complemento
+    ON cadop.cadastro_operadoras
+    ((complemento IS NULL), complemento COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_bairro;
+CREATE INDEX idx_cadastro_operadoras_sort_bairro
+    ON cadop.cadastro_operadoras
+    ((bairro IS NULL), bairro COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_cidade;
+CREATE INDEX idx_cadastro_operadoras_sort_cidade
+    ON cadop.cadastro_operadoras
+    ((cidade IS NULL), cidade COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_uf;
+CREATE INDEX idx_cadastro_operadoras_sort_uf
+    ON cadop.cadastro_operadoras
+    ((uf IS NULL), uf COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_cep;
+CREATE INDEX idx_cadastro_operadoras_sort_cep
+    ON cadop.cadastro_operadoras
+    ((cep IS NULL), cep COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_ddd;
+CREATE INDEX idx_cadastro_operadoras_sort_ddd
+    ON cadop.cadastro_operadoras
+    ((ddd IS NULL), ddd COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_telefone;
+CREATE INDEX idx_cadastro_operadoras_sort_telefone
+    ON cadop.cadastro_operadoras
+    ((telefone IS NULL), telefone COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_fax;
+CREATE INDEX idx_cadastro_operadoras_sort_fax
+    ON cadop.cadastro_operadoras
+    ((fax IS NULL), fax COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_endereco_eletronico;
+CREATE INDEX idx_cadastro_operadoras_sort_endereco_eletronico
+    ON cadop.cadastro_operadoras
+    ((endereco_eletronico IS NULL), endereco_eletronico COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_representante;
+CREATE INDEX idx_cadastro_operadoras_sort_representante
+    ON cadop.cadastro_operadoras
+    ((representante IS NULL), representante COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_cargo_representante;
+CREATE INDEX idx_cadastro_operadoras_sort_cargo_representante
+    ON cadop.cadastro_operadoras
+    ((cargo_representante IS NULL), cargo_representante COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_data_registro_ans;
+CREATE INDEX idx_cadastro_operadoras_sort_data_registro_ans
+    ON cadop.cadastro_operadoras
+    ((data_registro_ans IS NULL), data_registro_ans, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_uf_razao_social;
+CREATE INDEX idx_cadastro_operadoras_sort_uf_razao_social
+    ON cadop.cadastro_operadoras
+    ((uf IS NULL), uf COLLATE pt_br_ci_ai, (razao_social IS NULL), razao_social COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_uf_cidade;
+CREATE INDEX idx_cadastro_operadoras_sort_uf_cidade
+    ON cadop.cadastro_operadoras
+    ((uf IS NULL), uf COLLATE pt_br_ci_ai, (cidade IS NULL), cidade COLLATE pt_br_ci_ai, id);
+
+DROP INDEX IF EXISTS cadop.idx_cadastro_operadoras_sort_modalidade_razao_social;
+CREATE INDEX idx_cadastro_operadoras_sort_modalidade_razao_social
+    ON cadop.cadastro_operadoras
+    ((modalidade IS NULL), modalidade COLLATE pt_br_ci_ai, (razao_social IS NULL), razao_social COLLATE pt_br_ci_ai, id);
+
+-- O filtro por intervalo de registrationDate volta a ter o índice de uma
+-- coluna (removido na 0007), já que o índice de ordenação da data não
+-- começa mais pela data
+CREATE INDEX IF NOT EXISTS idx_cadastro_operadoras_data_registro
+    ON cadop.cadastro_operadoras
+    (data_registro_ans);
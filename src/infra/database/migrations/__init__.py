@@ -0,0 +1,54 @@
+import logging
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent
+
+
+def get_migration_files() -> List[Path]:
+    return sorted(MIGRATIONS_DIR.glob("*.sql"))
+
+
+def apply_migrations(engine: Engine) -> List[str]:
+    """
+    Aplica, em ordem, os scripts SQL deste diretório ainda não registrados em
+    cadop.schema_migrations. Cada script roda em sua própria transação.
+    Retorna os nomes dos scripts aplicados.
+    """
+    with engine.begin() as connection:
+        connection.execute(text("CREATE SCHEMA IF NOT EXISTS cadop"))
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS cadop.schema_migrations ("
+                " version text PRIMARY KEY,"
+                " applied_at timestamptz NOT NULL DEFAULT now())"
+            )
+        )
+        applied = set(
+            connection.execute(text("SELECT version FROM cadop.schema_migrations"))
+            .scalars()
+            .all()
+        )
+
+    executed = []
+    for migration in get_migration_files():
+        if migration.name in applied:
+            continue
+
+        logger.info(f"Aplicando migração {migration.name}")
+        with engine.begin() as connection:
+            # Cursor do driver para executar o script inteiro sem interpretar parâmetros
+            with connection.connection.cursor() as cursor:
+                cursor.execute(migration.read_text(encoding="utf-8"))
+            connection.execute(
+                text("INSERT INTO cadop.schema_migrations (version) VALUES (:version)"),
+                {"version": migration.name},
+            )
+        executed.append(migration.name)
+
+    return executed
@@ -0,0 +1,151 @@
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Estratégias de escolha da réplica
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+REPLICA_STRATEGIES = (ROUND_ROBIN, LEAST_CONNECTIONS)
+
+
+@dataclass
+class Replica:
+    """Uma réplica de leitura: o motor síncrono e, com DATABASE_DRIVER=async, o assíncrono."""
+
+    name: str
+    engine: Engine
+    async_engine: Any = None
+    # Conexões que o pool pode abrir (pool_size + max_overflow)
+    capacity: int = 0
+    healthy: bool = True
+
+    def checked_out(self) -> int:
+        """Conexões em uso no pool do driver que atende as requisições."""
+        engine = self.async_engine.sync_engine if self.async_engine is not None else self.engine
+        # Pools sem contagem (ex.: NullPool) não abrem conexões ociosas
+        checkedout = getattr(engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
+
+
+class ReplicaRouter:
+    """
+    Distribui as sessões de leitura entre as réplicas saudáveis, em rodízio
+    (round_robin) ou pela réplica com menos conexões em uso
+    (least_connections). Uma verificação em segundo plano executa SELECT 1 em
+    cada réplica a cada health_interval segundos: a réplica que falha sai da
+    distribuição e volta na primeira verificação bem-sucedida. Sem réplicas
+    saudáveis (ou sem réplicas configuradas), as leituras vão ao primário.
+    """
+
+    def __init__(self, replicas: Sequence[Replica], primary: Engine, primary_async: Any = None,
+                 strategy: str = ROUND_ROBIN, health_interval: float = 10,
+                 primary_capacity: int = 0):
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(
+                f"Estratégia de réplicas inválida: '{strategy}'. Valores permitidos: {', '.join(REPLICA_STRATEGIES)}"
+            )
+        self.replicas = list(replicas)
+        self.primary = primary
+        self.primary_async = primary_async
+        self.primary_capacity = primary_capacity
+        self.strategy = strategy
+        self.health_interval = health_interval
+        self._counter = itertools.count()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def healthy_replicas(self) -> List[Replica]:
+        return [replica for replica in self.replicas if replica.healthy]
+
+    def choose(self) -> Optional[Replica]:
+        """A réplica da próxima sessão, ou None quando as leituras devem ir ao primário."""
+        candidates = self.healthy_replicas()
+        if not candidates:
+            return None
+        if self.strategy == LEAST_CONNECTIONS:
+            # No empate, o rodízio evita concentrar as sessões na primeira réplica
+            offset = next(self._counter)
+            ordered = candidates[offset % len(candidates):] + candidates[: offset % len(candidates)]
+            return min(ordered, key=Replica.checked_out)
+        return candidates[next(self._counter) % len(candidates)]
+
+    def capacity(self) -> int:
+        """
+        Conexões que as leituras podem usar agora: a soma dos pools das
+        réplicas saudáveis ou, sem nenhuma, o pool do primário.
+        """
+        healthy = self.healthy_replicas()
+        if healthy:
+            return sum(replica.capacity for replica in healthy)
+        return self.primary_capacity
+
+    def engine(self) -> Engine:
+        replica = self.choose()
+        return replica.engine if replica is not None else self.primary
+
+    def async_engine(self):
+        replica = self.choose()
+        return replica.async_engine if replica is not None else self.primary_async
+
+    def check(self, replica: Replica) -> bool:
+        """Executa SELECT 1 na réplica e atualiza o seu estado."""
+        try:
+            with replica.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            # O endereço da réplica e o erro do driver ficam apenas no log
+            if replica.healthy:
+                logger.warning(f"Réplica {replica.name} removida da distribuição: {e}")
+            replica.healthy = False
+        else:
+            if not replica.healthy:
+                logger.info(f"Réplica {replica.name} de volta à distribuição")
+            replica.healthy = True
+        return replica.healthy
+
+    def check_all(self) -> None:
+        for replica in self.replicas:
+            self.check(replica)
+
+    def start(self) -> None:
+        if not self.replicas or (self._thread is not None and self._thread.is_alive()):
+            return
+
+        self.check_all()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._health_loop, name="database-replica-health", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _health_loop(self) -> None:
+        while not self._stop_event.wait(self.health_interval):
+            self.check_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Réplicas configuradas e saudáveis e, para cada uma, o estado e as
+        conexões em uso. Exposto no health check público: sem endereços nem
+        mensagens de erro, que vão para o log.
+        """
+        return {
+            "configured": len(self.replicas),
+            "healthy": len(self.healthy_replicas()),
+            "replicas": [
+                {"healthy": replica.healthy, "checkedOut": replica.checked_out()}
+                for replica in self.replicas
+            ],
+        }
@@ -0,0 +1,115 @@
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+from src.application.exception.query_timeout_exception import \
+    QueryTimeoutException
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATE da consulta cancelada (statement_timeout ou pedido de cancelamento)
+QUERY_CANCELED = "57014"
+
+# Vale apenas para a transação (SET LOCAL). O texto não muda com o prazo, de
+# modo que o asyncpg reaproveita a mesma instrução preparada
+SET_STATEMENT_TIMEOUT = text("SELECT set_config('statement_timeout', :timeout, true)")
+
+
+class RequestDeadline:
+    """
+    Prazo de uma requisição e as conexões do driver síncrono com consulta em
+    andamento em seu nome. Cada transação aberta durante a requisição recebe
+    o tempo restante como statement_timeout; cancel() interrompe as
+    consultas em andamento (o cliente desconectou) e recusa as seguintes.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._connections: Set[Any] = set()
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def track(self, dbapi_connection) -> None:
+        with self._lock:
+            self._connections.add(dbapi_connection)
+
+    def release(self, dbapi_connection) -> None:
+        # Aguarda um cancel() em curso: a conexão só volta ao pool (e a
+        # outra requisição) depois que o pedido de cancelamento foi enviado
+        with self._lock:
+            self._connections.discard(dbapi_connection)
+
+    def cancel(self) -> int:
+        """Envia o pedido de cancelamento às consultas em andamento e retorna quantas eram."""
+        with self._lock:
+            self.cancelled = True
+            for dbapi_connection in self._connections:
+                try:
+                    dbapi_connection.cancel()
+                except Exception as e:
+                    logger.warning(f"Falha ao cancelar a consulta: {e}")
+            return len(self._connections)
+
+
+_current_deadline: ContextVar[Optional[RequestDeadline]] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[RequestDeadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def request_deadline(timeout: float) -> Iterator[RequestDeadline]:
+    """Define o prazo das consultas feitas no contexto atual (e nas threads do executor)."""
+    deadline = RequestDeadline(timeout)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+@event.listens_for(Session, "after_begin")
+def apply_statement_timeout(session, transaction, connection) -> None:
+    deadline = current_deadline()
+    if deadline is None:
+        return
+
+    remaining = deadline.remaining()
+    if deadline.cancelled or remaining <= 0:
+        raise QueryTimeoutException(deadline.timeout)
+
+    connection.execute(SET_STATEMENT_TIMEOUT, {"timeout": str(math.ceil(remaining * 1000))})
+    # No driver assíncrono, o cancelamento da tarefa já cancela a consulta no servidor
+    if not connection.dialect.is_async:
+        deadline.track(connection.connection.dbapi_connection)
+        connection.info["request_deadline"] = deadline
+
+
+@event.listens_for(Pool, "checkin")
+def release_connection(dbapi_connection, connection_record) -> None:
+    deadline = connection_record.info.pop("request_deadline", None)
+    if deadline is not None:
+        deadline.release(dbapi_connection)
+
+
+@event.listens_for(Engine, "handle_error")
+def translate_query_canceled(context) -> None:
+    deadline = current_deadline()
+    if deadline is not None and getattr(context.original_exception, "pgcode", None) == QUERY_CANCELED:
+        raise QueryTimeoutException(deadline.timeout) from context.original_exception
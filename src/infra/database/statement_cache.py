@@ -0,0 +1,59 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class StatementCache:
+    """
+    Instruções SQLAlchemy já construídas, por forma de consulta (campos de
+    busca, filtros presentes, ordenação, modo de paginação...). Os valores da
+    requisição ficam em parâmetros nomeados, passados a cada execução, de
+    modo que a mesma instrução atende todas as requisições da forma e a sua
+    chave no cache de compilação do SQLAlchemy é calculada uma única vez.
+    Os itens menos usados saem quando o limite é atingido; max_size=0
+    desliga o cache (a instrução é construída a cada requisição).
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """A instrução da forma key, construída por build() na primeira vez."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+
+        # Construída fora do lock: duas requisições simultâneas da mesma forma
+        # nova constroem instruções equivalentes e a última prevalece
+        entry = build()
+        if self.max_size > 0:
+            with self._lock:
+                self._entries[key] = entry
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Formas em cache e acertos/faltas desde o início (ou o último clear)."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRatio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -1,4 +1,5 @@
 import logging
+import re
 import time
 from typing import Any, Awaitable, Callable
 
@@ -36,8 +37,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     ) -> Any:
         path = request.url.path
 
-        # Não aplicar rate limiting à documentação e healthcheck
-        if path in ["/docs", "/redoc", "/openapi.json", "/health"]:
+        # Não aplicar rate limiting à documentação, ao healthcheck e ao
+        # autocompletar (disparado a cada tecla e servido da memória)
+        if path in ["/docs", "/redoc", "/openapi.json", "/health", "/api/v1/operators/suggest"]:
             return await call_next(request)
 
         client_ip = self._get_client_identifier(request)
@@ -45,6 +47,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Criar chave única para este endpoint/IP (usando apenas a parte principal do caminho)
         # Exemplo: /api/v1/operators?page=1 -> /api/v1/operators
         endpoint = path.split("?")[0]
+        # Detalhes de operadoras diferentes compartilham o mesmo limite:
+        # /api/v1/operators/335690 -> /api/v1/operators/{registry}
+        endpoint = re.sub(r"/[0-9]+$", "/{registry}", endpoint)
         namespace = endpoint.replace("/", "_").strip("_")
 
         key = f"{namespace}:{client_ip}"
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infra.database.request_deadline import request_deadline
+
+logger = logging.getLogger(__name__)
+
+# A exportação é um fluxo longo, lido em blocos, e o autocompletar é servido
+# da memória: nenhum dos dois recebe o prazo das consultas
+DEFAULT_EXEMPT_PATHS = ("/api/v1/operators/export", "/api/v1/operators/suggest")
+
+
+class RequestDeadlineMiddleware:
+    """
+    Define o prazo das consultas de cada requisição (statement_timeout das
+    transações abertas por ela) e acompanha a conexão do cliente enquanto a
+    rota executa. Se o cliente desconectar antes da resposta, as consultas em
+    andamento são canceladas no servidor e a rota é interrompida, liberando a
+    conexão do pool e a thread do executor para as demais requisições.
+
+    Middleware ASGI puro: observa as mensagens do cliente em paralelo à
+    rota, sem intermediar a resposta como o BaseHTTPMiddleware.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        timeout_ms: int = 10000,
+        exempt_paths: Iterable[str] = DEFAULT_EXEMPT_PATHS,
+    ):
+        self.app = app
+        self.timeout = timeout_ms / 1000
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.timeout <= 0 or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        # Mensagens do cliente, repassadas à rota pela fila
+        messages: "asyncio.Queue[Message]" = asyncio.Queue()
+        response_complete = False
+
+        async def watch_client() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        async def send_response(message: Message) -> None:
+            nonlocal response_complete
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+
+        with request_deadline(self.timeout) as deadline:
+            # As tarefas copiam o contexto atual, com o prazo da requisição
+            handler = asyncio.ensure_future(self.app(scope, messages.get, send_response))
+            watcher = asyncio.ensure_future(watch_client())
+            try:
+                await asyncio.wait({handler, watcher}, return_when=asyncio.FIRST_COMPLETED)
+                # Depois da resposta completa, o servidor também informa a
+                # desconexão; só é abandono se ela chegar antes
+                if watcher.done() and not handler.done() and not response_complete:
+                    cancelled = deadline.cancel()
+                    handler.cancel()
+                    await asyncio.gather(handler, return_exceptions=True)
+                    logger.info(
+                        f"Cliente desconectou de {scope['path']} antes da resposta: "
+                        f"requisição interrompida ({cancelled} consulta(s) cancelada(s))"
+                    )
+                    return
+                watcher.cancel()
+                await handler
+            except BaseException:
+                handler.cancel()
+                watcher.cancel()
+                raise
@@ -0,0 +1,17 @@
+from src.infra.database import (SEARCH_SNAPSHOT_REFRESH_INTERVAL,
+                                database_executor, read_session)
+from src.infra.search.operator_snapshot import (OperatorSnapshot,
+                                                OperatorSnapshotStore)
+from src.infra.search.text_normalizer import normalize_text
+
+# Snapshot compartilhado pelos componentes de busca em memória
+operator_snapshot_store = OperatorSnapshotStore(
+    read_session, SEARCH_SNAPSHOT_REFRESH_INTERVAL, database_executor.reserve
+)
+
+__all__ = [
+    "OperatorSnapshot",
+    "OperatorSnapshotStore",
+    "normalize_text",
+    "operator_snapshot_store",
+]
@@ -0,0 +1,131 @@
+import re
+from typing import Dict, List, Optional, Sequence, Set
+
+from src.infra.search.text_normalizer import normalize_text
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Palavras do texto normalizado (sem acentos e em minúsculas)."""
+    return WORD_PATTERN.findall(normalize_text(value))
+
+
+def max_distance(word: str) -> int:
+    # Palavras curtas toleram menos erros para não casar com metade do vocabulário
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 5:
+        return 1
+    return 2
+
+
+def levenshtein(source: str, target: str) -> int:
+    """Distância de edição (inserção, remoção e substituição) entre duas palavras."""
+    if len(source) < len(target):
+        source, target = target, source
+
+    previous = list(range(len(target) + 1))
+    for i, source_char in enumerate(source, start=1):
+        current = [i]
+        for j, target_char in enumerate(target, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (source_char != target_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """
+    Árvore BK sobre a distância de edição: cada filho fica na aresta da sua
+    distância ao pai, e a desigualdade triangular permite descartar subárvores
+    inteiras durante a busca.
+    """
+
+    def __init__(self, words: Sequence[str] = ()):
+        self._root: Optional[list] = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = [word, {}]
+            return
+
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                return
+            node = child
+
+    def search(self, word: str, tolerance: int) -> List[str]:
+        """Palavras a no máximo `tolerance` edições da palavra informada."""
+        if self._root is None:
+            return []
+
+        found = []
+        pending = [self._root]
+        while pending:
+            candidate, children = pending.pop()
+            distance = levenshtein(word, candidate)
+            if distance <= tolerance:
+                found.append(candidate)
+            for edge in range(distance - tolerance, distance + tolerance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    pending.append(child)
+        return found
+
+
+class FuzzyNameIndex:
+    """
+    Índice tolerante a erros de digitação sobre os nomes das operadoras.
+
+    Cada linha é representada pelos seus nomes (razão social e nome fantasia);
+    o índice guarda, para cada palavra normalizada, as posições das linhas que
+    a contêm, e uma árvore BK sobre o vocabulário. Uma linha casa com a busca
+    quando todas as palavras buscadas estão próximas de alguma palavra dos nomes.
+    """
+
+    def __init__(self, names_by_row: Sequence[Sequence[Optional[str]]]):
+        self._postings: Dict[str, Set[int]] = {}
+        for position, names in enumerate(names_by_row):
+            for name in names:
+                for word in tokenize(name):
+                    self._postings.setdefault(word, set()).add(position)
+        self._tree = BKTree(sorted(self._postings))
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._postings)
+
+    def _positions_for(self, word: str) -> Set[int]:
+        positions: Set[int] = set()
+        for candidate in self._tree.search(word, max_distance(word)):
+            positions |= self._postings[candidate]
+        return positions
+
+    def search(self, term: Optional[str]) -> List[int]:
+        """Posições das linhas cujos nomes casam com todas as palavras do termo."""
+        words = tokenize(term)
+        if not words:
+            return []
+
+        matches: Optional[Set[int]] = None
+        # As palavras mais longas costumam ser as mais seletivas
+        for word in sorted(set(words), key=len, reverse=True):
+            positions = self._positions_for(word)
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                return []
+        return sorted(matches)
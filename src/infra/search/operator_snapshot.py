@@ -0,0 +1,369 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from contextlib import nullcontext
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Date, String
+
+from src.application.dto.operator_model import OperatorModel
+from src.domain.model.operator import Operator
+from src.domain.repository.operator_repository import (
+    SEARCH_DOCUMENT_SEPARATOR, SEARCHABLE_COLUMNS)
+from src.infra.search.fuzzy_name_index import FuzzyNameIndex
+from src.infra.search.suggestion_index import SuggestionIndex
+from src.infra.search.text_normalizer import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Intervalo (s) entre as tentativas enquanto nenhum snapshot foi carregado
+SNAPSHOT_RETRY_INTERVAL = 30
+
+# Mesmo separador da coluna search_document: um termo nunca casa "atravessando" dois campos
+DOCUMENT_SEPARATOR = SEARCH_DOCUMENT_SEPARATOR
+
+
+def _attribute_name(column) -> str:
+    return Operator.__mapper__.get_property_by_column(column).key
+
+
+def _digits(value: Optional[str]) -> Optional[str]:
+    return re.sub(r"[^0-9]", "", value) if value is not None else None
+
+
+class Descending:
+    """Inverte a comparação de uma chave, para campos descendentes em uma ordenação mista."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __eq__(self, other: "Descending") -> bool:
+        return self.key == other.key
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.key < self.key
+
+
+class OperatorSnapshot:
+    """
+    Cópia imutável da tabela de operadoras mantida em memória.
+
+    As colunas de texto pesquisáveis são pré-normalizadas (equivalente a
+    lower(unaccent(coluna))) e concatenadas em um único documento por linha,
+    de modo que a busca textual se resume a uma verificação de substring.
+    As ordenações e os índices de nomes (busca aproximada e autocompletar)
+    são calculados sob demanda e reaproveitados entre requisições; um novo
+    snapshot (dados alterados) recomeça com estruturas novas.
+    """
+
+    def __init__(self, rows: Sequence[Any]):
+        self.operators: Tuple[OperatorModel, ...] = tuple(
+            OperatorModel.model_validate(row, from_attributes=True) for row in rows
+        )
+        self.ids: Tuple[int, ...] = tuple(getattr(row, "id", None) for row in rows)
+        self.documents: Tuple[str, ...] = tuple(
+            DOCUMENT_SEPARATOR.join(
+                normalize_text(getattr(operator, _attribute_name(column)))
+                for column in SEARCHABLE_COLUMNS
+            )
+            for operator in self.operators
+        )
+        self.version: str = self._compute_version()
+        self.loaded_at: float = time.time()
+        self._orderings: Dict[Any, Tuple[int, ...]] = {}
+        self._facet_bitmaps: Dict[str, Dict[Any, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.operators)
+
+    def _compute_version(self) -> str:
+        digest = hashlib.sha1()
+        for operator in self.operators:
+            digest.update(operator.model_dump_json().encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def sortable_column(field: Optional[str]):
+        column = Operator.__table__.columns.get(field) if field else None
+        if column is None or not isinstance(column.type, (String, Date)):
+            return None
+        return column
+
+    @staticmethod
+    def sort_key(column, value: Any, row_id: Any) -> Tuple:
+        """
+        Chave de ordenação equivalente a (coluna COLLATE pt_br_ci_ai, id) com
+        nulos ao final na ordem ascendente.
+        """
+        return (*OperatorSnapshot.value_key(column, value), row_id)
+
+    @staticmethod
+    def value_key(column, value: Any) -> Tuple:
+        if value is None:
+            return (True, "")
+        if isinstance(column.type, String):
+            return (False, normalize_text(value))
+        return (False, value)
+
+    @classmethod
+    def compound_sort_key(cls, sort_keys: Sequence[Tuple[str, str]],
+                          values: Sequence[Any], row_id: Any) -> Tuple:
+        """
+        Chave da ordenação por vários campos em direções possivelmente mistas,
+        com o id ao final na direção do último campo (ver
+        OperatorRepository.apply_sort_keys). Nulos ficam ao final na ordem
+        ascendente e no início na descendente.
+        """
+        key = []
+        for (field, direction), value in zip(sort_keys, values):
+            component = cls.value_key(cls.sortable_column(field), value)
+            key.append(Descending(component) if direction == "desc" else component)
+        key.append(Descending(row_id) if sort_keys[-1][1] == "desc" else row_id)
+        return tuple(key)
+
+    def row_compound_sort_key(self, sort_keys: Sequence[Tuple[str, str]], index: int) -> Tuple:
+        values = [
+            self.row_sort_value(self.sortable_column(field), index) for field, _ in sort_keys
+        ]
+        return self.compound_sort_key(sort_keys, values, self.ids[index])
+
+    def row_sort_value(self, column, index: int) -> Any:
+        return getattr(self.operators[index], _attribute_name(column))
+
+    def row_sort_key(self, column, index: int) -> Tuple:
+        return self.sort_key(column, self.row_sort_value(column, index), self.ids[index])
+
+    def bitmap(self, positions: Sequence[int]) -> int:
+        """Conjunto de linhas como inteiro: o bit i indica a linha na posição i."""
+        bits = bytearray((len(self.operators) + 7) // 8)
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bits, "little")
+
+    def facet_bitmaps(self, field: str) -> Dict[Any, int]:
+        """Para cada valor da coluna (chave camelCase), o bitmap das linhas que o contêm."""
+        cached = self._facet_bitmaps.get(field)
+        if cached is not None:
+            return cached
+
+        attribute = _attribute_name(Operator.__table__.columns[field])
+        positions_by_value: Dict[Any, List[int]] = {}
+        for position, operator in enumerate(self.operators):
+            positions_by_value.setdefault(getattr(operator, attribute), []).append(position)
+
+        bitmaps = {value: self.bitmap(positions) for value, positions in positions_by_value.items()}
+        self._facet_bitmaps[field] = bitmaps
+        return bitmaps
+
+    @cached_property
+    def name_index(self) -> FuzzyNameIndex:
+        return FuzzyNameIndex(
+            [(operator.corporate_name, operator.trade_name) for operator in self.operators]
+        )
+
+    @cached_property
+    def suggestion_index(self) -> SuggestionIndex:
+        return SuggestionIndex(self.operators)
+
+    @cached_property
+    def registry_positions(self) -> Dict[str, int]:
+        """Posição de cada operadora pelo registro ANS (único, pela migração 0006)."""
+        return {
+            operator.operator_registry: position
+            for position, operator in enumerate(self.operators)
+            if operator.operator_registry is not None
+        }
+
+    @cached_property
+    def cnpj_digits(self) -> Tuple[Optional[str], ...]:
+        """CNPJ de cada linha sem máscara, como digits_only(cnpj) no banco."""
+        return tuple(_digits(operator.cnpj) for operator in self.operators)
+
+    @cached_property
+    def zip_digits(self) -> Tuple[Optional[str], ...]:
+        """CEP de cada linha sem máscara."""
+        return tuple(_digits(operator.zip) for operator in self.operators)
+
+    @cached_property
+    def cnpj_positions(self) -> Dict[str, int]:
+        """Posição de cada operadora pelo CNPJ sem máscara (em duplicidade, vale o menor id)."""
+        positions: Dict[str, int] = {}
+        for position, digits in enumerate(self.cnpj_digits):
+            if digits:
+                positions.setdefault(digits, position)
+        return positions
+
+    def typed_positions(self, kind: str, value: str) -> Set[int]:
+        """
+        Posições das linhas que casam com o termo classificado (ver
+        classify_search_term), com a mesma semântica de search_predicate:
+        CNPJ, CEP e registro exatos, raiz do CNPJ por prefixo e upper(uf).
+        """
+        if kind == "registry":
+            position = self.registry_positions.get(value)
+            return set() if position is None else {position}
+        if kind == "state":
+            return {
+                position for position, operator in enumerate(self.operators)
+                if operator.state is not None and operator.state.upper() == value
+            }
+
+        values = self.zip_digits if kind == "zip" else self.cnpj_digits
+        if kind == "cnpj_prefix":
+            return {
+                position for position, digits in enumerate(values)
+                if digits is not None and digits.startswith(value)
+            }
+        return {position for position, digits in enumerate(values) if digits == value}
+
+    def find_by_registry(self, registry: str) -> Optional[OperatorModel]:
+        position = self.registry_positions.get(registry)
+        return self.operators[position] if position is not None else None
+
+    def find_by_identifiers(self, cnpjs: Sequence[str], registries: Sequence[str]) -> List[OperatorModel]:
+        positions = {self.registry_positions.get(registry) for registry in registries}
+        positions.update(self.cnpj_positions.get(cnpj) for cnpj in cnpjs)
+        positions.discard(None)
+        return [self.operators[position] for position in sorted(positions)]
+
+    def fuzzy_match_ids(self, term: Optional[str]) -> List[int]:
+        """Ids das operadoras cujos nomes casam, com tolerância a erros, com o termo."""
+        return [self.ids[position] for position in self.name_index.search(term)]
+
+    def ordering(self, field: Optional[str]) -> Sequence[int]:
+        """
+        Retorna os índices das linhas em ordem ascendente para a coluna informada
+        (chave camelCase da coluna), desempatando pelo id. Sem coluna, segue a
+        ordem dos ids.
+        """
+        column = self.sortable_column(field)
+        if column is None:
+            return range(len(self.operators))
+
+        cached = self._orderings.get(field)
+        if cached is not None:
+            return cached
+
+        ordering = tuple(
+            sorted(
+                range(len(self.operators)),
+                key=lambda index: self.row_sort_key(column, index),
+            )
+        )
+        # Atribuição de dicionário é atômica; no pior caso duas threads calculam a mesma ordenação.
+        self._orderings[field] = ordering
+        return ordering
+
+    def compound_ordering(self, sort_keys: Tuple[Tuple[str, str], ...]) -> Sequence[int]:
+        """
+        Índices das linhas já na ordem pedida (parâmetro 'sort'), ao contrário
+        de ordering(), que é sempre ascendente.
+        """
+        cached = self._orderings.get(sort_keys)
+        if cached is not None:
+            return cached
+
+        ordering = tuple(
+            sorted(
+                range(len(self.operators)),
+                key=lambda index: self.row_compound_sort_key(sort_keys, index),
+            )
+        )
+        self._orderings[sort_keys] = ordering
+        return ordering
+
+
+class OperatorSnapshotStore:
+    """
+    Mantém o snapshot corrente das operadoras e o atualiza em segundo plano.
+
+    Falhas ao recarregar os dados (ex.: janela de manutenção do Postgres) são
+    registradas em log e o snapshot anterior continua sendo servido.
+    """
+
+    def __init__(self, session_factory: Callable, refresh_interval: int,
+                 reserve_connection: Callable = nullcontext):
+        self._session_factory = session_factory
+        self._refresh_interval = refresh_interval
+        # Reserva a conexão da carga no executor do banco (ver DatabaseExecutor.reserve)
+        self._reserve_connection = reserve_connection
+        self._snapshot: Optional[OperatorSnapshot] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> Optional[OperatorSnapshot]:
+        return self._snapshot
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def version(self) -> Optional[str]:
+        """Versão dos dados carregados; muda sempre que o conteúdo da tabela muda."""
+        snapshot = self._snapshot
+        return snapshot.version if snapshot is not None else None
+
+    def load(self, rows: Sequence[Any]) -> bool:
+        """Substitui o snapshot corrente. Retorna True se os dados mudaram."""
+        snapshot = OperatorSnapshot(rows)
+        current = self._snapshot
+        if current is not None and current.version == snapshot.version:
+            current.loaded_at = snapshot.loaded_at
+            return False
+
+        self._snapshot = snapshot
+        logger.info(
+            f"Snapshot de operadoras carregado: {len(snapshot)} registros, versão {snapshot.version[:12]}"
+        )
+        return True
+
+    def refresh(self) -> bool:
+        try:
+            return self.load(self._read_rows())
+        except Exception as e:
+            logger.error(f"Erro ao atualizar o snapshot de operadoras: {e}")
+            return False
+
+    def _read_rows(self) -> List[Any]:
+        # A conexão fica reservada só durante a leitura, não na montagem do snapshot
+        with self._reserve_connection():
+            session = self._session_factory()
+            try:
+                return session.query(Operator).order_by(Operator.id).all()
+            finally:
+                session.close()
+
+    def start(self) -> None:
+        """Carrega o snapshot (na inicialização) e inicia a atualização em segundo plano."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self.refresh()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="operator-snapshot-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _refresh_delay(self) -> float:
+        # Sem snapshot (ex.: banco indisponível na inicialização), tenta antes
+        if self._snapshot is None:
+            return min(self._refresh_interval, SNAPSHOT_RETRY_INTERVAL)
+        return self._refresh_interval
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_event.wait(self._refresh_delay()):
+            self.refresh()
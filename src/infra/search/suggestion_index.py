@@ -0,0 +1,54 @@
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+from src.infra.search.text_normalizer import normalize_text
+
+# (chave normalizada, nome exibido, registro ANS)
+SuggestionEntry = Tuple[str, str, Optional[str]]
+
+
+class SuggestionIndex:
+    """
+    Índice de autocompletar: vetor ordenado das chaves normalizadas (razão
+    social, nome fantasia e registro ANS de cada operadora). As completações de
+    um prefixo ocupam uma faixa contígua do vetor, localizada por busca binária.
+    """
+
+    def __init__(self, operators: Sequence):
+        entries = set()
+        for operator in operators:
+            registry = operator.operator_registry
+            for name in (operator.trade_name, operator.corporate_name):
+                if name:
+                    entries.add((normalize_text(name), name, registry))
+            if registry:
+                display_name = operator.trade_name or operator.corporate_name or registry
+                entries.add((registry, display_name, registry))
+
+        self._entries: List[SuggestionEntry] = sorted(
+            entries, key=lambda entry: (entry[0], entry[2] or "")
+        )
+        self._keys: List[str] = [entry[0] for entry in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def suggest(self, prefix: Optional[str], limit: int) -> List[Tuple[str, Optional[str]]]:
+        """Até `limit` pares (nome, registro) cujas chaves começam com o prefixo."""
+        key = normalize_text(prefix).strip()
+        if not key:
+            return []
+
+        suggestions = []
+        seen = set()
+        position = bisect_left(self._keys, key)
+        while position < len(self._entries) and len(suggestions) < limit:
+            entry_key, name, registry = self._entries[position]
+            if not entry_key.startswith(key):
+                break
+            # A mesma operadora aparece uma única vez (ex.: razão social e nome fantasia iguais)
+            if registry not in seen or registry is None:
+                seen.add(registry)
+                suggestions.append((name, registry))
+            position += 1
+        return suggestions
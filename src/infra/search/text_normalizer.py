@@ -0,0 +1,14 @@
+import unicodedata
+from typing import Optional
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """
+    Equivalente em Python de lower(unaccent(valor)) utilizado nas consultas
+    ao banco, para que buscas em memória tenham a mesma semântica.
+    """
+    if not value:
+        return ""
+
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).lower()
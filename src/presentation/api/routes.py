@@ -1,22 +1,82 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+import hashlib
+import json
+
+from fastapi import APIRouter, Depends, Path, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from aiocache import Cache, caches
 import src.infra.config as config
+from src.application.service.operator_export_service import (
+    EXPORT_MEDIA_TYPES, OperatorExportService)
 from src.application.service.operator_service import OperatorService
+from src.application.service.suggestion_service import SuggestionService
 from src.infra.config.swagger_config import ENDPOINT_CONFIG as SWAGGER_CONFIG
-from src.infra.database import get_db
+from src.infra.database import (database_executor, get_db, replica_router,
+                                statement_cache)
+from src.presentation.model.operator_batch_request import OperatorBatchRequest
+from src.presentation.model.operator_export_params import OperatorExportParams
 from src.presentation.model.operator_request_params import \
     OperatorRequestParams
+from src.presentation.model.suggestion_request_params import \
+    SuggestionRequestParams
 
 api_router = APIRouter(prefix="/api/v1")
 
+# As sugestões só mudam quando o snapshot é atualizado
+SUGGESTION_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=3600"
+
+# Registro ANS: seis dígitos
+OPERATOR_REGISTRY_PATTERN = r"^[0-9]{6}$"
+
 # Função para injeção de dependência do OperatorService
 def get_operator_service(db=Depends(get_db)):
     return OperatorService(db)
 
+# A exportação abre a própria sessão, mantida enquanto a resposta é enviada
+def get_export_service():
+    return OperatorExportService()
+
+# O autocompletar não abre sessão com o banco
+def get_suggestion_service():
+    return SuggestionService()
+
 @api_router.get("/health")
 def health():
-    return {"status": "ok"}
+    # Ocupação do executor das consultas (threads em uso, fila e tempos de
+    # espera), estado das réplicas de leitura e acertos do cache de instruções
+    return {
+        "status": "ok",
+        "databaseExecutor": database_executor.stats(),
+        "databaseReplicas": replica_router.stats(),
+        "statementCache": statement_cache.stats(),
+    }
+
+@api_router.get(
+    "/operators/suggest",
+    response_model=SWAGGER_CONFIG["suggest"]["response_model"],
+    tags=[SWAGGER_CONFIG["suggest"]["tag"]],
+    summary=SWAGGER_CONFIG["suggest"]["summary"],
+    description=SWAGGER_CONFIG["suggest"]["description"],
+    response_description=SWAGGER_CONFIG["suggest"]["response_description"],
+    responses=SWAGGER_CONFIG["suggest"]["responses"],
+)
+def suggest_operators(
+    request: Request,
+    params: SuggestionRequestParams = Depends(),
+    suggestion_service: SuggestionService = Depends(get_suggestion_service),
+):
+    suggestions, version = suggestion_service.suggest(params)
+    if version is None:
+        # Snapshot indisponível: a resposta vazia não deve ficar em cache
+        return JSONResponse(
+            content=suggestions.model_dump(by_alias=True),
+            headers={"Cache-Control": "no-store"},
+        )
+
+    etag = f'"{version[:20]}"'
+    headers = {"Cache-Control": SUGGESTION_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=suggestions.model_dump(by_alias=True), headers=headers)
 
 @api_router.get(
     "/operators",
@@ -34,6 +94,75 @@ async def search_operators(
     return await operator_service.find_all_cached(params)
 
 
+# Declarada antes de /operators/{registry}, que também casaria com "export"
+@api_router.get(
+    "/operators/export",
+    response_class=StreamingResponse,
+    tags=[SWAGGER_CONFIG["operator_export"]["tag"]],
+    summary=SWAGGER_CONFIG["operator_export"]["summary"],
+    description=SWAGGER_CONFIG["operator_export"]["description"],
+    response_description=SWAGGER_CONFIG["operator_export"]["response_description"],
+    responses=SWAGGER_CONFIG["operator_export"]["responses"],
+)
+def export_operators(
+    params: OperatorExportParams = Depends(),
+    export_service: OperatorExportService = Depends(get_export_service),
+):
+    media_type, extension = EXPORT_MEDIA_TYPES[params.format]
+    return StreamingResponse(
+        export_service.stream(params),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="operadoras.{extension}"'},
+    )
+
+
+@api_router.post(
+    "/operators/batch",
+    response_model=SWAGGER_CONFIG["operator_batch"]["response_model"],
+    tags=[SWAGGER_CONFIG["operator_batch"]["tag"]],
+    summary=SWAGGER_CONFIG["operator_batch"]["summary"],
+    description=SWAGGER_CONFIG["operator_batch"]["description"],
+    response_description=SWAGGER_CONFIG["operator_batch"]["response_description"],
+    responses=SWAGGER_CONFIG["operator_batch"]["responses"],
+)
+async def find_operators_batch(
+    request: OperatorBatchRequest,
+    operator_service: OperatorService = Depends(get_operator_service),
+):
+    return await operator_service.find_by_identifiers_cached(request)
+
+
+def operator_etag(operator: dict) -> str:
+    # O ETag depende apenas do conteúdo do registro, não da instância que o serviu
+    payload = json.dumps(operator, sort_keys=True, ensure_ascii=False, default=str)
+    return f'"{hashlib.sha1(payload.encode("utf-8")).hexdigest()[:20]}"'
+
+
+@api_router.get(
+    "/operators/{registry}",
+    response_model=SWAGGER_CONFIG["operator_detail"]["response_model"],
+    tags=[SWAGGER_CONFIG["operator_detail"]["tag"]],
+    summary=SWAGGER_CONFIG["operator_detail"]["summary"],
+    description=SWAGGER_CONFIG["operator_detail"]["description"],
+    response_description=SWAGGER_CONFIG["operator_detail"]["response_description"],
+    responses=SWAGGER_CONFIG["operator_detail"]["responses"],
+)
+async def find_operator(
+    request: Request,
+    registry: str = Path(
+        pattern=OPERATOR_REGISTRY_PATTERN, description="Registro ANS da operadora (6 dígitos)"
+    ),
+    operator_service: OperatorService = Depends(get_operator_service),
+):
+    operator = await operator_service.find_by_registry_cached(registry)
+
+    etag = operator_etag(operator)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=operator, headers=headers)
+
+
 # Endpoint condicional para ambiente de desenvolvimento
 if config.get_current_env() == "dev":
 
@@ -11,6 +11,8 @@ class ApiErrorType(str, Enum):
         "/limite-de-requisicoes-excedido",
         "Limite de Requisições Excedido",
     )
+    SERVICE_UNAVAILABLE = ("/servico-indisponivel", "Serviço Indisponível")
+    REQUEST_TIMEOUT = ("/tempo-esgotado", "Tempo Esgotado")
 
     def __new__(cls, uri, title):
         obj = str.__new__(cls, uri)
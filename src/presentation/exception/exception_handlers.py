@@ -8,6 +8,12 @@ from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.application.exception.business_exception import BusinessException
+from src.application.exception.database_busy_exception import \
+    DatabaseBusyException
+from src.application.exception.operator_not_found_exception import \
+    OperatorNotFoundException
+from src.application.exception.query_timeout_exception import \
+    QueryTimeoutException
 from src.application.exception.rate_limit_exception import \
     RateLimitExceededException
 from src.application.exception.violation_exception import ViolationException
@@ -98,6 +104,15 @@ def register_exception_handlers(app):
             detail=str(exc),
         )
 
+    @app.exception_handler(OperatorNotFoundException)
+    async def operator_not_found_handler(request: Request, exc: OperatorNotFoundException):
+        return create_api_error_response(
+            error_type=ApiErrorType.RESOURCE_NOT_FOUND,
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+            user_message="A operadora informada não foi encontrada.",
+        )
+
     @app.exception_handler(Exception)
     async def generic_exception_handler(request: Request, exc: Exception):
         logger.error("Erro interno não tratado", exc_info=exc)
@@ -141,6 +156,26 @@ def register_exception_handlers(app):
 
         return response
 
+    @app.exception_handler(DatabaseBusyException)
+    async def database_busy_exception_handler(request: Request, exc: DatabaseBusyException):
+        response = create_api_error_response(
+            error_type=ApiErrorType.SERVICE_UNAVAILABLE,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            user_message="O serviço está sobrecarregado no momento. Tente novamente em alguns instantes.",
+        )
+        response.headers["Retry-After"] = "1"
+        return response
+
+    @app.exception_handler(QueryTimeoutException)
+    async def query_timeout_exception_handler(request: Request, exc: QueryTimeoutException):
+        return create_api_error_response(
+            error_type=ApiErrorType.REQUEST_TIMEOUT,
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(exc),
+            user_message="A consulta demorou mais que o permitido. Refine os filtros e tente novamente.",
+        )
+
     @app.exception_handler(ViolationException)
     async def violation_exception_handler(request: Request, exc: ViolationException):
         return create_api_error_response(
@@ -0,0 +1,48 @@
+from typing import Dict, List, Tuple
+
+from pydantic import BaseModel, Field, field_validator
+from pydantic.alias_generators import to_camel
+
+from src.application.exception.violation_exception import ViolationException
+from src.domain.repository.operator_repository import classify_search_term
+
+# Quantidade máxima de identificadores por requisição
+BATCH_MAX_IDENTIFIERS = 1000
+
+# Tipos de identificador aceitos no lote (ver classify_search_term)
+BATCH_IDENTIFIER_KINDS = ("cnpj", "registry")
+
+
+class OperatorBatchRequest(BaseModel):
+    identifiers: List[str] = Field(
+        min_length=1,
+        max_length=BATCH_MAX_IDENTIFIERS,
+        description=f"CNPJs (com ou sem máscara) e/ou registros ANS (6 dígitos) das operadoras, até {BATCH_MAX_IDENTIFIERS} por requisição.",
+    )
+
+    @field_validator("identifiers")
+    def validate_identifiers(cls, value):
+        invalid = [
+            identifier
+            for identifier in value
+            if (classify_search_term(identifier) or (None,))[0] not in BATCH_IDENTIFIER_KINDS
+        ]
+        if invalid:
+            raise ViolationException(
+                field="identifiers",
+                message=f"Os identificadores devem ser CNPJs ou registros ANS (6 dígitos). Inválidos: {', '.join(invalid[:10])}",
+            )
+        return list(dict.fromkeys(value))
+
+    @property
+    def lookup_keys(self) -> Dict[str, Tuple[str, str]]:
+        """Para cada identificador informado, o tipo e o valor sem máscara."""
+        return {identifier: classify_search_term(identifier) for identifier in self.identifiers}
+
+    model_config = {
+        "alias_generator": to_camel,
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {"identifiers": ["335690", "29.309.127/0001-79", "02812468000106"]}
+        },
+    }
@@ -0,0 +1,32 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+from pydantic.alias_generators import to_camel
+
+
+class OperatorBatchResponse(BaseModel):
+    """
+    Resposta da consulta em lote: as operadoras indexadas pelo identificador
+    exatamente como foi enviado (CNPJ com ou sem máscara, ou registro ANS).
+    """
+
+    data: Dict[str, Optional[Dict[str, Any]]] = Field(
+        description="Operadora encontrada para cada identificador; null quando não existe."
+    )
+    not_found: List[str] = Field(
+        description="Identificadores sem operadora correspondente, na ordem em que foram enviados."
+    )
+
+    model_config = {
+        "alias_generator": to_camel,
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "data": {
+                    "335690": {"operatorRegistry": "335690", "corporateName": "UNIMED CAMPINAS"},
+                    "000000": None,
+                },
+                "notFound": ["000000"],
+            }
+        },
+    }
@@ -0,0 +1,18 @@
+from typing import Literal
+
+from pydantic import Field
+
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+class OperatorExportParams(OperatorRequestParams):
+    """
+    Parâmetros da exportação: os mesmos filtros, busca e ordenação da
+    listagem. Os parâmetros de paginação, contagem e facets são ignorados.
+    """
+
+    format: Literal["ndjson", "csv"] = Field(
+        default="ndjson",
+        description="Formato do arquivo: 'ndjson' (um objeto JSON por linha) ou 'csv' (cabeçalho com os nomes camelCase dos campos).",
+    )
@@ -1,18 +1,32 @@
-from typing import Literal, Optional
+from datetime import date
+from typing import Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic.alias_generators import to_camel
 
+from src.application.dto.operator_model import OPERATOR_FIELD_NAMES
+from src.application.dto.page_cursor import FIRST_PAGE_CURSOR, PageCursor
+from src.application.exception.invalid_cursor_exception import \
+    InvalidCursorException
 from src.application.exception.invalid_sort_parameter_exception import \
     InvalidSortParameterException
 from src.application.exception.violation_exception import ViolationException
 
+# Ordenação pela relevância da busca textual completa (ts_rank)
+RELEVANCE_SORT_FIELD = "relevance"
+
+# Quantidade máxima de campos no parâmetro 'sort'
+MAX_SORT_FIELDS = 3
+
+# Campos com contagem por valor disponível em 'facets'
+FACET_FIELDS = ("state", "modality", "salesRegion")
+
 
 class OperatorRequestParams(BaseModel):
     search: Optional[str] = Field(
         default="",
         max_length=100,
-        description="Texto livre para busca entre os campos da operadora. Mínimo de 2 caracteres quando fornecido, permitindo busca por siglas de estados (UF).",
+        description="Texto livre para busca entre os campos da operadora. Mínimo de 2 caracteres quando fornecido. CNPJ, raiz do CNPJ com máscara, CEP, registro ANS (6 dígitos) e siglas de estados (UF) são buscados diretamente no campo correspondente.",
     )
     page: int = Field(
         default=1,
@@ -33,6 +47,65 @@ class OperatorRequestParams(BaseModel):
         default="asc",
         description="Direção da ordenação: 'asc' (ascendente, A-Z, 0-9) ou 'desc' (descendente, Z-A, 9-0).",
     )
+    sort: Optional[str] = Field(
+        default=None,
+        max_length=200,
+        description="Ordenação por até 3 campos, separados por vírgula; o prefixo '-' indica ordem descendente (ex.: 'state,-corporateName'). Alternativa a 'sortField' e 'sortDirection'. O id desempata as linhas com os mesmos valores.",
+    )
+    search_mode: Literal["contains", "fulltext", "fuzzy"] = Field(
+        default="contains",
+        description="Modo de busca: 'contains' procura o texto em qualquer posição de todos os campos; 'fulltext' usa busca textual em português por palavras (prefixos), com ranking de relevância; 'fuzzy' procura na razão social e no nome fantasia tolerando erros de digitação.",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        max_length=512,
+        description="Paginação por cursor (keyset). Use '*' para a primeira página e, em seguida, o valor de 'nextCursor' da resposta anterior. Quando informado, 'page' é ignorado.",
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Quando 'false', o total de itens não é calculado; use 'hasNext' para saber se existe próxima página.",
+    )
+    count_mode: Literal["exact", "estimate"] = Field(
+        default="exact",
+        description="Modo de contagem: 'exact' conta todas as operadoras encontradas; 'estimate' limita a contagem a 1000 itens e, acima disso, informa '1000+' (totalItems=1000, totalItemsExact=false e totalPages nulo).",
+    )
+    facets: Optional[str] = Field(
+        default=None,
+        max_length=100,
+        description="Campos, separados por vírgula, para os quais a resposta traz a quantidade de operadoras encontradas por valor: state, modality, salesRegion.",
+    )
+    fields: Optional[str] = Field(
+        default=None,
+        max_length=400,
+        description="Campos da operadora, separados por vírgula e em camelCase, retornados em cada item (ex.: 'operatorRegistry,corporateName,state'). Sem o parâmetro, todos os campos são retornados.",
+    )
+    state: Optional[str] = Field(
+        default=None,
+        description="Filtra pela sigla do estado (UF), ex.: 'SP'.",
+    )
+    city: Optional[str] = Field(
+        default=None,
+        max_length=100,
+        description="Filtra pela cidade, sem diferenciar maiúsculas, minúsculas e acentos.",
+    )
+    modality: Optional[str] = Field(
+        default=None,
+        max_length=100,
+        description="Filtra pela modalidade, sem diferenciar maiúsculas, minúsculas e acentos, ex.: 'Medicina de Grupo'.",
+    )
+    sales_region: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Filtra pela região de comercialização.",
+    )
+    registration_date_from: Optional[date] = Field(
+        default=None,
+        description="Filtra operadoras registradas na ANS a partir desta data (inclusive), no formato AAAA-MM-DD.",
+    )
+    registration_date_to: Optional[date] = Field(
+        default=None,
+        description="Filtra operadoras registradas na ANS até esta data (inclusive), no formato AAAA-MM-DD.",
+    )
 
     @field_validator("search")
     def validate_search_length(cls, value):
@@ -45,7 +118,7 @@ class OperatorRequestParams(BaseModel):
 
     @field_validator("sort_field")
     def validate_sort_field(cls, value):
-        if value is None:
+        if value is None or value == RELEVANCE_SORT_FIELD:
             return value
 
         from src.application.service.operator_service import OperatorService
@@ -58,6 +131,203 @@ class OperatorRequestParams(BaseModel):
             )
         return value
 
+    @field_validator("sort")
+    def validate_sort(cls, value):
+        if not value:
+            return None
+
+        from src.application.service.operator_service import OperatorService
+
+        allowed_columns = OperatorService.get_allowed_columns()
+        keys = [key.strip() for key in value.split(",")]
+        fields = [key.removeprefix("-") for key in keys]
+        if any(field not in allowed_columns for field in fields):
+            raise InvalidSortParameterException(
+                field="sort",
+                message=f"O parâmetro 'sort' deve conter apenas os campos: {', '.join(allowed_columns)}, com '-' opcional para ordem descendente.",
+            )
+        if len(set(fields)) != len(fields) or len(fields) > MAX_SORT_FIELDS:
+            raise InvalidSortParameterException(
+                field="sort",
+                message=f"O parâmetro 'sort' aceita até {MAX_SORT_FIELDS} campos, sem repetição.",
+            )
+        return ",".join(keys)
+
+    @field_validator("facets")
+    def validate_facets(cls, value):
+        if not value:
+            return None
+
+        fields = [field.strip() for field in value.split(",") if field.strip()]
+        invalid = [field for field in fields if field not in FACET_FIELDS]
+        if invalid:
+            raise ViolationException(
+                field="facets",
+                message=f"O parâmetro 'facets' deve conter apenas: {', '.join(FACET_FIELDS)}",
+            )
+        return ",".join(dict.fromkeys(fields)) or None
+
+    @field_validator("fields")
+    def validate_fields(cls, value):
+        if not value:
+            return None
+
+        requested = {field.strip() for field in value.split(",") if field.strip()}
+        invalid = sorted(requested - OPERATOR_FIELD_NAMES.keys())
+        if invalid:
+            raise ViolationException(
+                field="fields",
+                message=f"O parâmetro 'fields' deve conter apenas: {', '.join(OPERATOR_FIELD_NAMES)}",
+            )
+        # Ordem canônica: a mesma seleção gera a mesma chave de cache
+        return ",".join(field for field in OPERATOR_FIELD_NAMES if field in requested) or None
+
+    @field_validator("state")
+    def validate_state(cls, value):
+        if not value:
+            return None
+        if len(value) != 2 or not value.isalpha():
+            raise ViolationException(
+                field="state",
+                message="O parâmetro 'state' deve ser a sigla do estado com 2 letras.",
+            )
+        return value.upper()
+
+    @field_validator("city", "modality")
+    def validate_text_filter(cls, value):
+        return (value.strip() or None) if value else None
+
+    @model_validator(mode="after")
+    def validate_registration_date_range(self):
+        if (
+            self.registration_date_from
+            and self.registration_date_to
+            and self.registration_date_from > self.registration_date_to
+        ):
+            raise ViolationException(
+                field="registrationDateFrom",
+                message="O parâmetro 'registrationDateFrom' deve ser anterior ou igual a 'registrationDateTo'.",
+            )
+        return self
+
+    @field_validator("cursor")
+    def validate_cursor(cls, value):
+        if value and value != FIRST_PAGE_CURSOR:
+            PageCursor.decode(value)
+        return value or None
+
+    @model_validator(mode="after")
+    def normalize_sort(self):
+        if self.sort and self.sort_field:
+            raise InvalidSortParameterException(
+                field="sort",
+                message="Informe a ordenação em 'sort' ou em 'sortField', não em ambos.",
+            )
+        # Um único campo em 'sort' equivale a sortField/sortDirection (mesma chave de cache)
+        if self.sort and "," not in self.sort:
+            self.sort_field = self.sort.removeprefix("-")
+            self.sort_direction = "desc" if self.sort.startswith("-") else "asc"
+            self.sort = None
+        return self
+
+    @model_validator(mode="after")
+    def validate_relevance_ordering(self):
+        if self.sort_field == RELEVANCE_SORT_FIELD and not (
+            self.search_mode == "fulltext" and self.search
+        ):
+            raise InvalidSortParameterException(
+                field="sort_field",
+                message="A ordenação por 'relevance' exige 'search' com searchMode='fulltext'.",
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_cursor_ordering(self):
+        if self.cursor and self.orders_by_relevance:
+            raise InvalidCursorException(
+                "A paginação por cursor não está disponível para a ordenação por relevância."
+            )
+
+        cursor = self.decoded_cursor()
+        if cursor is not None and not cursor.matches(self.sort_field, self.sort_direction, self.sort):
+            raise InvalidCursorException(
+                "O cursor informado foi gerado para outra ordenação. Reinicie a navegação com cursor='*'."
+            )
+        if cursor is not None and self.sort and (
+            not isinstance(cursor.value, list) or len(cursor.value) != len(self.sort_keys)
+        ):
+            raise InvalidCursorException()
+        if cursor is not None:
+            from src.domain.repository.operator_repository import \
+                OperatorRepository
+
+            # Cada valor deve ter o tipo da coluna de ordenação correspondente
+            values = cursor.value if self.sort else [cursor.value]
+            for (field, _), value in zip(self.sort_keys, values):
+                column = OperatorRepository.resolve_sort_column(field)
+                if column is not None:
+                    OperatorRepository.cursor_value(column, value)
+        return self
+
+    @property
+    def orders_by_relevance(self) -> bool:
+        # Na busca textual completa, a relevância é a ordenação padrão
+        if self.sort_field == RELEVANCE_SORT_FIELD:
+            return True
+        return (
+            self.search_mode == "fulltext"
+            and bool(self.search)
+            and not self.sort_field
+            and not self.sort
+        )
+
+    @property
+    def sort_keys(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Campos de ordenação como pares (campo, direção), vindos de 'sort' ou
+        de sortField/sortDirection. Vazio sem ordenação por coluna.
+        """
+        if self.sort:
+            return tuple(
+                (key[1:], "desc") if key.startswith("-") else (key, "asc")
+                for key in self.sort.split(",")
+            )
+        if self.sort_field and self.sort_field != RELEVANCE_SORT_FIELD:
+            return ((self.sort_field, self.sort_direction),)
+        return ()
+
+    @property
+    def facet_fields(self) -> Tuple[str, ...]:
+        return tuple(self.facets.split(",")) if self.facets else ()
+
+    @property
+    def selected_fields(self) -> Tuple[str, ...]:
+        """Campos pedidos em 'fields' (camelCase); vazio quando todos são retornados."""
+        return tuple(self.fields.split(",")) if self.fields else ()
+
+    @property
+    def has_column_filters(self) -> bool:
+        return any(
+            value is not None
+            for value in (
+                self.state,
+                self.city,
+                self.modality,
+                self.sales_region,
+                self.registration_date_from,
+                self.registration_date_to,
+            )
+        )
+
+    @property
+    def uses_cursor(self) -> bool:
+        return self.cursor is not None
+
+    def decoded_cursor(self) -> Optional[PageCursor]:
+        if not self.cursor or self.cursor == FIRST_PAGE_CURSOR:
+            return None
+        return PageCursor.decode(self.cursor)
+
     model_config = {
         "from_attributes": True,
         "alias_generator": to_camel,
@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from pydantic.alias_generators import to_camel
 
+from src.application.dto.facet_count import FacetCount
+
 
 class PageableResponse(BaseModel):
     """
@@ -19,11 +21,19 @@ class PageableResponse(BaseModel):
     page_size: int = Field(
         description="Quantidade de itens por página. Valor usado na consulta."
     )
-    total_pages: int = Field(
-        description="Número total de páginas disponíveis para a consulta."
+    total_pages: Optional[int] = Field(
+        description="Número total de páginas disponíveis para a consulta. Null quando o total não foi solicitado (includeTotal=false) ou não é exato (totalItemsExact=false): a última página não é conhecida."
+    )
+    total_items: Optional[int] = Field(
+        description="Número total de operadoras encontradas para a consulta. Null quando o total não foi solicitado (includeTotal=false)."
+    )
+    total_items_exact: bool = Field(
+        default=True,
+        description="Indica se totalItems é exato. Com countMode=estimate, buscas com mais de 1000 itens informam totalItems=1000 e totalItemsExact=false ('1000+'), com totalPages nulo.",
     )
-    total_items: int = Field(
-        description="Número total de operadoras encontradas para a consulta."
+    has_next: Optional[bool] = Field(
+        default=None,
+        description="Indica se existe uma próxima página de resultados.",
     )
     search: str = Field(
         description="Texto de busca utilizado na consulta. String vazia se nenhuma busca textual foi realizada."
@@ -32,24 +42,45 @@ class PageableResponse(BaseModel):
         description="Campo utilizado para ordenação dos resultados. Null se nenhuma ordenação específica foi solicitada."
     )
     sort_direction: str = Field(description="Direção da ordenação ('asc' ou 'desc').")
+    facets: Optional[Dict[str, List[FacetCount]]] = Field(
+        default=None,
+        description="Quantidade de operadoras encontradas por valor de cada campo pedido em 'facets', em ordem decrescente de quantidade. Null quando 'facets' não foi informado.",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor opaco para buscar a próxima página na paginação por cursor. Null quando não há próxima página ou a paginação por cursor não foi solicitada.",
+    )
 
     @classmethod
     def create(
-        cls, operators: List[Dict[str, Any]], params, last_page: int
+        cls,
+        operators: List[Dict[str, Any]],
+        params,
+        total_items: Optional[int],
+        next_cursor: Optional[str] = None,
+        has_next: Optional[bool] = None,
+        total_items_exact: bool = True,
+        facets: Optional[Dict[str, List[FacetCount]]] = None,
     ) -> "PageableResponse":
-        total_items = (
-            (last_page - 1) * params.page_size + len(operators) if operators else 0
-        )
+        # Com a contagem limitada (countMode=estimate), o total de páginas
+        # apontaria uma última página que não existe
+        total_pages = None
+        if total_items is not None and total_items_exact:
+            total_pages = max(1, (total_items + params.page_size - 1) // params.page_size)
 
         return cls(
             data=operators,
             page=params.page,
             page_size=params.page_size,
-            total_pages=last_page,
+            total_pages=total_pages,
             total_items=total_items,
+            total_items_exact=total_items_exact,
+            has_next=has_next,
+            facets=facets,
             search=params.search,
             sort_field=params.sort_field,
             sort_direction=params.sort_direction,
+            next_cursor=next_cursor,
         )
 
     model_config = {
@@ -80,6 +111,8 @@ class PageableResponse(BaseModel):
                 "page_size": 10,
                 "total_pages": 1,
                 "total_items": 1,
+                "total_items_exact": True,
+                "has_next": False,
                 "search": "amil",
                 "sort_field": "corporate_name",
                 "sort_direction": "asc",
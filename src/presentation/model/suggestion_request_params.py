@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field, field_validator
+from pydantic.alias_generators import to_camel
+
+from src.application.exception.violation_exception import ViolationException
+
+
+class SuggestionRequestParams(BaseModel):
+    search: str = Field(
+        max_length=100,
+        description="Início do nome (razão social ou nome fantasia) ou do registro ANS da operadora. Mínimo de 2 caracteres.",
+    )
+    limit: int = Field(
+        default=10,
+        gt=0,
+        le=20,
+        description="Quantidade máxima de sugestões (entre 1 e 20).",
+    )
+
+    @field_validator("search")
+    def validate_search_length(cls, value):
+        if len(value.strip()) < 2:
+            raise ViolationException(
+                field="search",
+                message="O parâmetro 'search' deve ter pelo menos 2 caracteres.",
+            )
+        return value
+
+    model_config = {
+        "alias_generator": to_camel,
+        "populate_by_name": True,
+        "json_schema_extra": {"example": {"search": "unim", "limit": 10}},
+    }
@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+from pydantic.alias_generators import to_camel
+
+
+class Suggestion(BaseModel):
+    name: str = Field(description="Nome fantasia ou razão social da operadora.")
+    operator_registry: Optional[str] = Field(description="Registro ANS da operadora.")
+
+    model_config = {"alias_generator": to_camel, "populate_by_name": True}
+
+
+class SuggestionResponse(BaseModel):
+    """
+    Resposta do autocompletar de operadoras: apenas nome e registro ANS, para
+    manter a resposta pequena a cada tecla digitada.
+    """
+
+    suggestions: List[Suggestion] = Field(
+        description="Sugestões em ordem alfabética do nome normalizado."
+    )
+
+    model_config = {
+        "alias_generator": to_camel,
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "suggestions": [
+                    {"name": "UNIMED CAMPINAS", "operatorRegistry": "335690"},
+                ]
+            }
+        },
+    }
@@ -21,3 +21,11 @@ def sort():
 
 def lint():
     os.system("flake8 .")
+
+
+def migrate():
+    from src.infra.database import engine
+    from src.infra.database.migrations import apply_migrations
+
+    applied = apply_migrations(engine)
+    print(f"Migrações aplicadas: {', '.join(applied) if applied else 'nenhuma'}")
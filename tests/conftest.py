@@ -1,5 +1,10 @@
 import os
+import shutil
+import socket
+import subprocess
 import sys
+from datetime import date
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,7 +14,12 @@ from fastapi.testclient import TestClient
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from limits.storage import MemoryStorage
+from sqlalchemy import create_engine, text
 
+from src.domain.model.operator import Base
+from src.infra.database import statement_cache
+from src.infra.database.migrations import apply_migrations
+from src.infra.search.operator_snapshot import OperatorSnapshot
 from src.presentation.main import create_application
 
 # Configuração de ambiente para testes
@@ -17,9 +27,26 @@ os.environ["ENV"] = "test"
 os.environ["RATE_LIMIT"] = "10"
 os.environ["RATE_WINDOW"] = "10"
 
+# Postgres descartável para testes de consultas reais (o schema cadop é recriado).
+# Sem TEST_DATABASE_URL, um cluster temporário é criado com initdb/pg_ctl do
+# PATH (ou do diretório PG_BIN), quando disponíveis.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+SYNTHETIC_ROWS = int(os.getenv("TEST_DATABASE_ROWS", "5000"))
+
 # Fixtures comuns para os testes
 
 
+@pytest.fixture(autouse=True)
+def clear_statement_cache():
+    """
+    As instruções em cache guardam os valores da requisição que as
+    construiu; os testes que inspecionam a instrução executada partem de
+    um cache vazio
+    """
+    statement_cache.clear()
+    yield
+
+
 @pytest.fixture
 def test_app():
     """Fornece uma instância da aplicação para testes"""
@@ -161,6 +188,37 @@ def sample_operators():
     ]
 
 
+@pytest.fixture
+def snapshot_rows(sample_operators):
+    """
+    Fábrica das linhas lidas do banco para montar um OperatorSnapshot. Sem
+    argumentos, uma linha por operadora de exemplo; cada dicionário passado
+    gera uma linha a partir da primeira operadora, com os campos alterados
+    e um registro ANS próprio (a tabela não admite registros repetidos)
+    """
+
+    def build(*overrides):
+        if not overrides:
+            rows = [dict(operator) for operator in sample_operators]
+        else:
+            rows = [
+                {**sample_operators[0], "operator_registry": f"{index + 1:06d}", **changes}
+                for index, changes in enumerate(overrides)
+            ]
+        return [
+            SimpleNamespace(**{"registration_date": date(2020, 1, 1), **row, "id": index + 1})
+            for index, row in enumerate(rows)
+        ]
+
+    return build
+
+
+@pytest.fixture
+def snapshot(snapshot_rows):
+    """Snapshot em memória com as operadoras de exemplo"""
+    return OperatorSnapshot(snapshot_rows())
+
+
 @pytest.fixture
 def paginated_operators_response(sample_operators):
     """Fornece uma resposta paginada de operadoras para testes"""
@@ -174,3 +232,107 @@ def paginated_operators_response(sample_operators):
         "sortField": None,
         "sortDirection": "asc",
     }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def postgres_url(tmp_path_factory):
+    """URL do Postgres de testes: TEST_DATABASE_URL ou um cluster local temporário"""
+    if TEST_DATABASE_URL:
+        yield TEST_DATABASE_URL
+        return
+
+    bin_dir = os.getenv("PG_BIN")
+    initdb = shutil.which("initdb", path=bin_dir)
+    pg_ctl = shutil.which("pg_ctl", path=bin_dir)
+    if not initdb or not pg_ctl:
+        pytest.skip(
+            "Requer TEST_DATABASE_URL apontando para um Postgres descartável "
+            "ou initdb/pg_ctl no PATH (ou em PG_BIN)"
+        )
+
+    data_dir = tmp_path_factory.mktemp("pgdata")
+    port = free_port()
+    subprocess.run(
+        [initdb, "-D", str(data_dir), "-U", "postgres", "-A", "trust", "-E", "UTF8", "--no-sync"],
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(
+        [
+            pg_ctl, "-D", str(data_dir), "-w", "-l", str(data_dir / "server.log"),
+            "-o", f"-p {port} -k {data_dir} -c listen_addresses=localhost -c fsync=off",
+            "start",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    try:
+        yield f"postgresql://postgres@localhost:{port}/postgres"
+    finally:
+        subprocess.run(
+            [pg_ctl, "-D", str(data_dir), "-m", "immediate", "stop"], capture_output=True
+        )
+
+
+@pytest.fixture(scope="session")
+def postgres_engine(postgres_url):
+    """Cria o schema cadop com dados sintéticos e aplica as migrações"""
+    engine = create_engine(postgres_url)
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA IF EXISTS cadop CASCADE"))
+        connection.execute(text("CREATE SCHEMA cadop"))
+
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO cadop.cadastro_operadoras (
+                    registro_operadora, cnpj, razao_social, nome_fantasia, modalidade,
+                    logradouro, numero, complemento, bairro, cidade, uf, cep, ddd,
+                    telefone, fax, endereco_eletronico, representante,
+                    cargo_representante, regiao_de_comercializacao, data_registro_ans
+                )
+                SELECT
+                    lpad(i::text, 6, '0'),
+                    lpad((i * 7919)::text, 14, '0'),
+                    'OPERADORA ' || upper(md5(i::text)) || ' LTDA',
+                    CASE WHEN i % 11 = 0 THEN NULL
+                         ELSE 'SAÚDE ' || upper(substr(md5((i * 3)::text), 1, 8)) END,
+                    (ARRAY['Medicina de Grupo', 'Cooperativa Médica', 'Autogestão'])[1 + i % 3],
+                    'Rua ' || substr(md5((i * 5)::text), 1, 10),
+                    (i % 999)::text,
+                    CASE WHEN i % 4 = 0 THEN 'Sala ' || (i % 30)::text || '%' END,
+                    'Bairro ' || (i % 200)::text,
+                    (ARRAY['São Paulo', 'Rio de Janeiro', 'Belo Horizonte', 'Curitiba', 'Salvador'])[1 + i % 5],
+                    (ARRAY['SP', 'RJ', 'MG', 'PR', 'BA'])[1 + i % 5],
+                    lpad((i * 13)::text, 8, '0'),
+                    lpad((11 + i % 80)::text, 2, '0'),
+                    lpad((i * 17)::text, 8, '0'),
+                    NULL,
+                    'contato_' || i::text || '@operadora.com.br',
+                    'Representante ' || i::text,
+                    'Diretor',
+                    1 + i % 6,
+                    DATE '2000-01-01' + (i % 8000)
+                FROM generate_series(1, :rows) AS i
+                """
+            ),
+            {"rows": SYNTHETIC_ROWS},
+        )
+
+    apply_migrations(engine)
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE cadop.cadastro_operadoras"))
+
+    yield engine
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA IF EXISTS cadop CASCADE"))
+    engine.dispose()
@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiocache import SimpleMemoryCache
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.application.dto.operator_page import OperatorPage
+from src.application.service import operator_service as service_module
+from src.application.service.operator_service import OperatorService
+from src.domain.repository.async_operator_repository import \
+    AsyncOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.database import async_database_url
+from src.presentation.model.operator_batch_request import OperatorBatchRequest
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+@pytest.fixture
+def async_service(monkeypatch):
+    """Serviço sobre uma AsyncSession, com caches vazios e sem executor"""
+    monkeypatch.setattr(service_module, "SEARCH_ENGINE", "database")
+    monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", None)
+    monkeypatch.setattr(OperatorService.find_all_cached, "cache", SimpleMemoryCache())
+    monkeypatch.setattr(OperatorService.find_by_registry_cached, "cache", SimpleMemoryCache())
+
+    async def no_executor(*args, **kwargs):
+        raise AssertionError("O caminho assíncrono não deve usar o executor")
+
+    monkeypatch.setattr(service_module.database_executor, "run", no_executor)
+    return OperatorService(MagicMock(spec=AsyncSession))
+
+
+class TestAsyncDatabaseConfig:
+    """Testes da configuração do driver assíncrono"""
+
+    def test_url_uses_asyncpg(self):
+        assert async_database_url("postgresql://user:secret@db:5432/operators_db") == (
+            "postgresql+asyncpg://user:secret@db:5432/operators_db"
+        )
+
+    def test_service_picks_repository_from_session(self):
+        assert type(OperatorService(MagicMock(spec=AsyncSession)).repository) is AsyncOperatorRepository
+        assert type(OperatorService(MagicMock(spec=Session)).repository) is OperatorRepository
+
+
+class TestAsyncService:
+    """Testes do serviço com o repositório assíncrono"""
+
+    @pytest.mark.asyncio
+    async def test_search_is_awaited_in_the_event_loop(self, async_service):
+        page = OperatorPage(operators=[], total_items=0, next_cursor=None)
+        async_service.repository.search_operators = AsyncMock(return_value=page)
+
+        response = await async_service.find_all_cached(OperatorRequestParams(search="unimed"))
+
+        assert response["data"] == []
+        assert response["total_items"] == 0
+        async_service.repository.search_operators.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_is_awaited(self, async_service, sample_operators):
+        operator = SimpleNamespace(
+            model_dump=lambda by_alias: {"operatorRegistry": "123456"},
+            operator_registry="123456",
+            cnpj=sample_operators[0]["cnpj"],
+        )
+        async_service.repository.find_by_identifiers = AsyncMock(return_value=[operator])
+
+        response = await async_service.find_by_identifiers_cached(
+            OperatorBatchRequest(identifiers=["123456", "12.345.678/0001-00", "654321"])
+        )
+
+        assert response["data"]["12.345.678/0001-00"] == {"operatorRegistry": "123456"}
+        assert response["notFound"] == ["654321"]
+        async_service.repository.find_by_identifiers.assert_awaited_once_with(
+            ["12345678000100"], ["123456", "654321"]
+        )
+
+
+# Formas de consulta comparadas entre os dois drivers
+PARITY_PARAMS = [
+    {"page_size": 7},
+    {"search": "saúde 1", "sort_field": "tradeName", "sort_direction": "desc"},
+    {"search": "00.000.000/0079-19"},
+    {"search": "c4ca", "search_mode": "fulltext"},
+    {"state": "SP", "modality": "autogestao", "count_mode": "estimate", "page": 3},
+    {"sort": "state,-corporateName", "cursor": "*", "page_size": 5},
+    {"sort_field": "tradeName", "cursor": "*", "facets": "modality,state"},
+    {"registration_date_from": "2001-01-01", "fields": "cnpj,city", "page": 999},
+]
+
+
+class TestAsyncRepositoryParity:
+    """O repositório assíncrono (asyncpg) responde o mesmo que o síncrono"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("values", PARITY_PARAMS)
+    async def test_same_page_as_sync_repository(self, postgres_engine, postgres_url, values):
+        pytest.importorskip("asyncpg")
+        params = OperatorRequestParams(**values)
+        with Session(postgres_engine) as session:
+            expected = OperatorRepository(session).search_operators(params)
+            follow = None
+            if expected.next_cursor:
+                follow = OperatorRequestParams(**{**values, "cursor": expected.next_cursor})
+                expected_next = OperatorRepository(session).search_operators(follow)
+
+        engine = create_async_engine(async_database_url(postgres_url))
+        try:
+            async with AsyncSession(engine) as session:
+                repository = AsyncOperatorRepository(session)
+                page = await repository.search_operators(params)
+                assert page.model_dump() == expected.model_dump()
+                if follow is not None:
+                    assert (await repository.search_operators(follow)).model_dump() == (
+                        expected_next.model_dump()
+                    )
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_lookups(self, postgres_engine, postgres_url):
+        pytest.importorskip("asyncpg")
+        engine = create_async_engine(async_database_url(postgres_url))
+        try:
+            async with AsyncSession(engine) as session:
+                repository = AsyncOperatorRepository(session)
+                operator = await repository.find_by_registry("000042")
+                found = await repository.find_by_identifiers([operator.cnpj], ["000043"])
+
+                assert operator.operator_registry == "000042"
+                assert await repository.find_by_registry("999999") is None
+                assert {item.operator_registry for item in found} == {"000042", "000043"}
+        finally:
+            await engine.dispose()
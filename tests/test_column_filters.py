@@ -0,0 +1,123 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.application.exception.violation_exception import ViolationException
+from src.domain.model.operator import Operator
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.search.operator_snapshot import OperatorSnapshot
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+@pytest.fixture
+def repository(snapshot_rows):
+    rows = [
+        ("SP", "São Paulo", "Medicina de Grupo", 1, date(2001, 3, 1)),
+        ("SP", "Campinas", "Cooperativa Médica", 2, date(2005, 7, 1)),
+        ("RJ", "Rio de Janeiro", "Medicina de Grupo", 1, date(2010, 1, 1)),
+        (None, None, None, None, date(2015, 1, 1)),
+    ]
+    return InMemoryOperatorRepository(
+        OperatorSnapshot(
+            snapshot_rows(
+                *(
+                    {
+                        "state": state,
+                        "city": city,
+                        "modality": modality,
+                        "sales_region": sales_region,
+                        "registration_date": registration_date,
+                    }
+                    for state, city, modality, sales_region, registration_date in rows
+                )
+            )
+        )
+    )
+
+
+def registries(page):
+    return [operator.operator_registry for operator in page.operators]
+
+
+class TestColumnFilterParams:
+    """Testes de validação dos filtros por campo"""
+
+    def test_state_is_uppercased(self):
+        assert OperatorRequestParams(state="sp").state == "SP"
+
+    def test_invalid_state(self):
+        with pytest.raises(ViolationException):
+            OperatorRequestParams(state="São Paulo")
+
+    def test_inverted_date_range(self, client):
+        response = client.get(
+            "/api/v1/operators?registrationDateFrom=2020-01-01&registrationDateTo=2019-01-01"
+        )
+
+        assert response.status_code == 422
+        assert "registrationDateFrom" in response.text
+
+
+class TestDatabaseColumnFilters:
+    """Testes dos predicados gerados para o banco"""
+
+    def test_filters_are_anded_with_search(self):
+        params = OperatorRequestParams(
+            search="saude",
+            state="sp",
+            modality="Medicina de Grupo",
+            sales_region=1,
+            registration_date_from=date(2000, 1, 1),
+        )
+        statement = OperatorRepository.apply_filters(select(Operator), params)
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "upper(cadop.cadastro_operadoras.uf) = " in sql
+        assert "lower(cadop.immutable_unaccent(cadop.cadastro_operadoras.modalidade)) = " in sql
+        assert "cadop.cadastro_operadoras.regiao_de_comercializacao = " in sql
+        assert "cadop.cadastro_operadoras.data_registro_ans >= " in sql
+        assert "search_document LIKE" in sql
+        assert " OR " not in sql
+
+    def test_no_filters_by_default(self):
+        statement = OperatorRepository.apply_column_filters(select(Operator), OperatorRequestParams())
+
+        assert "WHERE" not in str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestInMemoryColumnFilters:
+    """Testes dos filtros por campo sobre o snapshot"""
+
+    def test_state_and_modality(self, repository):
+        page = repository.search_operators(
+            OperatorRequestParams(state="SP", modality="medicina de grupo")
+        )
+
+        assert registries(page) == ["000001"]
+
+    def test_city_ignores_accents(self, repository):
+        page = repository.search_operators(OperatorRequestParams(city="sao paulo"))
+
+        assert registries(page) == ["000001"]
+
+    def test_registration_date_range_is_inclusive(self, repository):
+        page = repository.search_operators(
+            OperatorRequestParams(
+                registration_date_from=date(2005, 7, 1), registration_date_to=date(2010, 1, 1)
+            )
+        )
+
+        assert registries(page) == ["000002", "000003"]
+
+    def test_facets_follow_filters(self, repository):
+        page = repository.search_operators(
+            OperatorRequestParams(sales_region=1, facets="state")
+        )
+
+        assert page.total_items == 2
+        assert [(facet.value, facet.count) for facet in page.facets["state"]] == [("RJ", 1), ("SP", 1)]
@@ -0,0 +1,136 @@
+from datetime import date
+
+import pytest
+from fastapi import status
+
+from src.application.dto.page_cursor import PageCursor
+from src.application.exception.invalid_cursor_exception import \
+    InvalidCursorException
+
+
+class TestPageCursor:
+    """Testes para a codificação do cursor de paginação"""
+
+    def test_cursor_round_trip(self):
+        """O cursor codificado deve ser decodificado para os mesmos valores"""
+        cursor = PageCursor(
+            sort_field="registrationDate",
+            sort_direction="desc",
+            value=date(2020, 1, 31),
+            id=42,
+        )
+
+        decoded = PageCursor.decode(cursor.encode())
+
+        assert decoded.sort_field == "registrationDate"
+        assert decoded.sort_direction == "desc"
+        assert decoded.value == "2020-01-31"
+        assert decoded.id == 42
+
+    def test_cursor_is_url_safe(self):
+        """O token não deve conter caracteres que exijam escape na URL"""
+        token = PageCursor(sort_field="city", value="São Paulo/SP+", id=1).encode()
+
+        assert all(char.isalnum() or char in "-_" for char in token)
+
+    @pytest.mark.parametrize("token", ["abc", "!!!", "W10", "WzEsMl0"])
+    def test_invalid_cursor_raises_violation(self, token):
+        """Tokens malformados devem gerar violação no parâmetro cursor"""
+        with pytest.raises(InvalidCursorException) as error:
+            PageCursor.decode(token)
+
+        assert error.value.violation.name == "cursor"
+
+
+class TestCursorEndpoint:
+    """Testes do parâmetro cursor no endpoint de operadoras"""
+
+    def test_first_page_cursor_is_forwarded(
+        self, client, mock_operator_service, paginated_operators_response
+    ):
+        """O marcador '*' deve iniciar a paginação por cursor"""
+        mock_operator_service.find_all_cached.return_value = {
+            **paginated_operators_response,
+            "nextCursor": "abc",
+        }
+
+        response = client.get("/api/v1/operators?cursor=*&sortField=city")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["nextCursor"] == "abc"
+        params = mock_operator_service.find_all_cached.call_args[0][0]
+        assert params.uses_cursor
+        assert params.decoded_cursor() is None
+
+    def test_invalid_cursor_returns_422(self, client):
+        """Um cursor malformado deve ser rejeitado com violação"""
+        response = client.get("/api/v1/operators?cursor=invalido")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert any(
+            violation["name"] == "cursor" for violation in response.json()["violations"]
+        )
+
+    def test_cursor_from_other_ordering_returns_422(self, client):
+        """Um cursor gerado para outra ordenação não pode ser reaproveitado"""
+        token = PageCursor(sort_field="city", sort_direction="asc", value="x", id=1).encode()
+
+        response = client.get(f"/api/v1/operators?cursor={token}&sortField=state")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+    @pytest.mark.parametrize(
+        "query, cursor",
+        [
+            ("sortField=corporateName", {"sort_field": "corporateName", "value": {"a": 1}}),
+            ("sortField=corporateName", {"sort_field": "corporateName", "value": ["x"]}),
+            ("sortField=corporateName", {"sort_field": "corporateName", "value": 5}),
+            ("sortField=registrationDate", {"sort_field": "registrationDate", "value": "ontem"}),
+            ("sortField=registrationDate", {"sort_field": "registrationDate", "value": {"a": 1}}),
+            ("sort=state,-corporateName", {"sort": "state,-corporateName", "value": ["SP", {"a": 1}]}),
+            ("sort=state,registrationDate", {"sort": "state,registrationDate", "value": [["SP"], "2020-01-01"]}),
+        ],
+    )
+    def test_cursor_value_of_wrong_type_returns_422(self, client, query, cursor):
+        """Um cursor adulterado com valor incompatível com a coluna não chega ao banco"""
+        token = PageCursor(id=5, **cursor).encode()
+
+        response = client.get(f"/api/v1/operators?cursor={token}&{query}")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["violations"][0]["name"] == "cursor"
+
+
+class TestRelevanceSortValidation:
+    """Testes de validação da ordenação por relevância"""
+
+    def test_relevance_requires_fulltext_search(self, client):
+        """sortField=relevance só é válido na busca textual completa"""
+        response = client.get("/api/v1/operators?search=unimed&sortField=relevance")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["violations"][0]["name"] == "sort_field"
+
+    def test_relevance_accepted_with_fulltext(
+        self, client, mock_operator_service, paginated_operators_response
+    ):
+        """Com searchMode=fulltext, a ordenação por relevância é aceita"""
+        mock_operator_service.find_all_cached.return_value = (
+            paginated_operators_response
+        )
+
+        response = client.get(
+            "/api/v1/operators?search=unimed&searchMode=fulltext&sortField=relevance"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_relevance_does_not_support_cursor(self, client):
+        """A paginação por cursor não se aplica ao ranking de relevância"""
+        response = client.get(
+            "/api/v1/operators?search=unimed&searchMode=fulltext&cursor=*"
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["violations"][0]["name"] == "cursor"
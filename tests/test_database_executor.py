@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from aiocache import SimpleMemoryCache
+
+from src.application.exception.database_busy_exception import \
+    DatabaseBusyException
+from src.application.service import operator_service as service_module
+from src.application.service.operator_service import OperatorService
+from src.infra.database.database_executor import DatabaseExecutor
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def blocking_job(started: threading.Event, release: threading.Event):
+    started.set()
+    release.wait(5)
+    return "done"
+
+
+async def wait_until(condition, timeout: float = 2):
+    for _ in range(int(timeout / 0.005)):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("Condição não atingida")
+
+
+class TestDatabaseExecutor:
+    """Testes do executor dedicado às consultas do banco"""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_named_threads(self):
+        executor = DatabaseExecutor(2, 1, name="database-test")
+
+        name = await executor.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("database-test")
+        assert executor.stats()["completed"] == 1
+        assert executor.stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_queue_timeout(self):
+        executor = DatabaseExecutor(1, 0.05)
+        started, release = threading.Event(), threading.Event()
+        running = asyncio.ensure_future(executor.run(blocking_job, started, release))
+        await wait_until(started.is_set)
+
+        with pytest.raises(DatabaseBusyException):
+            await executor.run(lambda: "never")
+
+        stats = executor.stats()
+        assert (stats["active"], stats["queued"], stats["rejected"]) == (1, 0, 1)
+        release.set()
+        assert await running == "done"
+        assert await executor.run(lambda: "after") == "after"
+
+    @pytest.mark.asyncio
+    async def test_queued_request_runs_when_a_worker_frees(self):
+        executor = DatabaseExecutor(1, 2)
+        started, release = threading.Event(), threading.Event()
+        running = asyncio.ensure_future(executor.run(blocking_job, started, release))
+        await wait_until(started.is_set)
+
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await wait_until(lambda: executor.stats()["queued"] == 1)
+        release.set()
+
+        assert await asyncio.gather(running, queued) == ["done", "queued"]
+        stats = executor.stats()
+        assert (stats["active"], stats["queued"], stats["completed"]) == (0, 0, 2)
+        assert stats["maxWaitMs"] > 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_keeps_worker_until_the_thread_finishes(self):
+        executor = DatabaseExecutor(1, 2)
+        started, release = threading.Event(), threading.Event()
+        running = asyncio.ensure_future(executor.run(blocking_job, started, release))
+        await wait_until(started.is_set)
+
+        running.cancel()
+        await asyncio.sleep(0.01)
+        assert executor.stats()["active"] == 1
+
+        release.set()
+        await wait_until(lambda: executor.stats()["active"] == 0)
+
+
+    @pytest.mark.asyncio
+    async def test_admission_follows_current_capacity(self):
+        """Com menos conexões disponíveis (réplicas removidas), menos tarefas são admitidas"""
+        capacity = {"connections": 1}
+        executor = DatabaseExecutor(3, 2, capacity=lambda: capacity["connections"])
+        started, release = threading.Event(), threading.Event()
+        running = asyncio.ensure_future(executor.run(blocking_job, started, release))
+        await wait_until(started.is_set)
+
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await wait_until(lambda: executor.stats()["queued"] == 1)
+        assert executor.stats()["limit"] == 1
+
+        capacity["connections"] = 3
+        release.set()
+        assert await asyncio.gather(running, queued) == ["done", "queued"]
+        assert executor.stats()["limit"] == 3
+
+
+    @pytest.mark.asyncio
+    async def test_reserved_connection_is_not_offered_to_tasks(self):
+        """Uma conexão usada fora do executor (exportação, snapshot) reduz as tarefas admitidas"""
+        executor = DatabaseExecutor(1, 2)
+
+        with executor.reserve():
+            assert executor.limit() == 0
+            queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+            await wait_until(lambda: executor.stats()["queued"] == 1)
+
+        assert await queued == "queued"
+        assert executor.stats()["reserved"] == 0
+
+
+class TestMemoryEngineAdmission:
+    """Buscas respondidas pelo snapshot não disputam as vagas do executor"""
+
+    @pytest.mark.asyncio
+    async def test_memory_search_skips_the_executor(self, snapshot, monkeypatch):
+        # Executor sem vagas: qualquer tarefa seria recusada com 503
+        executor = DatabaseExecutor(1, 0.01)
+        monkeypatch.setattr(service_module, "database_executor", executor)
+        monkeypatch.setattr(service_module, "SEARCH_ENGINE", "memory")
+        monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", snapshot)
+        monkeypatch.setattr(OperatorService.find_all_cached, "cache", SimpleMemoryCache())
+        session = MagicMock()
+
+        with executor.reserve():
+            response = await OperatorService(session).find_all_cached(
+                OperatorRequestParams(search="12.345.678/0001-00")
+            )
+
+        assert [operator["operatorRegistry"] for operator in response["data"]] == ["123456"]
+        assert executor.stats()["completed"] == 0
+        assert executor.stats()["rejected"] == 0
+        session.execute.assert_not_called()
+
+
+class TestDatabaseBusyResponse:
+    """Testes da resposta 503 e das métricas no health check"""
+
+    def test_busy_database_returns_503(self, client, mock_operator_service):
+        mock_operator_service.find_all_cached.side_effect = DatabaseBusyException(2)
+
+        response = client.get("/api/v1/operators")
+
+        assert response.status_code == 503
+        assert response.json()["type"].endswith("/servico-indisponivel")
+        assert response.headers["Retry-After"] == "1"
+
+    def test_health_reports_executor_stats(self, client):
+        response = client.get("/api/v1/health")
+
+        stats = response.json()["databaseExecutor"]
+        assert {"workers", "active", "queued", "rejected", "averageWaitMs"} <= set(stats)
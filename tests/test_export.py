@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.service import operator_service as service_module
+from src.application.service.operator_export_service import (
+    CSV_COLUMNS, OperatorExportService, encode_csv, encode_ndjson)
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.database.database_executor import DatabaseExecutor
+from src.infra.search.operator_snapshot import OperatorSnapshot
+from src.presentation.api.routes import get_export_service
+from src.presentation.model.operator_export_params import OperatorExportParams
+
+
+@pytest.fixture
+def snapshot(sample_operators, snapshot_rows):
+    """Três linhas por operadora de exemplo, para a leitura em mais de um lote"""
+    return OperatorSnapshot(
+        snapshot_rows(
+            *(
+                {**operator, "operator_registry": f"{operator['operator_registry']}{copy}"}
+                for copy in range(3)
+                for operator in sample_operators
+            )
+        )
+    )
+
+
+@pytest.fixture
+def memory_engine(snapshot, monkeypatch):
+    monkeypatch.setattr(service_module, "SEARCH_ENGINE", "memory")
+    monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", snapshot)
+
+
+@pytest.fixture
+def export_client(client, memory_engine):
+    """Cliente com a exportação servida pelo snapshot, sem sessão real"""
+    session = MagicMock()
+    client.app.dependency_overrides[get_export_service] = lambda: OperatorExportService(
+        lambda: session
+    )
+    yield client, session
+    client.app.dependency_overrides.pop(get_export_service, None)
+
+
+class TestExportEncoders:
+    """Testes dos formatos de exportação"""
+
+    def test_ndjson_has_one_object_per_line(self, snapshot):
+        lines = "".join(encode_ndjson([snapshot.operators[:2], snapshot.operators[2:3]])).splitlines()
+
+        assert len(lines) == 3
+        assert json.loads(lines[1])["corporateName"] == "OPERADORA TESTE 2 LTDA"
+        assert json.loads(lines[0])["registrationDate"] == "2020-01-01"
+
+    def test_csv_has_camel_case_header(self, snapshot):
+        content = "".join(encode_csv([snapshot.operators[:2]]))
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        assert list(rows[0]) == CSV_COLUMNS
+        assert rows[1]["operatorRegistry"] == "6543210"
+        assert rows[1]["complement"] == ""
+
+    def test_csv_without_rows_has_only_header(self):
+        assert "".join(encode_csv([])) == ",".join(CSV_COLUMNS) + "\n"
+
+
+class TestExportStreaming:
+    """Testes da leitura em lotes"""
+
+    def test_in_memory_stream_follows_filters_and_order(self, snapshot):
+        repository = InMemoryOperatorRepository(snapshot)
+        params = OperatorExportParams(
+            search="teste 1", sort_field="corporateName", sort_direction="desc"
+        )
+
+        batches = list(repository.stream_operators(params, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert all(operator.trade_name == "OPERADORA TESTE 1" for batch in batches for operator in batch)
+
+    def test_database_stream_uses_server_side_cursor(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.partitions.return_value = iter([])
+
+        list(OperatorRepository(session).stream_operators(OperatorExportParams(), batch_size=500))
+
+        statement = session.execute.call_args.args[0]
+        assert statement.get_execution_options()["yield_per"] == 500
+        assert "ORDER BY cadop.cadastro_operadoras.id" in str(statement)
+
+    def test_session_is_closed_after_streaming(self, memory_engine):
+        session = MagicMock()
+
+        list(OperatorExportService(lambda: session).stream(OperatorExportParams()))
+
+        session.close.assert_called_once()
+
+    def test_connection_is_reserved_while_streaming(self, memory_engine):
+        """A conexão da exportação é descontada das tarefas admitidas pelo executor"""
+        executor = DatabaseExecutor(4, 1)
+        stream = OperatorExportService(MagicMock, executor.reserve).stream(OperatorExportParams())
+
+        next(stream)
+        assert executor.stats()["reserved"] == 1
+        assert executor.limit() == 3
+
+        # O cliente desiste no meio do envio: o gerador é fechado
+        stream.close()
+        assert executor.stats()["reserved"] == 0
+
+
+class TestExportEndpoint:
+    """Testes para o endpoint /api/v1/operators/export"""
+
+    def test_ndjson_export_returns_every_match(self, export_client):
+        client, _ = export_client
+
+        response = client.get("/api/v1/operators/export?search=teste%202&pageSize=1")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="operadoras.ndjson"' in response.headers["content-disposition"]
+        assert len(response.text.splitlines()) == 3
+
+    def test_csv_export(self, export_client):
+        client, session = export_client
+
+        response = client.get("/api/v1/operators/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert len(response.text.splitlines()) == 7
+        session.close.assert_called_once()
+
+    def test_invalid_format(self, export_client):
+        client, _ = export_client
+
+        response = client.get("/api/v1/operators/export?format=xml")
+
+        assert response.status_code == 422
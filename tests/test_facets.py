@@ -0,0 +1,134 @@
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.domain.model.operator import Operator
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.search.operator_snapshot import OperatorSnapshot
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+FacetRow = namedtuple("FacetRow", ["state", "modality", "facet_grouping", "facet_count"])
+
+
+@pytest.fixture
+def snapshot(snapshot_rows):
+    rows = [
+        ("SP", "Medicina de Grupo", 1, "SAÚDE PAULISTA"),
+        ("SP", "Cooperativa Médica", 2, "UNIMED PAULISTA"),
+        ("RJ", "Medicina de Grupo", 1, "SAÚDE CARIOCA"),
+        ("MG", "Cooperativa Médica", None, "UNIMED MINEIRA"),
+        (None, "Autogestão", 3, "CAIXA SAÚDE"),
+    ]
+    return OperatorSnapshot(
+        snapshot_rows(
+            *(
+                {
+                    "state": state,
+                    "modality": modality,
+                    "sales_region": sales_region,
+                    "corporate_name": name,
+                    "trade_name": name,
+                }
+                for state, modality, sales_region, name in rows
+            )
+        )
+    )
+
+
+def as_pairs(facets):
+    return {field: [(facet.value, facet.count) for facet in values] for field, values in facets.items()}
+
+
+class TestFacetParams:
+    """Testes de validação do parâmetro facets"""
+
+    def test_parses_and_deduplicates_fields(self):
+        params = OperatorRequestParams(facets="state, modality,state")
+
+        assert params.facet_fields == ("state", "modality")
+
+    def test_rejects_unknown_fields(self, client):
+        response = client.get("/api/v1/operators?facets=state,cnpj")
+
+        assert response.status_code == 422
+        assert "facets" in response.text
+
+
+class TestDatabaseFacets:
+    """Testes das contagens por valor calculadas no banco"""
+
+    def test_single_grouped_statement(self):
+        """Todas as contagens vêm de uma consulta com GROUPING SETS sobre o mesmo filtro"""
+        statement = OperatorRepository.facet_statement(
+            OperatorRequestParams(search="saude", facets="state,modality")
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "GROUP BY GROUPING SETS((cadop.cadastro_operadoras.uf), (cadop.cadastro_operadoras.modalidade))" in sql
+        assert "search_document LIKE" in sql
+
+    def test_rows_are_assigned_by_grouping(self):
+        """Nulos de um campo não se confundem com as linhas do outro conjunto"""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            FacetRow("SP", None, 1, 2),
+            FacetRow(None, None, 1, 1),
+            FacetRow("RJ", None, 1, 3),
+            FacetRow(None, "Autogestão", 2, 4),
+            FacetRow(None, "Medicina de Grupo", 2, 2),
+        ]
+
+        facets = OperatorRepository(session).search_facets(
+            OperatorRequestParams(facets="state,modality")
+        )
+
+        assert as_pairs(facets) == {
+            "state": [("RJ", 3), ("SP", 2), (None, 1)],
+            "modality": [("Autogestão", 4), ("Medicina de Grupo", 2)],
+        }
+
+    def test_same_counts_as_group_by(self, postgres_engine):
+        with Session(postgres_engine) as session:
+            params = OperatorRequestParams(search="saude", facets="state,salesRegion")
+            facets = OperatorRepository(session).search_facets(params)
+
+            for field, column in (("state", Operator.state), ("salesRegion", Operator.sales_region)):
+                statement = OperatorRepository.apply_search_filter(
+                    select(column, func.count()).group_by(column), params.search
+                )
+                expected = dict(session.execute(statement).all())
+                assert {facet.value: facet.count for facet in facets[field]} == expected
+
+
+class TestInMemoryFacets:
+    """Testes das contagens por valor sobre o snapshot"""
+
+    def test_counts_without_search(self, snapshot):
+        page = InMemoryOperatorRepository(snapshot).search_operators(
+            OperatorRequestParams(facets="state,salesRegion")
+        )
+
+        assert as_pairs(page.facets) == {
+            "state": [("SP", 2), ("MG", 1), ("RJ", 1), (None, 1)],
+            "salesRegion": [(1, 2), (2, 1), (3, 1), (None, 1)],
+        }
+
+    def test_counts_are_restricted_to_matches(self, snapshot):
+        page = InMemoryOperatorRepository(snapshot).search_operators(
+            OperatorRequestParams(search="unimed", facets="modality", page_size=1)
+        )
+
+        assert len(page.operators) == 1
+        assert as_pairs(page.facets) == {"modality": [("Cooperativa Médica", 2)]}
+
+    def test_no_facets_by_default(self, snapshot):
+        page = InMemoryOperatorRepository(snapshot).search_operators(OperatorRequestParams())
+
+        assert page.facets is None
@@ -0,0 +1,185 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.application.service import operator_service as service_module
+from src.application.service.operator_service import OperatorService
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.database.database_executor import DatabaseExecutor
+from src.infra.search.fuzzy_name_index import (BKTree, FuzzyNameIndex,
+                                               levenshtein)
+from src.infra.search.operator_snapshot import (OperatorSnapshot,
+                                                OperatorSnapshotStore)
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+NAMES = [
+    ("UNIMED CAMPINAS COOPERATIVA DE TRABALHO MÉDICO", "UNIMED CAMPINAS"),
+    ("AMIL ASSISTÊNCIA MÉDICA INTERNACIONAL S.A.", "AMIL"),
+    ("BRADESCO SAÚDE S.A.", None),
+    ("UNIMED DE SÃO JOSÉ DO RIO PRETO", "UNIMED RIO PRETO"),
+]
+
+
+@pytest.fixture
+def operator_rows(sample_operators):
+    return [
+        SimpleNamespace(
+            **{
+                **sample_operators[index % len(sample_operators)],
+                "id": (index + 1) * 10,
+                "corporate_name": corporate_name,
+                "trade_name": trade_name,
+                "registration_date": date(2020, 1, index + 1),
+            }
+        )
+        for index, (corporate_name, trade_name) in enumerate(NAMES)
+    ]
+
+
+@pytest.fixture
+def snapshot(operator_rows):
+    return OperatorSnapshot(operator_rows)
+
+
+class TestFuzzyNameIndex:
+    """Testes para o índice de nomes tolerante a erros de digitação"""
+
+    def test_levenshtein(self):
+        assert levenshtein("amill", "amil") == 1
+        assert levenshtein("unimde", "unimed") == 2
+        assert levenshtein("", "amil") == 4
+
+    def test_bk_tree_finds_words_within_tolerance(self):
+        tree = BKTree(["unimed", "amil", "bradesco", "campinas", "medico"])
+
+        assert tree.search("unimde", 2) == ["unimed"]
+        assert sorted(tree.search("amill", 1)) == ["amil"]
+        assert tree.search("xyz", 1) == []
+
+    @pytest.mark.parametrize(
+        "search_term, expected",
+        [
+            ("unimde", [0, 3]),
+            ("amill", [1]),
+            ("Bradesko Saude", [2]),
+            ("unimed campinsa", [0]),
+            ("são jose", [3]),
+            ("inexistente", []),
+        ],
+    )
+    def test_search_tolerates_typos(self, search_term, expected):
+        """Todas as palavras buscadas devem casar, com tolerância a erros"""
+        index = FuzzyNameIndex(NAMES)
+
+        assert index.search(search_term) == expected
+
+    def test_short_words_require_exact_match(self):
+        """Palavras de até 3 letras não toleram erros"""
+        index = FuzzyNameIndex(NAMES)
+
+        assert index.search("rio") == [3]
+        assert index.search("ria") == []
+
+
+class TestFuzzySearchRepositories:
+    """Testes da busca aproximada nos dois mecanismos de busca"""
+
+    def test_in_memory_search_feeds_regular_ordering(self, snapshot):
+        """Os resultados aproximados devem seguir a ordenação e a paginação normais"""
+        page = InMemoryOperatorRepository(snapshot).search_operators(
+            OperatorRequestParams(
+                search="unimde",
+                search_mode="fuzzy",
+                sort_field="corporateName",
+                sort_direction="desc",
+                page_size=1,
+            )
+        )
+
+        assert [operator.trade_name for operator in page.operators] == ["UNIMED RIO PRETO"]
+        assert page.total_items == 2
+        assert page.has_next is True
+
+    def test_database_search_filters_by_matched_ids(self, snapshot):
+        """No banco, a busca aproximada vira um filtro pelos ids encontrados"""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = []
+
+        OperatorRepository(session, fuzzy_matcher=snapshot.fuzzy_match_ids).search_operators(
+            OperatorRequestParams(search="amill", search_mode="fuzzy")
+        )
+
+        statement = session.execute.call_args[0][0]
+        compiled = statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        assert "cadop.cadastro_operadoras.id IN (20)" in str(compiled)
+
+    def test_database_search_without_matches(self, snapshot):
+        """Sem nomes próximos, a consulta não deve retornar linhas"""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = []
+
+        OperatorRepository(session, fuzzy_matcher=snapshot.fuzzy_match_ids).search_operators(
+            OperatorRequestParams(search="inexistente", search_mode="fuzzy")
+        )
+
+        statement = session.execute.call_args[0][0]
+        assert "WHERE false" in str(statement.compile(dialect=postgresql.dialect()))
+
+    def test_index_is_rebuilt_with_new_data(self, operator_rows):
+        """Um novo snapshot (dados alterados) deve trazer um novo índice"""
+        store = OperatorSnapshotStore(MagicMock(), refresh_interval=60)
+        store.load(operator_rows[:1])
+        assert store.snapshot.fuzzy_match_ids("amill") == []
+
+        store.load(operator_rows)
+        assert store.snapshot.fuzzy_match_ids("amill") == [20]
+
+    def test_request_without_snapshot_falls_back_to_substring(self, monkeypatch):
+        """A requisição não carrega o snapshot: sem ele, a busca aproximada usa a substring"""
+        store = OperatorSnapshotStore(MagicMock(side_effect=AssertionError("sem banco")), 60)
+        monkeypatch.setattr(service_module, "operator_snapshot_store", store)
+        monkeypatch.setattr(service_module, "SEARCH_ENGINE", "database")
+
+        repository = OperatorService(MagicMock(spec=Session))._repository_for(
+            OperatorRequestParams(search="unimde", search_mode="fuzzy")
+        )
+
+        assert repository.fuzzy_matcher is None
+        assert store.snapshot is None
+
+    def test_start_loads_once_and_refreshes_in_background(self, operator_rows):
+        session = MagicMock()
+        session.query.return_value.order_by.return_value.all.return_value = operator_rows
+        store = OperatorSnapshotStore(lambda: session, refresh_interval=3600)
+
+        try:
+            store.start()
+            store.start()
+            assert store.snapshot is not None
+        finally:
+            store.stop()
+
+        assert session.query.call_count == 1
+
+    def test_refresh_reserves_a_connection(self, operator_rows):
+        """A carga do snapshot desconta a sua conexão das tarefas do executor"""
+        executor = DatabaseExecutor(2, 1)
+        limits = []
+        session = MagicMock()
+        session.query.return_value.order_by.return_value.all.side_effect = (
+            lambda: limits.append(executor.limit()) or operator_rows
+        )
+        store = OperatorSnapshotStore(lambda: session, 60, executor.reserve)
+
+        assert store.refresh()
+        assert limits == [1]
+        assert executor.limit() == 2
@@ -0,0 +1,266 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.domain.model.operator import Operator
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.search.operator_snapshot import (OperatorSnapshot,
+                                                OperatorSnapshotStore)
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+@pytest.fixture
+def operator_rows(sample_operators):
+    """Linhas no formato retornado pelo ORM, com id e data de registro"""
+    extra = {
+        "id": 3,
+        **sample_operators[0],
+        "operator_registry": "111111",
+        "corporate_name": "ÁGUA SAÚDE LTDA",
+        "trade_name": None,
+        "city": "Curitiba",
+        "state": "PR",
+        "email": "contato@agua.com.br",
+    }
+    rows = [
+        {"id": index + 1, **operator, "registration_date": date(2020, 1, index + 1)}
+        for index, operator in enumerate(sample_operators)
+    ]
+    rows.append({**extra, "registration_date": date(2019, 5, 1)})
+    return [SimpleNamespace(**row) for row in rows]
+
+
+@pytest.fixture
+def repository(operator_rows):
+    return InMemoryOperatorRepository(OperatorSnapshot(operator_rows))
+
+
+class TestInMemorySearch:
+    """Testes para o motor de busca em memória"""
+
+    def test_search_is_case_and_accent_insensitive(self, repository):
+        """A busca deve ignorar acentos e maiúsculas, como lower(unaccent())"""
+        page = repository.search_operators(
+            OperatorRequestParams(search="agua saude")
+        )
+
+        assert [operator.operator_registry for operator in page.operators] == ["111111"]
+        assert page.total_items == 1
+
+    def test_search_matches_any_text_column(self, repository):
+        """Termos devem ser encontrados em qualquer coluna de texto"""
+        page = repository.search_operators(
+            OperatorRequestParams(search="operadora2.com")
+        )
+
+        assert [operator.operator_registry for operator in page.operators] == ["654321"]
+
+    def test_search_does_not_match_across_columns(self, repository):
+        """Um termo não pode casar juntando o fim de um campo com o início de outro"""
+        page = repository.search_operators(
+            OperatorRequestParams(search="ltdaoperadora")
+        )
+
+        assert page.operators == []
+
+    def test_ordering_puts_nulls_last_ascending(self, repository):
+        """Ordenação ascendente deixa nulos no final e descendente no início"""
+        ascending = repository.search_operators(
+            OperatorRequestParams(sort_field="tradeName", sort_direction="asc")
+        )
+        descending = repository.search_operators(
+            OperatorRequestParams(sort_field="tradeName", sort_direction="desc")
+        )
+
+        assert [operator.trade_name for operator in ascending.operators] == [
+            "OPERADORA TESTE 1",
+            "OPERADORA TESTE 2",
+            None,
+        ]
+        assert [operator.trade_name for operator in descending.operators] == [
+            None,
+            "OPERADORA TESTE 2",
+            "OPERADORA TESTE 1",
+        ]
+
+    def test_ordering_ignores_accents(self, repository):
+        """A ordenação deve seguir a collation insensível a acentos"""
+        page = repository.search_operators(
+            OperatorRequestParams(sort_field="corporateName")
+        )
+
+        assert page.operators[0].corporate_name == "ÁGUA SAÚDE LTDA"
+
+    def test_ordering_by_date(self, repository):
+        """Colunas de data devem ser ordenadas pelo valor"""
+        page = repository.search_operators(
+            OperatorRequestParams(sort_field="registrationDate", sort_direction="desc")
+        )
+
+        assert [operator.operator_registry for operator in page.operators] == [
+            "654321",
+            "123456",
+            "111111",
+        ]
+
+    def test_pagination(self, repository):
+        """A paginação deve respeitar page e pageSize e calcular o total de páginas"""
+        page = repository.search_operators(
+            OperatorRequestParams(page=2, page_size=2)
+        )
+
+        assert [operator.operator_registry for operator in page.operators] == ["111111"]
+        assert page.total_items == 3
+
+    def test_total_follows_count_options(self, repository, monkeypatch):
+        """includeTotal e countMode devem ter o mesmo efeito que no banco"""
+        monkeypatch.setattr(
+            "src.domain.repository.operator_repository.COUNT_ESTIMATE_CAP", 2
+        )
+
+        without_total = repository.search_operators(
+            OperatorRequestParams(page_size=2, include_total=False)
+        )
+        estimated = repository.search_operators(
+            OperatorRequestParams(page_size=2, count_mode="estimate")
+        )
+
+        assert without_total.total_items is None
+        assert without_total.has_next is True
+        assert estimated.total_items == 2
+        assert estimated.total_items_exact is False
+
+    def test_identifier_terms_are_served_in_memory(self):
+        """Só a busca textual completa depende do Postgres"""
+        assert InMemoryOperatorRepository.supports(OperatorRequestParams(search="unimed"))
+        assert InMemoryOperatorRepository.supports(
+            OperatorRequestParams(search="12.345.678/0001-90")
+        )
+        assert InMemoryOperatorRepository.supports(OperatorRequestParams(search="SP"))
+        assert not InMemoryOperatorRepository.supports(
+            OperatorRequestParams(search="SP", search_mode="fulltext")
+        )
+
+    @pytest.mark.parametrize(
+        "search, expected",
+        [
+            ("12.345.678/0001-00", ["123456", "111111"]),
+            ("12.345.678", ["123456", "111111"]),
+            ("98.765.432", ["654321"]),
+            ("01234567", ["123456", "111111"]),
+            ("654321", ["654321"]),
+            ("999999", []),
+            ("pr", ["111111"]),
+        ],
+    )
+    def test_identifier_terms_search_the_matching_column(self, repository, search, expected):
+        """CNPJ, CEP e registro exatos, raiz do CNPJ por prefixo e UF sem diferenciar caixa"""
+        page = repository.search_operators(OperatorRequestParams(search=search))
+
+        assert [operator.operator_registry for operator in page.operators] == expected
+
+
+class TestOperatorSnapshotStore:
+    """Testes para o carregamento e atualização do snapshot"""
+
+    def test_refresh_keeps_previous_snapshot_on_failure(self, operator_rows):
+        """Uma falha no banco não deve descartar o snapshot já carregado"""
+        session = MagicMock()
+        session.query.return_value.order_by.return_value.all.return_value = (
+            operator_rows
+        )
+        store = OperatorSnapshotStore(lambda: session, refresh_interval=60)
+
+        assert store.refresh() is True
+        loaded = store.snapshot
+
+        session.query.side_effect = Exception("banco em manutenção")
+        assert store.refresh() is False
+        assert store.snapshot is loaded
+
+    def test_refresh_detects_unchanged_data(self, operator_rows):
+        """Recarregar os mesmos dados não deve trocar o snapshot"""
+        store = OperatorSnapshotStore(MagicMock(), refresh_interval=60)
+
+        assert store.load(operator_rows) is True
+        loaded = store.snapshot
+        assert store.load(operator_rows) is False
+        assert store.snapshot is loaded
+
+
+class TestInMemoryCursorPagination:
+    """Testes para a paginação por cursor no motor em memória"""
+
+    @pytest.mark.parametrize(
+        "sort_field,sort_direction",
+        [
+            (None, "asc"),
+            ("tradeName", "asc"),
+            ("tradeName", "desc"),
+            ("registrationDate", "desc"),
+        ],
+    )
+    def test_cursor_traversal_matches_offset_pagination(
+        self, repository, sort_field, sort_direction
+    ):
+        """Percorrer por cursor deve entregar as mesmas linhas, na mesma ordem"""
+        expected = repository.search_operators(
+            OperatorRequestParams(
+                page_size=100, sort_field=sort_field, sort_direction=sort_direction
+            )
+        )
+
+        visited = []
+        cursor = "*"
+        while cursor:
+            page = repository.search_operators(
+                OperatorRequestParams(
+                    page_size=1,
+                    sort_field=sort_field,
+                    sort_direction=sort_direction,
+                    cursor=cursor,
+                )
+            )
+            visited.extend(operator.operator_registry for operator in page.operators)
+            cursor = page.next_cursor
+
+        assert visited == [
+            operator.operator_registry for operator in expected.operators
+        ]
+
+    def test_last_page_has_no_next_cursor(self, repository):
+        """A última página não deve devolver cursor"""
+        page = repository.search_operators(
+            OperatorRequestParams(page_size=10, cursor="*")
+        )
+
+        assert len(page.operators) == 3
+        assert page.next_cursor is None
+
+
+class TestEngineParity:
+    """O snapshot responde aos termos classificados como as consultas no Postgres"""
+
+    @pytest.mark.parametrize(
+        "search",
+        ["00.000.000/0079-19", "00.000.000", "00000-026", "000042", "999999", "ba"],
+        ids=["cnpj", "cnpj_prefix", "zip", "registry", "registry_missing", "state"],
+    )
+    def test_identifier_terms(self, postgres_engine, search):
+        params = OperatorRequestParams(search=search, page_size=100)
+        with Session(postgres_engine) as session:
+            expected = OperatorRepository(session).search_operators(params)
+            snapshot = OperatorSnapshot(session.query(Operator).order_by(Operator.id).all())
+
+        page = InMemoryOperatorRepository(snapshot).search_operators(params)
+
+        assert [operator.operator_registry for operator in page.operators] == [
+            operator.operator_registry for operator in expected.operators
+        ]
+        assert (page.total_items, page.has_next) == (expected.total_items, expected.has_next)
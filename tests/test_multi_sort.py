@@ -0,0 +1,188 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.application.dto.page_cursor import PageCursor
+from src.application.exception.invalid_cursor_exception import \
+    InvalidCursorException
+from src.application.exception.invalid_sort_parameter_exception import \
+    InvalidSortParameterException
+from src.domain.model.operator import Operator
+from src.domain.repository.in_memory_operator_repository import \
+    InMemoryOperatorRepository
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.search.operator_snapshot import OperatorSnapshot
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def repository(snapshot_rows):
+    """Operadoras com estados e nomes repetidos para exercitar os desempates"""
+    values = [
+        ("SP", "BETA SAÚDE", "X"),
+        ("RJ", "ALFA SAÚDE", None),
+        ("SP", "Álfa Saúde", "A"),
+        ("sp", "GAMA SAÚDE", None),
+        ("RJ", "ALFA SAÚDE", "B"),
+        (None, "DELTA SAÚDE", "A"),
+    ]
+    rows = snapshot_rows(
+        *(
+            {
+                "state": state,
+                "corporate_name": corporate_name,
+                "trade_name": trade_name,
+                "registration_date": date(2020, 1, index + 1),
+            }
+            for index, (state, corporate_name, trade_name) in enumerate(values)
+        )
+    )
+    return InMemoryOperatorRepository(OperatorSnapshot(rows))
+
+
+def registries(page):
+    return [operator.operator_registry for operator in page.operators]
+
+
+class TestSortParam:
+    """Testes de validação do parâmetro sort"""
+
+    def test_sort_keys(self):
+        params = OperatorRequestParams(sort="state, -corporateName")
+
+        assert params.sort == "state,-corporateName"
+        assert params.sort_keys == (("state", "asc"), ("corporateName", "desc"))
+
+    def test_single_field_is_the_same_as_sort_field(self):
+        params = OperatorRequestParams(sort="-corporateName")
+
+        assert params.sort is None
+        assert (params.sort_field, params.sort_direction) == ("corporateName", "desc")
+        assert params.model_dump_json() == OperatorRequestParams(
+            sort_field="corporateName", sort_direction="desc"
+        ).model_dump_json()
+
+    @pytest.mark.parametrize(
+        "sort",
+        ["state,password", "state,-state", "state,,city", "state,city,zip,cnpj", "relevance"],
+    )
+    def test_invalid_sort(self, sort):
+        with pytest.raises(InvalidSortParameterException):
+            OperatorRequestParams(sort=sort)
+
+    def test_sort_and_sort_field_are_exclusive(self):
+        with pytest.raises(InvalidSortParameterException):
+            OperatorRequestParams(sort="state,city", sort_field="city")
+
+    def test_fulltext_with_sort_does_not_order_by_relevance(self):
+        params = OperatorRequestParams(search="unimed", search_mode="fulltext", sort="state,city")
+
+        assert not params.orders_by_relevance
+
+    def test_cursor_from_another_ordering_is_rejected(self):
+        token = PageCursor(value=["SP", "x"], id=1, sort="state,city").encode()
+
+        with pytest.raises(InvalidCursorException):
+            OperatorRequestParams(sort="state,-city", cursor=token)
+
+    def test_cursor_with_wrong_number_of_values_is_rejected(self):
+        token = PageCursor(value=["SP"], id=1, sort="state,city").encode()
+
+        with pytest.raises(InvalidCursorException):
+            OperatorRequestParams(sort="state,city", cursor=token)
+
+    def test_compound_cursor_round_trip(self):
+        cursor = PageCursor(value=["SP", date(2020, 1, 31)], id=7, sort="state,-registrationDate")
+
+        decoded = PageCursor.decode(cursor.encode())
+
+        assert decoded.sort == "state,-registrationDate"
+        assert decoded.value == ["SP", "2020-01-31"]
+        assert decoded.matches(None, "asc", "state,-registrationDate")
+
+
+class TestSortStatements:
+    """Testes do SQL gerado para a ordenação"""
+
+    def test_id_is_always_the_last_key(self):
+        sql = compile_sql(OperatorRepository.apply_ordering(select(Operator), None))
+
+        assert sql.endswith("ORDER BY cadop.cadastro_operadoras.id ASC")
+
+    def test_id_follows_the_last_field_direction(self):
+        sql = compile_sql(
+            OperatorRepository.apply_sort_keys(
+                select(Operator), (("state", "asc"), ("corporateName", "desc"))
+            )
+        )
+
+        assert sql.split("ORDER BY ")[1] == (
+            "cadop.cadastro_operadoras.uf IS NULL ASC, "
+            "cadop.cadastro_operadoras.uf COLLATE pt_br_ci_ai ASC, "
+            "cadop.cadastro_operadoras.razao_social IS NULL DESC, "
+            "cadop.cadastro_operadoras.razao_social COLLATE pt_br_ci_ai DESC, "
+            "cadop.cadastro_operadoras.id DESC"
+        )
+
+    def test_compound_keyset_expands_the_comparison(self):
+        cursor = PageCursor(value=["SP", None], id=10, sort="state,-tradeName")
+        sql = compile_sql(
+            OperatorRepository.apply_compound_keyset(
+                select(Operator), (("state", "asc"), ("tradeName", "desc")), cursor
+            )
+        )
+
+        assert "(cadop.cadastro_operadoras.uf COLLATE pt_br_ci_ai) > " in sql
+        assert "(cadop.cadastro_operadoras.uf COLLATE pt_br_ci_ai) = " in sql
+        assert "nome_fantasia IS NOT NULL" in sql
+        assert "cadop.cadastro_operadoras.id < " in sql
+
+
+class TestInMemoryMultiSort:
+    """Testes da ordenação por vários campos no motor em memória"""
+
+    def test_mixed_directions(self, repository):
+        page = repository.search_operators(OperatorRequestParams(sort="state,-corporateName"))
+
+        # Estados sem diferenciar caixa; nomes sem acentos empatam e seguem o id descendente
+        assert registries(page) == ["000005", "000002", "000004", "000001", "000003", "000006"]
+
+    def test_nulls_come_first_in_descending_order(self, repository):
+        page = repository.search_operators(OperatorRequestParams(sort="-tradeName,state"))
+
+        assert registries(page) == ["000002", "000004", "000001", "000005", "000003", "000006"]
+
+    @pytest.mark.parametrize(
+        "sort",
+        ["state,-corporateName", "-state,corporateName", "-tradeName,state", "tradeName,-registrationDate"],
+    )
+    def test_cursor_traversal_matches_offset_pagination(self, repository, sort):
+        expected = repository.search_operators(OperatorRequestParams(sort=sort, page_size=100))
+
+        visited = []
+        cursor = "*"
+        while cursor:
+            page = repository.search_operators(
+                OperatorRequestParams(sort=sort, page_size=2, cursor=cursor)
+            )
+            visited.extend(registries(page))
+            cursor = page.next_cursor
+
+        assert visited == registries(expected)
+
+    def test_database_cursor_carries_every_value(self):
+        operator = SimpleNamespace(id=4, state="SP", registration_date=date(2020, 1, 2))
+        params = OperatorRequestParams(sort="state,-registrationDate", cursor="*")
+
+        cursor = PageCursor.decode(OperatorRepository.build_next_cursor(operator, params))
+
+        assert cursor.value == ["SP", "2020-01-02"]
+        assert cursor.id == 4
@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock
+
+import pytest
+from aiocache import SimpleMemoryCache
+from sqlalchemy.dialects import postgresql
+
+from src.application.exception.violation_exception import ViolationException
+from src.application.service import operator_service as service_module
+from src.application.service.operator_service import OperatorService
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.database.cache_key_manager import operator_detail_cache_key
+from src.infra.search.operator_snapshot import OperatorSnapshot
+from src.presentation.model.operator_batch_request import OperatorBatchRequest
+
+
+@pytest.fixture
+def database_service(snapshot, monkeypatch):
+    """Serviço no caminho do banco, com o repositório respondendo a partir do snapshot"""
+    monkeypatch.setattr(service_module, "SEARCH_ENGINE", "database")
+    monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", None)
+    # Cache vazio e isolado para cada teste
+    monkeypatch.setattr(OperatorService.find_by_registry_cached, "cache", SimpleMemoryCache())
+    service = OperatorService(MagicMock())
+    service.repository = MagicMock()
+    service.repository.find_by_identifiers.side_effect = snapshot.find_by_identifiers
+    return service
+
+
+class TestOperatorBatchRequest:
+    """Testes de validação da consulta em lote"""
+
+    def test_accepts_cnpjs_and_registries(self):
+        request = OperatorBatchRequest(identifiers=["123456", "98.765.432/0001-00", "123456"])
+
+        assert request.lookup_keys == {
+            "123456": ("registry", "123456"),
+            "98.765.432/0001-00": ("cnpj", "98765432000100"),
+        }
+
+    def test_rejects_other_terms(self):
+        with pytest.raises(ViolationException):
+            OperatorBatchRequest(identifiers=["123456", "SP"])
+
+
+class TestBatchLookup:
+    """Testes da resolução do lote"""
+
+    def test_statement_uses_one_array_parameter_per_column(self):
+        sql = str(
+            OperatorRepository.identifiers_statement(["12345678000100"], ["123456", "654321"])
+            .compile(dialect=postgresql.dialect())
+        )
+
+        assert "registro_operadora = ANY (" in sql
+        assert "regexp_replace(cadop.cadastro_operadoras.cnpj" in sql
+        assert sql.count("ANY (") == 2
+
+    def test_shared_cnpj_resolves_to_the_lowest_id(self, snapshot_rows):
+        """O registro ANS é único (migração 0006); o CNPJ pode se repetir"""
+        snapshot = OperatorSnapshot(snapshot_rows({}, {}))
+        operators = snapshot.find_by_identifiers(["12345678000100"], ["000002"])
+
+        records = OperatorService.records_by_identifier(
+            [("cnpj", "12345678000100"), ("registry", "000002")], operators
+        )
+
+        assert records[("cnpj", "12345678000100")]["operatorRegistry"] == "000001"
+        assert records[("registry", "000002")]["operatorRegistry"] == "000002"
+
+    @pytest.mark.asyncio
+    async def test_results_are_keyed_by_identifier(self, database_service):
+        response = await database_service.find_by_identifiers_cached(
+            OperatorBatchRequest(identifiers=["12345678000100", "654321", "000000"])
+        )
+
+        assert response["data"]["12345678000100"]["operatorRegistry"] == "123456"
+        assert response["data"]["654321"]["cnpj"] == "98.765.432/0001-00"
+        assert response["data"]["000000"] is None
+        assert response["notFound"] == ["000000"]
+        database_service.repository.find_by_identifiers.assert_called_once_with(
+            ["12345678000100"], ["654321", "000000"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_records_skip_the_database(self, database_service):
+        cache = OperatorService.find_by_registry_cached.cache
+        await cache.set(operator_detail_cache_key("123456"), {"operatorRegistry": "123456"})
+
+        response = await database_service.find_by_identifiers_cached(
+            OperatorBatchRequest(identifiers=["123456", "654321"])
+        )
+
+        assert response["data"]["123456"] == {"operatorRegistry": "123456"}
+        database_service.repository.find_by_identifiers.assert_called_once_with([], ["654321"])
+
+
+class TestOperatorBatchEndpoint:
+    """Testes para o endpoint POST /api/v1/operators/batch"""
+
+    def test_returns_service_response(self, client, mock_operator_service):
+        mock_operator_service.find_by_identifiers_cached.return_value = {
+            "data": {"000000": None},
+            "notFound": ["000000"],
+        }
+
+        response = client.post("/api/v1/operators/batch", json={"identifiers": ["000000"]})
+
+        assert response.status_code == 200
+        assert response.json()["notFound"] == ["000000"]
+
+    def test_invalid_identifier(self, client, mock_operator_service):
+        response = client.post("/api/v1/operators/batch", json={"identifiers": ["abc"]})
+
+        assert response.status_code == 422
+        mock_operator_service.find_by_identifiers_cached.assert_not_called()
+
+    def test_identifier_limit(self, client, mock_operator_service):
+        response = client.post(
+            "/api/v1/operators/batch", json={"identifiers": ["123456"] * 1001}
+        )
+
+        assert response.status_code == 422
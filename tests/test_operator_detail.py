@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.exception.operator_not_found_exception import \
+    OperatorNotFoundException
+from src.application.service import operator_service as service_module
+from src.application.service.operator_service import OperatorService
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.database.cache_key_manager import operator_detail_key_builder
+
+
+@pytest.fixture
+def operator_record(snapshot):
+    return snapshot.operators[0].model_dump(by_alias=True)
+
+
+class TestRegistryLookup:
+    """Testes da busca de uma operadora pelo registro ANS"""
+
+    def test_snapshot_lookup(self, snapshot):
+        assert snapshot.find_by_registry("654321").corporate_name == "OPERADORA TESTE 2 LTDA"
+        assert snapshot.find_by_registry("000000") is None
+
+    def test_statement_probes_registry_column(self):
+        sql = str(
+            OperatorRepository.registry_statement("123456").compile(dialect=postgresql.dialect())
+        )
+
+        assert "WHERE cadop.cadastro_operadoras.registro_operadora = " in sql
+
+    def test_cache_key_follows_dataset_version(self, snapshot, monkeypatch):
+        monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", None)
+        assert operator_detail_key_builder(None, None, "123456") == "operator_detail:database:123456"
+
+        monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", snapshot)
+        assert operator_detail_key_builder(None, None, "123456") == (
+            f"operator_detail:{snapshot.version[:20]}:123456"
+        )
+
+    def test_memory_engine_reads_snapshot(self, snapshot, monkeypatch):
+        monkeypatch.setattr(service_module, "SEARCH_ENGINE", "memory")
+        monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", snapshot)
+        session = MagicMock()
+
+        record = OperatorService(session).find_by_registry("123456")
+
+        assert record["operatorRegistry"] == "123456"
+        assert record["registrationDate"] == "2020-01-01"
+        session.execute.assert_not_called()
+
+    def test_unknown_registry(self, snapshot, monkeypatch):
+        monkeypatch.setattr(service_module, "SEARCH_ENGINE", "memory")
+        monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", snapshot)
+
+        with pytest.raises(OperatorNotFoundException):
+            OperatorService(MagicMock()).find_by_registry("999999")
+
+
+class TestOperatorDetailEndpoint:
+    """Testes para o endpoint /api/v1/operators/{registry}"""
+
+    def test_returns_operator_with_etag(self, client, mock_operator_service, operator_record):
+        mock_operator_service.find_by_registry_cached.return_value = operator_record
+
+        response = client.get("/api/v1/operators/123456")
+
+        assert response.status_code == 200
+        assert response.json()["corporateName"] == "OPERADORA TESTE 1 LTDA"
+        assert response.headers["ETag"].startswith('"')
+        mock_operator_service.find_by_registry_cached.assert_awaited_once_with("123456")
+
+    def test_matching_etag_returns_not_modified(
+        self, client, mock_operator_service, operator_record
+    ):
+        mock_operator_service.find_by_registry_cached.return_value = operator_record
+        first = client.get("/api/v1/operators/123456")
+
+        second = client.get(
+            "/api/v1/operators/123456", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_unknown_registry_returns_404(self, client, mock_operator_service):
+        mock_operator_service.find_by_registry_cached.side_effect = OperatorNotFoundException(
+            "999999"
+        )
+
+        response = client.get("/api/v1/operators/999999")
+
+        assert response.status_code == 404
+        assert "999999" in response.json()["detail"]
+
+    def test_registry_must_have_six_digits(self, client, mock_operator_service):
+        response = client.get("/api/v1/operators/12ab")
+
+        assert response.status_code == 422
+        mock_operator_service.find_by_registry_cached.assert_not_called()
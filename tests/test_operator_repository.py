@@ -0,0 +1,272 @@
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.application.service.operator_service import OperatorService
+from src.domain.model.operator import Operator
+from src.domain.repository.operator_repository import (COUNT_ESTIMATE_CAP,
+                                                       OperatorRepository,
+                                                       classify_search_term)
+from src.infra.database.migrations import MIGRATIONS_DIR
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def session():
+    """Sessão simulada que registra as instruções executadas"""
+    return MagicMock()
+
+
+class FakeRow(tuple):
+    """Linha no formato (Operator, total_items) retornado pelo SQLAlchemy"""
+
+    @property
+    def total_items(self):
+        return self[1]
+
+
+class TestSearchRoundTrips:
+    """Testes para a busca da página e do total em uma única consulta"""
+
+    def test_page_and_total_in_one_statement(self, session, sample_operators):
+        """A página e o total devem vir da mesma consulta com count(*) OVER ()"""
+        operator = SimpleNamespace(id=1, registration_date="2020-01-01", **sample_operators[0])
+        session.execute.return_value.all.return_value = [FakeRow((operator, 42))]
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="teste")
+        )
+
+        assert session.execute.call_count == 1
+        assert "count(*) OVER ()" in compile_sql(session.execute.call_args[0][0])
+        assert page.total_items == 42
+        assert len(page.operators) == 1
+
+    def test_empty_first_page_skips_count(self, session):
+        """Sem resultados na primeira página, o total é zero sem nova consulta"""
+        session.execute.return_value.all.return_value = []
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="inexistente")
+        )
+
+        assert session.execute.call_count == 1
+        assert page.total_items == 0
+
+    def test_page_past_end_falls_back_to_count(self, session):
+        """Uma página além do fim deve recorrer a uma consulta de contagem"""
+        session.execute.return_value.all.return_value = []
+        session.execute.return_value.scalar_one.return_value = 15
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="teste", page=99)
+        )
+
+        assert session.execute.call_count == 2
+        assert "count(*)" in compile_sql(session.execute.call_args[0][0])
+        assert page.total_items == 15
+        assert page.operators == []
+
+    def test_cursor_mode_counts_with_scalar_subquery(self, session):
+        """No modo cursor o total não pode vir da janela, restringida pelo keyset"""
+        session.execute.return_value.all.return_value = []
+        session.execute.return_value.scalar_one.return_value = 0
+
+        OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="teste", cursor="*")
+        )
+
+        sql = compile_sql(session.execute.call_args_list[0][0][0])
+        assert "OVER ()" not in sql
+        assert "(SELECT count(*) AS count_1" in sql
+
+
+class TestFullTextSearch:
+    """Testes para o modo de busca textual completa"""
+
+    def test_fulltext_filter_uses_search_vector(self, session):
+        """O filtro deve usar o tsvector indexado e busca por prefixo"""
+        session.execute.return_value.all.return_value = []
+
+        OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="Unimed Camp", search_mode="fulltext")
+        )
+
+        statement = session.execute.call_args[0][0]
+        sql = compile_sql(statement)
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert "search_vector @@ to_tsquery('portuguese'::regconfig" in sql
+        assert "unimed:* & camp:*" in params.values()
+
+    def test_fulltext_orders_by_relevance_by_default(self, session):
+        """Sem sortField, a busca textual completa ordena por ts_rank"""
+        session.execute.return_value.all.return_value = []
+
+        OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="unimed", search_mode="fulltext")
+        )
+
+        sql = compile_sql(session.execute.call_args[0][0])
+        assert "ORDER BY ts_rank(cadop.cadastro_operadoras.search_vector" in sql
+
+    def test_fulltext_without_words_matches_nothing(self, session):
+        """Textos sem palavras não devem gerar tsquery inválida"""
+        session.execute.return_value.all.return_value = []
+
+        OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="!!", search_mode="fulltext")
+        )
+
+        assert "WHERE false" in compile_sql(session.execute.call_args[0][0])
+
+
+class TestTypedSearchFastPaths:
+    """Testes para os atalhos de busca por CNPJ, CEP, registro ANS e UF"""
+
+    @pytest.mark.parametrize(
+        "search_term, expected",
+        [
+            ("12345678000190", ("cnpj", "12345678000190")),
+            ("12.345.678/0001-90", ("cnpj", "12345678000190")),
+            ("12.345.678", ("cnpj_prefix", "12345678")),
+            ("12.345.678/0001", ("cnpj_prefix", "123456780001")),
+            ("01310100", ("zip", "01310100")),
+            ("01310-100", ("zip", "01310100")),
+            ("326305", ("registry", "326305")),
+            (" sp ", ("state", "SP")),
+            ("Rj", ("state", "RJ")),
+        ],
+    )
+    def test_classifies_identifier_terms(self, search_term, expected):
+        """Termos com formato de identificador devem ser reconhecidos"""
+        assert classify_search_term(search_term) == expected
+
+    @pytest.mark.parametrize(
+        "search_term", ["unimed", "1234", "1234567", "XX", "sp rj", "12345-67", "٣٢٦٣٠٥"]
+    )
+    def test_general_terms_are_not_classified(self, search_term):
+        """Os demais termos devem seguir para a busca textual geral"""
+        assert classify_search_term(search_term) is None
+
+    def test_cnpj_search_skips_document_scan(self, session):
+        """Um CNPJ deve gerar igualdade sobre os dígitos, sem a varredura geral"""
+        session.execute.return_value.all.return_value = []
+
+        OperatorRepository(session).search_operators(
+            OperatorRequestParams(search="12.345.678/0001-90")
+        )
+
+        statement = session.execute.call_args[0][0]
+        sql = compile_sql(statement)
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert "regexp_replace(cadop.cadastro_operadoras.cnpj" in sql
+        assert "search_document" not in sql
+        assert "12345678000190" in params.values()
+
+    def test_cnpj_root_uses_prefix_lookup(self, session):
+        """A raiz do CNPJ com máscara deve virar uma busca por prefixo"""
+        statement = OperatorRepository.apply_search_filter(select(Operator), "12.345.678")
+        params = statement.compile(dialect=postgresql.dialect()).params
+
+        assert "LIKE" in compile_sql(statement)
+        assert "12345678%" in params.values()
+
+    def test_state_search_compares_uppercase(self):
+        """A UF deve ser comparada em maiúsculas, como no índice"""
+        statement = OperatorRepository.apply_search_filter(select(Operator), "sp")
+
+        assert "upper(cadop.cadastro_operadoras.uf) = " in compile_sql(statement)
+        assert "search_document" not in compile_sql(statement)
+
+
+class TestTotalCounts:
+    """Testes para includeTotal e countMode"""
+
+    def test_without_total_skips_counting(self, session, sample_operators):
+        """Com includeTotal=false nenhuma contagem deve ser feita"""
+        operators = [
+            SimpleNamespace(id=index, registration_date="2020-01-01", **sample_operators[0])
+            for index in range(3)
+        ]
+        session.execute.return_value.all.return_value = [(operator,) for operator in operators]
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(page_size=2, include_total=False)
+        )
+
+        sql = compile_sql(session.execute.call_args[0][0])
+        assert session.execute.call_count == 1
+        assert "count(" not in sql
+        assert page.total_items is None
+        assert page.has_next is True
+        assert len(page.operators) == 2
+
+    def test_without_total_on_empty_page(self, session):
+        """Uma página vazia sem total não deve recorrer à contagem"""
+        session.execute.return_value.all.return_value = []
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(page=5, include_total=False)
+        )
+
+        assert session.execute.call_count == 1
+        assert page.total_items is None
+        assert page.has_next is False
+
+    def test_estimate_caps_the_count(self, session, sample_operators):
+        """No modo estimate a contagem é limitada e informada como '1000+'"""
+        operator = SimpleNamespace(id=1, registration_date="2020-01-01", **sample_operators[0])
+        session.execute.return_value.all.return_value = [FakeRow((operator, COUNT_ESTIMATE_CAP + 1))]
+
+        params = OperatorRequestParams(search="teste", count_mode="estimate")
+        page = OperatorRepository(session).search_operators(params)
+        response = OperatorService.page_response(page, params)
+
+        statement = session.execute.call_args[0][0]
+        sql = compile_sql(statement)
+        params = statement.compile(dialect=postgresql.dialect()).params
+        assert "OVER ()" not in sql
+        assert COUNT_ESTIMATE_CAP + 1 in params.values()
+        assert page.total_items == COUNT_ESTIMATE_CAP
+        assert page.total_items_exact is False
+        # Sem total exato, não há última página conhecida
+        assert response.total_pages is None
+
+    def test_estimate_below_cap_is_exact(self, session, sample_operators):
+        """Abaixo do limite, a contagem estimada é exata"""
+        operator = SimpleNamespace(id=1, registration_date="2020-01-01", **sample_operators[0])
+        session.execute.return_value.all.return_value = [FakeRow((operator, 42))]
+
+        params = OperatorRequestParams(count_mode="estimate")
+        page = OperatorRepository(session).search_operators(params)
+
+        assert page.total_items == 42
+        assert page.total_items_exact is True
+        assert OperatorService.page_response(page, params).total_pages == 5
+
+
+class TestSortKeyIndexes:
+    """Testes da correspondência entre o ORDER BY e os índices de ordenação"""
+
+    @pytest.mark.parametrize("sort_field", sorted(OperatorService.get_allowed_columns()))
+    def test_every_sort_field_has_matching_index(self, sort_field):
+        """O ORDER BY de cada campo ordenável deve repetir a expressão de um índice (nulo, chave, id)"""
+        migration = (MIGRATIONS_DIR / "0009_null_flag_sort_indexes.sql").read_text(encoding="utf-8")
+        column = Operator.__table__.columns[sort_field]
+        sql = compile_sql(
+            OperatorRepository.apply_ordering(select(Operator), sort_field, "desc")
+        )
+
+        order_by = sql.split("ORDER BY ")[1].replace(" DESC", "")
+        order_by = re.sub(r"(\w+ IS NULL)", r"(\1)", order_by.replace("cadop.cadastro_operadoras.", ""))
+        assert f"({order_by})" in migration
+        assert f"idx_cadastro_operadoras_sort_{column.name}\n" in migration
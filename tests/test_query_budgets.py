@@ -0,0 +1,185 @@
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import Session
+
+from src.domain.model.operator import Operator
+from src.domain.repository.operator_repository import OperatorRepository
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+# Tempo máximo de execução (EXPLAIN ANALYZE) das consultas atendidas por
+# índice e das que leem a tabela inteira. Ajustável para máquinas lentas.
+TIME_FACTOR = float(os.getenv("QUERY_BUDGET_TIME_FACTOR", "1"))
+INDEX_TIME_BUDGET_MS = 25 * TIME_FACTOR
+FULL_SCAN_TIME_BUDGET_MS = 250 * TIME_FACTOR
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """
+    Forma de consulta produzida por OperatorRepository.search_operators e o
+    orçamento de cada instrução que ela executa. Formas com full_scan podem
+    ler a tabela inteira (contagem exata, facets sem filtro, página profunda
+    por offset); as demais leem no máximo max_buffers blocos e só têm Seq
+    Scan com seq_scan (varredura interrompida por LIMIT).
+    """
+
+    params: Dict[str, Any]
+    max_buffers: int = 50
+    full_scan: bool = False
+    seq_scan: bool = False
+    # Posição da linha em que o cursor é posicionado (página profunda)
+    cursor_at: Optional[int] = None
+    # Índices que devem aparecer no plano da página
+    indexes: Tuple[str, ...] = field(default=())
+
+
+QUERY_SHAPES = {
+    "list_with_exact_total": QueryShape({}, full_scan=True),
+    "list_without_total": QueryShape({"include_total": False}),
+    "search_contains": QueryShape(
+        {"search": "c4ca4238"}, indexes=("idx_cadastro_operadoras_search_document_trgm",)
+    ),
+    "search_fulltext": QueryShape(
+        {"search": "c4ca4238", "search_mode": "fulltext"},
+        indexes=("idx_cadastro_operadoras_search_vector",),
+    ),
+    "search_cnpj": QueryShape(
+        {"search": "00.000.000/0079-19"}, indexes=("idx_cadastro_operadoras_cnpj_digits",)
+    ),
+    "search_registry": QueryShape(
+        {"search": "000077"}, indexes=("idx_cadastro_operadoras_registro_operadora",)
+    ),
+    "column_filters": QueryShape({"state": "SP", "modality": "Autogestão", "include_total": False}),
+    "sort_asc": QueryShape(
+        {"sort_field": "corporateName", "include_total": False},
+        indexes=("idx_cadastro_operadoras_sort_razao_social",),
+    ),
+    "sort_desc": QueryShape(
+        {"sort_field": "tradeName", "sort_direction": "desc", "include_total": False},
+        indexes=("idx_cadastro_operadoras_sort_nome_fantasia",),
+    ),
+    "sort_compound": QueryShape(
+        {"sort": "state,corporateName", "include_total": False},
+        indexes=("idx_cadastro_operadoras_sort_uf_razao_social",),
+    ),
+    "sort_estimated_total": QueryShape(
+        # A contagem estimada lê no máximo COUNT_ESTIMATE_CAP + 1 linhas
+        {"sort_field": "corporateName", "count_mode": "estimate"}, max_buffers=200, seq_scan=True
+    ),
+    "deep_offset_page": QueryShape(
+        {"sort_field": "corporateName", "page": 200, "page_size": 20, "include_total": False},
+        full_scan=True,
+    ),
+    "deep_cursor_page": QueryShape(
+        {"cursor": "*", "include_total": False},
+        cursor_at=2500,
+        indexes=("cadastro_operadoras_pkey",),
+    ),
+    "deep_sorted_cursor_asc": QueryShape(
+        {"sort_field": "tradeName", "cursor": "*", "include_total": False},
+        cursor_at=2500,
+        indexes=("idx_cadastro_operadoras_sort_nome_fantasia",),
+    ),
+    "deep_sorted_cursor_desc": QueryShape(
+        {"sort_field": "corporateName", "sort_direction": "desc", "cursor": "*", "include_total": False},
+        cursor_at=2500,
+        indexes=("idx_cadastro_operadoras_sort_razao_social",),
+    ),
+    # Um quinto das linhas é de SP: as contagens visitam praticamente todas as páginas
+    "facets_with_filter": QueryShape(
+        {"state": "SP", "facets": "modality,salesRegion", "include_total": False},
+        full_scan=True,
+    ),
+}
+
+
+@contextmanager
+def captured_statements(engine):
+    """Registra as instruções (SQL e parâmetros) enviadas ao banco"""
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def analyze(engine, statement: str, parameters) -> dict:
+    """Executa a instrução com EXPLAIN (ANALYZE, BUFFERS) e retorna o resultado"""
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, parameters
+        ).scalar()[0]
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def cursor_at(engine, params: OperatorRequestParams, position: int) -> str:
+    """Cursor posicionado após a linha na posição informada da ordenação pedida"""
+    with Session(engine) as session:
+        operator = session.scalars(
+            OperatorRepository.apply_sort_keys(select(Operator), params.sort_keys)
+            .offset(position)
+            .limit(1)
+        ).one()
+        return OperatorRepository.build_next_cursor(operator, params)
+
+
+@pytest.fixture(scope="module")
+def table_pages(postgres_engine) -> int:
+    with postgres_engine.connect() as connection:
+        return connection.execute(
+            text("SELECT relpages FROM pg_class WHERE oid = 'cadop.cadastro_operadoras'::regclass")
+        ).scalar_one()
+
+
+class TestQueryBudgets:
+    """
+    Orçamento de leitura e de tempo de cada forma de consulta do repositório,
+    medido com EXPLAIN (ANALYZE, BUFFERS) sobre o conjunto sintético.
+    """
+
+    @pytest.mark.parametrize("shape_name", sorted(QUERY_SHAPES))
+    def test_query_shape_within_budget(self, postgres_engine, table_pages, shape_name):
+        shape = QUERY_SHAPES[shape_name]
+        params = OperatorRequestParams(**shape.params)
+        if shape.cursor_at is not None:
+            params = OperatorRequestParams(
+                **{**shape.params, "cursor": cursor_at(postgres_engine, params, shape.cursor_at)}
+            )
+
+        with captured_statements(postgres_engine) as statements:
+            with Session(postgres_engine) as session:
+                OperatorRepository(session).search_operators(params)
+
+        assert statements
+        # Páginas além da tabela, índices e a ordenação podem somar algumas leituras
+        max_buffers = int(table_pages * 1.2) if shape.full_scan else shape.max_buffers
+        time_budget = FULL_SCAN_TIME_BUDGET_MS if shape.full_scan else INDEX_TIME_BUDGET_MS
+        for position, (statement, parameters) in enumerate(statements):
+            result = analyze(postgres_engine, statement, parameters)
+            plan = result["Plan"]
+            nodes = list(plan_nodes(plan))
+            buffers = plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0)
+            summary = f"{shape_name}: {buffers} blocos, {result['Execution Time']:.2f} ms\n{statement}"
+
+            if not (shape.full_scan or shape.seq_scan):
+                assert not any(node["Node Type"] == "Seq Scan" for node in nodes), summary
+            if position == 0 and shape.indexes:
+                assert set(shape.indexes) <= {node.get("Index Name") for node in nodes}, summary
+            assert buffers <= max_buffers, summary
+            assert result["Execution Time"] <= time_budget, summary
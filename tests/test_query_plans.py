@@ -0,0 +1,179 @@
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from src.application.service.operator_service import OperatorService
+from src.domain.model.operator import Operator
+from src.domain.repository.operator_repository import OperatorRepository
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def explain(session: Session, statement) -> dict:
+    """Retorna o plano (formato JSON) da consulta gerada pelo repositório"""
+    connection = session.connection()
+    compiled = statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params
+    ).scalar()
+    return plan[0]["Plan"]
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+class TestSearchQueryPlans:
+    """Testes de plano de execução para a busca textual"""
+
+    def test_search_filter_uses_trigram_indexes(self, postgres_engine):
+        """O filtro de busca deve ser atendido pelos índices GIN de trigramas"""
+        with Session(postgres_engine) as session:
+            # Em tabelas pequenas o planejador prefere seq scan; aqui o que
+            # interessa é se os predicados são utilizáveis pelos índices.
+            session.execute(text("SET LOCAL enable_seqscan = off"))
+            statement = OperatorRepository.apply_search_filter(
+                select(Operator), "saude"
+            )
+            plan = explain(session, statement)
+
+        nodes = list(plan_nodes(plan))
+        index_scans = [
+            node for node in nodes if node["Node Type"] == "Bitmap Index Scan"
+        ]
+
+        assert index_scans, f"Plano não utiliza Bitmap Index Scan: {plan}"
+        assert {node["Index Name"] for node in index_scans} == {
+            "idx_cadastro_operadoras_search_document_trgm"
+        }
+        assert not any(node["Node Type"] == "Seq Scan" for node in nodes)
+
+    def test_fulltext_filter_uses_search_vector_index(self, postgres_engine):
+        """A busca textual completa deve ser atendida pelo índice GIN do tsvector"""
+        with Session(postgres_engine) as session:
+            session.execute(text("SET LOCAL enable_seqscan = off"))
+            statement = OperatorRepository.apply_fulltext_filter(
+                select(Operator), "saude"
+            )
+            plan = explain(session, statement)
+
+        index_names = {
+            node.get("Index Name") for node in plan_nodes(plan)
+        }
+        assert "idx_cadastro_operadoras_search_vector" in index_names
+
+    @pytest.mark.parametrize(
+        "search_term, index_name",
+        [
+            ("00.000.000/0079-19", "idx_cadastro_operadoras_cnpj_digits"),
+            ("00.000.079", "idx_cadastro_operadoras_cnpj_digits"),
+            ("00000-013", "idx_cadastro_operadoras_cep_digits"),
+            ("000077", "idx_cadastro_operadoras_registro_operadora"),
+            ("sp", "idx_cadastro_operadoras_uf_modalidade"),
+        ],
+    )
+    def test_typed_search_uses_btree_indexes(self, postgres_engine, search_term, index_name):
+        """CNPJ, CEP, registro e UF devem ser sondagens nos índices B-tree"""
+        with Session(postgres_engine) as session:
+            statement = OperatorRepository.apply_search_filter(
+                select(Operator), search_term
+            )
+            plan = explain(session, statement)
+
+        nodes = list(plan_nodes(plan))
+        assert index_name in {node.get("Index Name") for node in nodes}
+        assert not any(node["Node Type"] == "Seq Scan" for node in nodes)
+
+    @pytest.mark.parametrize(
+        "filters, index_name",
+        [
+            ({"state": "SP", "modality": "medicina de grupo"}, "idx_cadastro_operadoras_uf_modalidade"),
+            ({"city": "sao paulo"}, "idx_cadastro_operadoras_cidade_uf"),
+            ({"modality": "Autogestão", "sales_region": 2}, "idx_cadastro_operadoras_modalidade_regiao"),
+            (
+                {"registration_date_from": "2001-01-01", "registration_date_to": "2001-01-31"},
+                "idx_cadastro_operadoras_data_registro",
+            ),
+        ],
+    )
+    def test_column_filters_use_composite_indexes(self, postgres_engine, filters, index_name):
+        """Os filtros por campo devem ser atendidos pelos índices compostos"""
+        with Session(postgres_engine) as session:
+            statement = OperatorRepository.apply_filters(
+                select(Operator), OperatorRequestParams(**filters)
+            )
+            plan = explain(session, statement)
+
+        nodes = list(plan_nodes(plan))
+        assert index_name in {node.get("Index Name") for node in nodes}
+        assert not any(node["Node Type"] == "Seq Scan" for node in nodes)
+
+    def test_registry_lookup_uses_unique_index(self, postgres_engine):
+        """O detalhe da operadora deve ser uma sondagem no índice único do registro"""
+        with Session(postgres_engine) as session:
+            plan = explain(session, OperatorRepository.registry_statement("000077"))
+
+        nodes = list(plan_nodes(plan))
+        assert "idx_cadastro_operadoras_registro_operadora" in {
+            node.get("Index Name") for node in nodes
+        }
+        assert not any(node["Node Type"] == "Seq Scan" for node in nodes)
+
+    def test_batch_lookup_uses_btree_indexes(self, postgres_engine):
+        """O lote de CNPJs e registros deve combinar as sondagens dos dois índices"""
+        with Session(postgres_engine) as session:
+            session.execute(text("SET LOCAL enable_seqscan = off"))
+            statement = OperatorRepository.identifiers_statement(
+                ["00000000079190", "00000000158380"], ["000077", "000078"]
+            )
+            plan = explain(session, statement)
+
+        index_names = {node.get("Index Name") for node in plan_nodes(plan)}
+        assert {
+            "idx_cadastro_operadoras_registro_operadora",
+            "idx_cadastro_operadoras_cnpj_digits",
+        } <= index_names
+
+
+class TestSortQueryPlans:
+    """Testes de plano de execução para a ordenação"""
+
+    @pytest.mark.parametrize("sort_direction", ["asc", "desc"])
+    @pytest.mark.parametrize("sort_field", sorted(OperatorService.get_allowed_columns()))
+    def test_sorted_page_walks_sort_index(self, postgres_engine, sort_field, sort_direction):
+        """A página ordenada deve percorrer o índice (chave, id), sem ordenar as linhas"""
+        column = Operator.__table__.columns[sort_field]
+        with Session(postgres_engine) as session:
+            statement = OperatorRepository.apply_keyset(
+                select(Operator), sort_field, sort_direction, None
+            ).limit(10)
+            plan = explain(session, statement)
+
+        nodes = list(plan_nodes(plan))
+        assert f"idx_cadastro_operadoras_sort_{column.name}" in {
+            node.get("Index Name") for node in nodes
+        }
+        assert not any(node["Node Type"] in ("Sort", "Seq Scan") for node in nodes)
+
+    @pytest.mark.parametrize(
+        "sort, index_name",
+        [
+            ("state,corporateName", "idx_cadastro_operadoras_sort_uf_razao_social"),
+            ("-state,-city", "idx_cadastro_operadoras_sort_uf_cidade"),
+            ("modality,corporateName", "idx_cadastro_operadoras_sort_modalidade_razao_social"),
+        ],
+    )
+    def test_compound_sort_walks_pair_index(self, postgres_engine, sort, index_name):
+        """A ordenação pelos pares mais comuns deve percorrer o índice composto"""
+        params = OperatorRequestParams(sort=sort)
+        with Session(postgres_engine) as session:
+            statement = OperatorRepository.apply_sort_keys(
+                select(Operator), params.sort_keys
+            ).limit(10)
+            plan = explain(session, statement)
+
+        nodes = list(plan_nodes(plan))
+        assert index_name in {node.get("Index Name") for node in nodes}
+        assert not any(node["Node Type"] in ("Sort", "Seq Scan") for node in nodes)
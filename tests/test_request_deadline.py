@@ -0,0 +1,211 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.application.exception.query_timeout_exception import \
+    QueryTimeoutException
+from src.infra.database import async_database_url
+from src.infra.database.database_executor import DatabaseExecutor
+from src.infra.database.request_deadline import (RequestDeadline,
+                                                 current_deadline,
+                                                 request_deadline)
+from src.infra.middleware.request_deadline_middleware import \
+    RequestDeadlineMiddleware
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cancelled = 0
+
+    def cancel(self):
+        self.cancelled += 1
+
+
+def http_scope(path="/api/v1/operators"):
+    return {"type": "http", "path": path, "method": "GET", "headers": []}
+
+
+class TestRequestDeadline:
+    """Testes do prazo da requisição e do cancelamento das conexões"""
+
+    def test_cancel_reaches_tracked_connections(self):
+        deadline = RequestDeadline(1)
+        running, returned = FakeConnection(), FakeConnection()
+        deadline.track(running)
+        deadline.track(returned)
+        deadline.release(returned)
+
+        assert deadline.cancel() == 1
+        assert deadline.cancelled
+        assert (running.cancelled, returned.cancelled) == (1, 0)
+
+    def test_context_is_restored(self):
+        with request_deadline(0.5) as deadline:
+            assert current_deadline() is deadline
+            assert 0 < deadline.remaining() <= 0.5
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_executor_threads_see_the_deadline(self):
+        executor = DatabaseExecutor(1, 1, name="test-deadline")
+
+        with request_deadline(1) as deadline:
+            assert await executor.run(current_deadline) is deadline
+        assert await executor.run(current_deadline) is None
+
+
+class TestRequestDeadlineMiddleware:
+    """Testes do middleware: prazo por requisição e abandono pelo cliente"""
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_the_handler(self):
+        started, interrupted = asyncio.Event(), asyncio.Event()
+        connection = FakeConnection()
+        sent = []
+
+        async def app(scope, receive, send):
+            current_deadline().track(connection)
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                interrupted.set()
+                raise
+
+        async def receive():
+            await started.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        middleware = RequestDeadlineMiddleware(app, timeout_ms=5000)
+        await asyncio.wait_for(middleware(http_scope(), receive, send), 1)
+
+        assert interrupted.is_set()
+        assert connection.cancelled == 1
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_completed_response_is_kept(self):
+        response_sent = asyncio.Event()
+        seen = {}
+
+        async def app(scope, receive, send):
+            seen["deadline"] = current_deadline()
+            seen["request"] = await receive()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+            # O servidor informa a desconexão assim que a resposta termina
+            await asyncio.sleep(0.05)
+
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await response_sent.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                response_sent.set()
+
+        middleware = RequestDeadlineMiddleware(app, timeout_ms=5000)
+        await middleware(http_scope(), receive, send)
+
+        assert not seen["deadline"].cancelled
+        assert seen["request"]["type"] == "http.request"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("timeout_ms, path", [(0, "/api/v1/operators"), (5000, "/api/v1/operators/export")])
+    async def test_exempt_requests_have_no_deadline(self, timeout_ms, path):
+        seen = {}
+
+        async def app(scope, receive, send):
+            seen["deadline"] = current_deadline()
+
+        middleware = RequestDeadlineMiddleware(app, timeout_ms=timeout_ms)
+        await middleware(http_scope(path), None, None)
+
+        assert seen["deadline"] is None
+
+
+class TestQueryTimeoutResponse:
+    """Testes da resposta 504"""
+
+    def test_timeout_returns_504(self, client, mock_operator_service):
+        mock_operator_service.find_all_cached.side_effect = QueryTimeoutException(0.5)
+
+        response = client.get("/api/v1/operators")
+
+        assert response.status_code == 504
+        assert response.json()["type"].endswith("/tempo-esgotado")
+        assert "500 ms" in response.json()["detail"]
+
+
+class TestStatementTimeout:
+    """Prazo aplicado às consultas em um Postgres real"""
+
+    def test_slow_query_times_out(self, postgres_engine):
+        with Session(postgres_engine) as session:
+            with request_deadline(0.2):
+                started = time.perf_counter()
+                with pytest.raises(QueryTimeoutException):
+                    session.execute(text("SELECT pg_sleep(5)"))
+                assert time.perf_counter() - started < 2
+            session.rollback()
+
+            # Fora do prazo, a conexão volta ao pool sem o limite
+            assert session.execute(text("SHOW statement_timeout")).scalar() == "0"
+
+    def test_expired_deadline_skips_the_database(self, postgres_engine):
+        with request_deadline(0.01):
+            time.sleep(0.02)
+            with Session(postgres_engine) as session, pytest.raises(QueryTimeoutException):
+                session.execute(text("SELECT 1"))
+
+    def test_cancel_interrupts_the_running_query(self, postgres_engine):
+        errors = []
+
+        with request_deadline(30) as deadline:
+            def run_query():
+                with Session(postgres_engine) as session:
+                    try:
+                        session.execute(text("SELECT pg_sleep(10)"))
+                    except QueryTimeoutException as e:
+                        errors.append(e)
+
+            # Como no executor, a thread roda no contexto da requisição
+            worker = threading.Thread(target=contextvars.copy_context().run, args=(run_query,))
+            started = time.perf_counter()
+            worker.start()
+            # Aguarda a consulta começar
+            while not deadline._connections:
+                time.sleep(0.01)
+            time.sleep(0.1)
+
+            assert deadline.cancel() == 1
+            worker.join(5)
+
+        assert not worker.is_alive()
+        assert time.perf_counter() - started < 3
+        assert len(errors) == 1
+        assert not deadline._connections
+
+    @pytest.mark.asyncio
+    async def test_async_session_applies_the_deadline(self, postgres_engine, postgres_url):
+        engine = create_async_engine(async_database_url(postgres_url))
+        try:
+            async with AsyncSession(engine) as session:
+                with request_deadline(0.2):
+                    with pytest.raises(QueryTimeoutException):
+                        await session.execute(text("SELECT pg_sleep(5)"))
+        finally:
+            await engine.dispose()
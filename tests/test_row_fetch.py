@@ -0,0 +1,127 @@
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.application.dto.operator_model import (OperatorModel,
+                                                operator_fieldset_model)
+from src.application.service.operator_service import OperatorService
+from src.domain.repository.operator_repository import (FETCH_CORE, FETCH_ORM,
+                                                       RECORD_FIELDS,
+                                                       OperatorRepository,
+                                                       record_builder)
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def operator(sample_operators):
+    return SimpleNamespace(id=7, registration_date=date(2020, 1, 2), **sample_operators[0])
+
+
+class CoreRow(tuple):
+    """Linha no formato lido pelo modo core: id, campos na ordem de OperatorModel e total"""
+
+    @property
+    def total_items(self):
+        return self[-1]
+
+
+def core_row(operator, fields=()):
+    keys = fields or RECORD_FIELDS
+    names = {alias: name for name, alias in zip(OperatorModel.model_fields, RECORD_FIELDS)}
+    return CoreRow((operator.id, *(getattr(operator, names[key]) for key in keys), 1))
+
+
+class TestRecordBuilder:
+    """O registro montado da tupla é o mesmo do OperatorModel serializado"""
+
+    def test_full_record(self, operator):
+        expected = OperatorModel.model_validate(operator, from_attributes=True).model_dump(by_alias=True)
+
+        record = record_builder(())(core_row(operator))
+
+        assert record == expected
+        assert list(record) == list(expected)
+
+    def test_fieldset_record(self, operator):
+        fields = ("cnpj", "city", "registrationDate")
+        model = operator_fieldset_model(fields)
+        expected = model.model_validate(operator, from_attributes=True).model_dump(by_alias=True)
+
+        assert record_builder(fields)(core_row(operator, fields)) == expected
+
+    def test_core_select_projects_response_columns(self):
+        sql = compile_sql(OperatorRepository.select_operators(OperatorRequestParams(), FETCH_CORE))
+
+        assert "cadastro_operadoras.id AS id" in sql
+        assert "razao_social AS corporate_name" in sql
+        assert "data_registro_ans AS registration_date" in sql
+        assert "search_vector" not in sql
+
+    def test_page_carries_records(self, operator):
+        session = MagicMock()
+        row = core_row(operator)
+        session.execute.return_value.all.return_value = [row]
+
+        page = OperatorRepository(session, fetch_mode=FETCH_CORE).search_operators(
+            OperatorRequestParams()
+        )
+        response = OperatorService.page_response(page, OperatorRequestParams())
+
+        assert page.operators == []
+        assert page.total_items == 1
+        assert response.data == [record_builder(())(row)]
+
+
+# Formas comparadas entre os dois modos de leitura
+FETCH_PARAMS = [
+    {"page_size": 100},
+    {"search": "saúde", "sort_field": "registrationDate", "page_size": 50},
+    {"fields": "cnpj,city,registrationDate", "sort_field": "city", "cursor": "*"},
+    {"sort": "state,-corporateName", "cursor": "*", "facets": "state"},
+    {"state": "SP", "page": 999},
+]
+
+
+def render_page(session, params, fetch_mode):
+    """Corpo JSON da listagem, como enviado pela rota"""
+    page = OperatorRepository(session, fetch_mode=fetch_mode).search_operators(params)
+    return JSONResponse(OperatorService.page_response(page, params).model_dump()).body
+
+
+class TestCoreFetchBenchmark:
+    """Leitura core contra ORM em um Postgres real: mesma resposta, menos CPU"""
+
+    @pytest.mark.parametrize("values", FETCH_PARAMS)
+    def test_byte_identical_response(self, postgres_engine, values):
+        params = OperatorRequestParams(**values)
+        with Session(postgres_engine) as session:
+            assert render_page(session, params, FETCH_CORE) == render_page(session, params, FETCH_ORM)
+
+    @pytest.mark.performance
+    def test_core_is_faster(self, postgres_engine):
+        # Sem contagem, o tempo da consulta não encobre o da montagem da resposta
+        params = OperatorRequestParams(page_size=100, include_total=False)
+        timings = {}
+        with Session(postgres_engine) as session:
+            for fetch_mode in (FETCH_ORM, FETCH_CORE, FETCH_ORM, FETCH_CORE):
+                started = time.perf_counter()
+                for _ in range(20):
+                    render_page(session, params, fetch_mode)
+                    session.expunge_all()
+                elapsed = (time.perf_counter() - started) / 20 * 1000
+                timings[fetch_mode] = min(timings.get(fetch_mode, elapsed), elapsed)
+
+        assert timings[FETCH_CORE] < timings[FETCH_ORM], (
+            f"Página de 100 linhas: orm {timings[FETCH_ORM]:.2f} ms, core {timings[FETCH_CORE]:.2f} ms"
+        )
@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import literal, or_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.domain.model.operator import Operator
+from src.domain.repository.operator_repository import (
+    SEARCH_DOCUMENT_SEPARATOR, SEARCHABLE_COLUMNS, OperatorRepository,
+    escape_like, normalized)
+
+# Termos que exercitam acentos, caixa, dígitos, e-mails, curingas do LIKE,
+# colunas nulas e textos que só existiriam atravessando colunas. Termos com
+# formato de CNPJ, CEP, registro ou UF seguem os atalhos tipados e ficam de fora
+SEARCH_TERMS = [
+    "operadora",
+    "OPERADORA",
+    "saúde",
+    "SAUDE",
+    "são paulo",
+    "sao paulo",
+    "autogestao",
+    "cooperativa médica",
+    "00012",
+    "1234",
+    "@operadora.com.br",
+    "contato_12@",
+    "contato_",
+    "%",
+    "sala 1%",
+    "_",
+    "a_b",
+    "\\",
+    "ltda",
+    "ltdasaúde",
+    "sp rua",
+    "diretorrepresentante",
+    "zzzzzz",
+    " ",
+]
+
+
+def legacy_search_filter(statement, search_term: str):
+    """Predicado anterior ao documento de busca: um LIKE por coluna"""
+    pattern = normalized(literal(f"%{escape_like(search_term)}%"))
+    return statement.filter(
+        or_(*(normalized(column).like(pattern, escape="\\") for column in SEARCHABLE_COLUMNS))
+    )
+
+
+def matched_ids(session: Session, statement) -> list:
+    return session.scalars(statement.with_only_columns(Operator.id).order_by(Operator.id)).all()
+
+
+class TestSearchDocumentStatement:
+    """Testes da consulta gerada sobre o documento de busca"""
+
+    def test_search_uses_single_document_predicate(self):
+        """A busca deve usar um único LIKE com escape sobre search_document"""
+        statement = OperatorRepository.apply_search_filter(select(Operator), "saúde")
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.count("LIKE") == 1
+        assert "cadop.cadastro_operadoras.search_document LIKE" in sql
+        assert "ESCAPE" in sql
+
+    def test_wildcards_are_escaped(self):
+        """Curingas digitados pelo usuário devem ser tratados como literais"""
+        statement = OperatorRepository.apply_search_filter(select(Operator), "10%_a")
+        params = statement.compile(dialect=postgresql.dialect()).params
+
+        assert "%10\\%\\_a%" in params.values()
+
+    def test_separator_in_term_matches_nothing(self):
+        """O separador de colunas nunca faz parte de um valor pesquisável"""
+        statement = OperatorRepository.apply_search_filter(
+            select(Operator), f"a{SEARCH_DOCUMENT_SEPARATOR}b"
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "search_document" not in sql
+        assert "false" in sql
+
+
+class TestSearchDocumentEquivalence:
+    """O documento de busca deve retornar as mesmas linhas do predicado por coluna"""
+
+    @pytest.mark.parametrize("search_term", SEARCH_TERMS)
+    def test_same_rows_as_per_column_search(self, postgres_engine, search_term):
+        with Session(postgres_engine) as session:
+            expected = matched_ids(session, legacy_search_filter(select(Operator), search_term))
+            actual = matched_ids(
+                session, OperatorRepository.apply_search_filter(select(Operator), search_term)
+            )
+
+        assert actual == expected
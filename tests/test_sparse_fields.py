@@ -0,0 +1,112 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.dto.operator_model import operator_fieldset_model
+from src.application.exception.violation_exception import ViolationException
+from src.application.service.operator_export_service import encode_csv
+from src.application.service.operator_service import OperatorService
+from src.domain.repository.operator_repository import OperatorRepository
+from src.infra.database.cache_key_manager import operator_key_builder
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestFieldsParam:
+    """Testes de validação do parâmetro fields"""
+
+    def test_fields_are_deduplicated_in_model_order(self):
+        params = OperatorRequestParams(fields="state, corporateName,state")
+
+        assert params.fields == "corporateName,state"
+        assert params.selected_fields == ("corporateName", "state")
+
+    def test_unknown_field(self):
+        with pytest.raises(ViolationException):
+            OperatorRequestParams(fields="corporateName,password")
+
+    def test_cache_key_includes_field_set(self):
+        service = OperatorService(MagicMock())
+
+        full = operator_key_builder(None, service, OperatorRequestParams())
+        reduced = operator_key_builder(None, service, OperatorRequestParams(fields="cnpj"))
+
+        assert full != reduced
+
+    def test_fieldset_model_keeps_date_serialization(self):
+        model = operator_fieldset_model(("registrationDate",))
+
+        assert model(registration_date=date(2020, 1, 2)).model_dump(by_alias=True) == {
+            "registrationDate": "2020-01-02"
+        }
+
+
+class TestFieldsProjection:
+    """Testes da projeção das colunas no SELECT"""
+
+    def test_select_reads_only_requested_columns(self):
+        statement = OperatorRepository.select_operators(
+            OperatorRequestParams(fields="corporateName,state", sort_field="city", cursor="*")
+        )
+        sql = compile_sql(statement)
+
+        assert "razao_social AS corporate_name" in sql
+        assert "uf AS state" in sql
+        # id e a coluna de ordenação alimentam o cursor
+        assert "cadastro_operadoras.id AS id" in sql
+        assert "cidade AS city" in sql
+        assert "representante" not in sql
+
+    def test_page_is_serialized_with_requested_fields(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            SimpleNamespace(id=1, corporate_name="OPERADORA", state="SP", total_items=1)
+        ]
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(fields="corporateName,state")
+        )
+
+        assert [operator.model_dump(by_alias=True) for operator in page.operators] == [
+            {"corporateName": "OPERADORA", "state": "SP"}
+        ]
+
+    def test_cursor_uses_projected_sort_column(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            SimpleNamespace(id=index, cnpj="1", city=f"CIDADE {index}", total_items=3)
+            for index in (1, 2)
+        ]
+
+        page = OperatorRepository(session).search_operators(
+            OperatorRequestParams(fields="cnpj", sort_field="city", cursor="*", page_size=1)
+        )
+
+        assert page.next_cursor is not None
+        assert "city" not in page.operators[0].model_dump(by_alias=True)
+
+    def test_in_memory_response_is_reduced(self, snapshot, monkeypatch):
+        from src.application.service import operator_service as service_module
+
+        monkeypatch.setattr(service_module, "SEARCH_ENGINE", "memory")
+        monkeypatch.setattr(service_module.operator_snapshot_store, "_snapshot", snapshot)
+
+        response = OperatorService(MagicMock()).find_all(
+            OperatorRequestParams(fields="operatorRegistry")
+        )
+
+        assert response.data == [{"operatorRegistry": "123456"}, {"operatorRegistry": "654321"}]
+
+    def test_csv_export_with_fields(self, snapshot):
+        content = "".join(
+            encode_csv([snapshot.operators], ("operatorRegistry", "state"))
+        )
+
+        assert content == "operatorRegistry,state\n123456,SP\n654321,RJ\n"
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.model.operator import Operator
+from src.domain.repository.operator_repository import (OperatorRepository,
+                                                       search_parameters)
+from src.infra.database import statement_cache
+from src.infra.database.statement_cache import StatementCache
+from src.presentation.model.operator_request_params import \
+    OperatorRequestParams
+
+
+def render(statement, values=None):
+    """SQL e valores dos parâmetros, como enviados ao driver"""
+    compiled = statement.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.construct_params(values)
+
+
+def cursor_after(sort, sort_value, operator_id):
+    """Cursor da linha com o mesmo valor em todos os campos de ordenação"""
+    params = OperatorRequestParams(**sort, cursor="*")
+    row = SimpleNamespace(id=operator_id, **{
+        Operator.__mapper__.get_property_by_column(column).key: sort_value
+        for column, _ in OperatorRepository.sort_columns(params.sort_keys)
+    })
+    return OperatorRepository.build_next_cursor(row, params)
+
+
+# Pares de requisições com a mesma forma e valores diferentes
+SAME_SHAPE = [
+    ({"search": "unimed"}, {"search": "amil saúde"}),
+    ({"search": "10%_a"}, {"search": "bradesco"}),
+    ({"search": "12.345.678/0001-90"}, {"search": "98.765.432/0001-10"}),
+    ({"search": "12.345.678"}, {"search": "98.765.432"}),
+    ({"search": "sp"}, {"search": "RJ"}),
+    ({"search": "unimed camp", "search_mode": "fulltext"}, {"search": "amil", "search_mode": "fulltext"}),
+    ({"state": "SP", "city": "Campinas"}, {"state": "RJ", "city": "Niterói"}),
+    ({"modality": "autogestao", "sales_region": 1}, {"modality": "filantropia", "sales_region": 4}),
+    ({"registration_date_from": "2001-01-01"}, {"registration_date_from": "2015-06-30"}),
+    ({"page": 1, "page_size": 10}, {"page": 7, "page_size": 50}),
+    ({"count_mode": "estimate", "page": 2}, {"count_mode": "estimate", "page": 9}),
+    ({"fields": "cnpj,city", "sort_field": "city"}, {"fields": "cnpj,city", "sort_field": "city", "page": 3}),
+    ({"facets": "modality,state", "search": "unimed"}, {"facets": "modality,state", "search": "amil"}),
+]
+
+
+class TestStatementCache:
+    """Testes do cache de instruções por forma de consulta"""
+
+    def test_counts_hits_and_misses(self):
+        cache = StatementCache(4)
+        build = MagicMock(side_effect=lambda: object())
+
+        first = cache.get("a", build)
+
+        assert cache.get("a", build) is first
+        assert build.call_count == 1
+        assert cache.stats() == {"size": 1, "maxSize": 4, "hits": 1, "misses": 1, "hitRatio": 0.5}
+
+    def test_evicts_least_recently_used(self):
+        cache = StatementCache(2)
+        cache.get("a", object)
+        cache.get("b", object)
+        cache.get("a", object)
+        cache.get("c", object)
+
+        hits = cache.stats()["hits"]
+        cache.get("a", object)
+        assert cache.stats()["hits"] == hits + 1
+        cache.get("b", object)
+        assert cache.stats()["misses"] == 4
+
+    def test_zero_size_disables_cache(self):
+        cache = StatementCache(0)
+        build = MagicMock(side_effect=lambda: object())
+
+        cache.get("a", build)
+        cache.get("a", build)
+
+        assert build.call_count == 2
+        assert cache.stats()["size"] == 0
+
+
+class TestPageStatementReuse:
+    """A instrução em cache, executada com os valores da requisição, é a mesma construída do zero"""
+
+    @pytest.mark.parametrize("first, second", SAME_SHAPE)
+    def test_cached_statement_matches_fresh_build(self, first, second):
+        repository = OperatorRepository(MagicMock())
+        repository.page_query(OperatorRequestParams(**first))
+
+        params = OperatorRequestParams(**second)
+        statements, values = repository.page_query(params)
+        fresh = repository.page_statements(params)
+
+        assert statement_cache.stats()["hits"] == 1
+        for cached, built in zip(statements, fresh):
+            if built is not None:
+                assert render(cached, values) == render(built)
+
+    @pytest.mark.parametrize("sort", [{"sort_field": "tradeName"}, {"sort": "state,-registrationDate"}])
+    def test_cursor_pages_share_statement(self, sort):
+        repository = OperatorRepository(MagicMock())
+        first = {**sort, "cursor": cursor_after(sort, "2001-01-01", 10)}
+        repository.page_query(OperatorRequestParams(**first))
+
+        second = {**sort, "cursor": cursor_after(sort, "2019-12-31", 99)}
+        params = OperatorRequestParams(**second)
+        statements, values = repository.page_query(params)
+
+        assert statement_cache.stats()["hits"] == 1
+        assert render(statements.page, values) == render(repository.page_statements(params).page)
+
+    def test_null_cursor_value_is_another_shape(self):
+        repository = OperatorRepository(MagicMock())
+        repository.page_query(OperatorRequestParams(
+            sort_field="tradeName", cursor=cursor_after({"sort_field": "tradeName"}, "A", 1)
+        ))
+        repository.page_query(OperatorRequestParams(
+            sort_field="tradeName", cursor=cursor_after({"sort_field": "tradeName"}, None, 2)
+        ))
+
+        assert statement_cache.stats()["misses"] == 2
+
+    def test_fuzzy_ids_expand_per_request(self):
+        matches = {"unimed": [1, 2, 3], "amil": [7]}
+        repository = OperatorRepository(MagicMock(), fuzzy_matcher=lambda term: matches[term])
+        repository.page_query(OperatorRequestParams(search="unimed", search_mode="fuzzy"))
+
+        params = OperatorRequestParams(search="amil", search_mode="fuzzy")
+        statements, values = repository.page_query(params)
+
+        assert values["fuzzy_ids"] == [7]
+        assert search_parameters("amil", "fuzzy", repository.fuzzy_matcher) == ("fuzzy", {"fuzzy_ids": [7]})
+        assert statement_cache.stats()["hits"] == 1
+
+    def test_lookups_are_cached(self):
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value.first.return_value = None
+        repository = OperatorRepository(session)
+
+        repository.find_by_registry("123456")
+        repository.find_by_registry("654321")
+        repository.find_by_identifiers(["12345678000190"], ["123456"])
+        repository.find_by_identifiers(["98765432000110"], ["654321"])
+
+        assert statement_cache.stats()["hits"] == 2
+        assert session.execute.call_args[0][1] == {
+            "cnpjs": ["98765432000110"], "registries": ["654321"]
+        }
+
+    def test_health_reports_cache_stats(self, client):
+        stats = client.get("/api/v1/health").json()["statementCache"]
+
+        assert {"size", "maxSize", "hits", "misses", "hitRatio"} <= set(stats)
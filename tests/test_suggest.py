@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.service.suggestion_service import SuggestionService
+from src.infra.database import get_db
+from src.infra.search.operator_snapshot import (OperatorSnapshot,
+                                                OperatorSnapshotStore)
+from src.infra.search.suggestion_index import SuggestionIndex
+from src.presentation.api.routes import get_suggestion_service
+
+OPERATORS = [
+    ("335690", "UNIMED CAMPINAS COOPERATIVA DE TRABALHO MÉDICO", "UNIMED CAMPINAS"),
+    ("326305", "AMIL ASSISTÊNCIA MÉDICA INTERNACIONAL S.A.", "AMIL"),
+    ("005711", "BRADESCO SAÚDE S.A.", None),
+    ("339679", "UNIMED NACIONAL", "UNIMED NACIONAL"),
+    ("417505", "ÁGUA SAÚDE LTDA", "ÁGUA SAÚDE"),
+]
+
+
+@pytest.fixture
+def operators(snapshot_rows):
+    return snapshot_rows(
+        *(
+            {"operator_registry": registry, "corporate_name": corporate_name, "trade_name": trade_name}
+            for registry, corporate_name, trade_name in OPERATORS
+        )
+    )
+
+
+@pytest.fixture
+def snapshot(operators):
+    return OperatorSnapshot(operators)
+
+
+@pytest.fixture
+def suggest_client(client, snapshot):
+    """Cliente com o serviço de sugestões sobre um snapshot fixo e sem banco"""
+
+    def no_database():
+        raise AssertionError("O autocompletar não deve abrir sessão com o banco")
+
+    store = SimpleNamespace(snapshot=snapshot)
+    client.app.dependency_overrides[get_suggestion_service] = lambda: SuggestionService(store)
+    client.app.dependency_overrides[get_db] = no_database
+    yield client
+    client.app.dependency_overrides.pop(get_suggestion_service, None)
+    client.app.dependency_overrides.pop(get_db, None)
+
+
+class TestSuggestionIndex:
+    """Testes para o índice ordenado de autocompletar"""
+
+    def test_prefix_is_case_and_accent_insensitive(self, snapshot):
+        index = SuggestionIndex(snapshot.operators)
+
+        # Razão social e nome fantasia da mesma operadora geram uma única sugestão
+        assert index.suggest("agua s", 10) == [("ÁGUA SAÚDE", "417505")]
+
+    def test_returns_names_in_alphabetical_order(self, snapshot):
+        index = SuggestionIndex(snapshot.operators)
+
+        assert index.suggest("unimed", 10) == [
+            ("UNIMED CAMPINAS", "335690"),
+            ("UNIMED NACIONAL", "339679"),
+        ]
+
+    def test_completes_registry_numbers(self, snapshot):
+        index = SuggestionIndex(snapshot.operators)
+
+        assert index.suggest("3263", 10) == [("AMIL", "326305")]
+
+    def test_respects_limit(self, snapshot):
+        index = SuggestionIndex(snapshot.operators)
+
+        assert len(index.suggest("unimed", 1)) == 1
+
+    def test_unknown_prefix(self, snapshot):
+        index = SuggestionIndex(snapshot.operators)
+
+        assert index.suggest("zzz", 10) == []
+
+
+class TestSuggestEndpoint:
+    """Testes para o endpoint /api/v1/operators/suggest"""
+
+    def test_returns_small_payload_with_cache_headers(self, suggest_client, snapshot):
+        response = suggest_client.get("/api/v1/operators/suggest?search=unim&limit=5")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "suggestions": [
+                {"name": "UNIMED CAMPINAS", "operatorRegistry": "335690"},
+                {"name": "UNIMED NACIONAL", "operatorRegistry": "339679"},
+            ]
+        }
+        assert "max-age" in response.headers["Cache-Control"]
+        assert response.headers["ETag"] == f'"{snapshot.version[:20]}"'
+
+    def test_matching_etag_returns_not_modified(self, suggest_client):
+        first = suggest_client.get("/api/v1/operators/suggest?search=amil")
+        second = suggest_client.get(
+            "/api/v1/operators/suggest?search=amil",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_requires_two_characters(self, suggest_client):
+        response = suggest_client.get("/api/v1/operators/suggest?search=a")
+
+        assert response.status_code == 422
+
+    def test_without_snapshot_is_not_cached(self, client):
+        store = OperatorSnapshotStore(MagicMock(side_effect=AssertionError("sem banco")), 60)
+        client.app.dependency_overrides[get_suggestion_service] = lambda: SuggestionService(store)
+        try:
+            response = client.get("/api/v1/operators/suggest?search=amil")
+        finally:
+            client.app.dependency_overrides.pop(get_suggestion_service, None)
+
+        assert response.status_code == 200
+        assert response.json() == {"suggestions": []}
+        assert response.headers["Cache-Control"] == "no-store"
+        # A requisição não carrega o snapshot: isso fica com a inicialização
+        assert store.snapshot is None
+
+    def test_store_retries_sooner_without_snapshot(self, operators):
+        store = OperatorSnapshotStore(MagicMock(), refresh_interval=600)
+        assert store._refresh_delay() == 30
+
+        store.load(operators)
+        assert store._refresh_delay() == 600